@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import miniPythonAST as ast
+from miniPythonCompiler import Compiler, translate
+from miniPythonParallel import ParallelCompiler
+from miniPythonTypeChecker import TypeChecker
+
+# A function that exercises loops, branches and list comprehensions, and a
+# call to it
+FUNCTION = """
+def f{index}(a, b):
+    x = 0
+    for i in range(10):
+        x = x + i * 2
+        if x > 5:
+            print(x)
+        #
+    #
+    lst = [j * 2 for j in range(5)]
+    lst.append(x)
+    return x
+#
+"""
+CALL = "print(f{index}(1, 2))\n"
+
+def build_program(functions):
+    """
+    A program defining and calling the given number of functions
+    """
+    return ("".join(FUNCTION.format(index=index) for index in range(functions)) +
+            "".join(CALL.format(index=index) for index in range(functions)))
+
+def time_phases(program):
+    """
+    Time parsing, typechecking and translating the functions one after the
+    other. --jobs only spreads the translation over processes.
+    """
+    compiler = Compiler()
+    start = time.perf_counter()
+    root = compiler.parser.parse(program)
+    parsed = time.perf_counter()
+    TypeChecker().typecheck(root, None)
+    typechecked = time.perf_counter()
+    for codeline in root.code_lines:
+        if isinstance(codeline.code_line, ast.FunctionDef):
+            translate([codeline], True, 1)
+    translated = time.perf_counter()
+    return parsed - start, typechecked - parsed, translated - typechecked
+
+def time_compile(compiler, program, repeat):
+    """
+    The best time of compiling the program to Java, in seconds
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = compiler.compile(program, "Program", ir=False)
+        elapsed = time.perf_counter() - start
+        if not result.ok:
+            sys.exit("\n".join(result.diagnostics))
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description='Measure how much compiling with --jobs saves, and how the time is split between the phases')
+    argparser.add_argument('-n', '--functions', type=int, default=2000, help="Number of functions in the program")
+    argparser.add_argument('-j', '--jobs', type=int, default=os.cpu_count(), help="Number of processes to compare against one")
+    argparser.add_argument('-r', '--repeat', type=int, default=3, help="Number of timed runs, the best one is reported")
+    args = argparser.parse_args()
+
+    program = build_program(args.functions)
+    parse, typecheck, translation = time_phases(program)
+    print("Parsing: {:.3f}s, typechecking: {:.3f}s, translating the functions: {:.3f}s".format(parse, typecheck, translation))
+    serial = time_compile(Compiler(), program, args.repeat)
+    parallel = time_compile(ParallelCompiler(jobs=args.jobs), program, args.repeat)
+    print("One process: {:.3f}s, {} processes: {:.3f}s ({:.2f}x)".format(serial, args.jobs, parallel, serial / parallel))
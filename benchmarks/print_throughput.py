@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from miniPythonCompiler import Compiler
+from miniPythonTargetGen import write_runtime
+
+# A program that prints the given number of lines
+PROGRAM = """
+i = 0
+while i < {lines}:
+    print(i)
+    i = i + 1
+#
+"""
+
+def build(directory, class_name, lines, buffered_output):
+    """
+    Compile the program to Java and then to class files in directory
+    """
+    result = Compiler(buffered_output=buffered_output).compile(PROGRAM.format(lines=lines), class_name, ir=False)
+    write_runtime(directory)
+    file = open(os.path.join(directory, class_name + ".java"), "w")
+    file.write(result.java)
+    file.close()
+    subprocess.run(["javac", "-nowarn", "-d", directory,
+                    os.path.join(directory, class_name + ".java"),
+                    os.path.join(directory, "MiniPythonRuntime.java")],
+                   check=True, stderr=subprocess.DEVNULL)
+
+def run(directory, class_name):
+    """
+    Run a compiled program with its output thrown away. Returns the time it
+    took in seconds.
+    """
+    sink = open(os.devnull, "w")
+    start = time.perf_counter()
+    subprocess.run(["java", "-cp", directory, class_name], check=True, stdout=sink)
+    elapsed = time.perf_counter() - start
+    sink.close()
+    return elapsed
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description='Measure how many lines per second generated programs print, with and without buffered output')
+    argparser.add_argument('-n', '--lines', type=int, default=2000000, help="Number of lines the program prints")
+    argparser.add_argument('-r', '--repeat', type=int, default=3, help="Number of timed runs, the best one is reported")
+    args = argparser.parse_args()
+
+    if shutil.which("javac") is None or shutil.which("java") is None:
+        sys.exit("javac and java have to be on the PATH")
+
+    directory = tempfile.mkdtemp()
+    try:
+        for class_name, buffered_output in (("Unbuffered", False), ("Buffered", True)):
+            build(directory, class_name, args.lines, buffered_output)
+            best = min(run(directory, class_name) for _ in range(args.repeat))
+            print("{}: {} lines in {:.3f}s: {:.0f} lines/s".format(class_name, args.lines, best, args.lines / best))
+    finally:
+        shutil.rmtree(directory)
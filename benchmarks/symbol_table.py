@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import miniPythonTypeChecker
+from miniPythonParser import MiniPythonParser
+from miniPythonSymbolTable import SymbolTable, ParseError
+from miniPythonTypeChecker import TypeChecker
+
+class ScopeStackSymbolTable(SymbolTable):
+    """
+    The previous symbol table, which keeps one dictionary per scope and
+    searches them from the innermost out
+    """
+    def __init__(self):
+        self.functions = dict()
+        self.scope_stack = [dict()]
+
+    def get_scope(self):
+        return len(self.scope_stack)
+
+    def push_scope(self):
+        self.scope_stack.append(dict())
+
+    def pop_scope(self):
+        assert len(self.scope_stack) > 1
+        self.scope_stack.pop()
+
+    def declare_variable(self, name, var_type, line_number):
+        if name in self.scope_stack[-1]:
+            raise ParseError("Redeclaring variable named \"" + name + "\"", line_number)
+        self.scope_stack[-1][name] = var_type
+
+    def lookup_variable(self, name, line_number):
+        for scope in reversed(self.scope_stack):
+            if name in scope:
+                return scope[name]
+        raise ParseError("Referencing undefined variable \"" + name + "\"", line_number)
+
+    def check_variable(self, name):
+        for scope in reversed(self.scope_stack):
+            if name in scope:
+                return True
+        return False
+
+def nested_source(depth, statements):
+    """
+    Generate ifs nested depth levels deep, where every level declares a
+    variable and then uses the global one and its own
+    """
+    lines = ["x0 = 0"]
+    for level in range(1, depth + 1):
+        indent = "    " * (level - 1)
+        lines.append("{}if x{} < {}:".format(indent, level - 1, level))
+        lines.append("{}    x{} = x{} + 1".format(indent, level, level - 1))
+        for _ in range(statements):
+            lines.append("{}    x{} = x0 + x{}".format(indent, level, level))
+    for level in range(depth, 0, -1):
+        lines.append("    " * (level - 1) + "#")
+    return "\n".join(lines) + "\n"
+
+def time_typecheck(root, table_class, repeat):
+    """
+    Best time to typecheck root with the given symbol table
+    """
+    miniPythonTypeChecker.SymbolTable = table_class
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        TypeChecker().typecheck(root, None)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    miniPythonTypeChecker.SymbolTable = SymbolTable
+    return best
+
+def time_lookups(table_class, depth, lookups):
+    """
+    Time looking up a global variable from depth scopes down
+    """
+    st = table_class()
+    st.declare_variable("x0", int, 1)
+    for level in range(1, depth + 1):
+        st.push_scope()
+        st.declare_variable("x{}".format(level), int, level)
+    start = time.perf_counter()
+    for _ in range(lookups):
+        st.check_variable("x0")
+        st.lookup_variable("x0", depth)
+    return time.perf_counter() - start
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description='Compare typechecking time with the scope stack and binding map symbol tables on deeply nested code')
+    argparser.add_argument('-d', '--depth', type=int, default=200, help="How deeply the generated blocks are nested, at most about 300 before the typechecker runs out of stack")
+    argparser.add_argument('-s', '--statements', type=int, default=20, help="Statements per nesting level")
+    argparser.add_argument('-r', '--repeat', type=int, default=5, help="Number of timed runs, the best one is reported")
+    args = argparser.parse_args()
+
+    parser = MiniPythonParser()
+    parser.print_errors = False
+    parser.build(write_tables=False)
+    root = parser.parse(nested_source(args.depth, args.statements))
+
+    old = time_typecheck(root, ScopeStackSymbolTable, args.repeat)
+    new = time_typecheck(root, SymbolTable, args.repeat)
+    print("typecheck at depth {}: scope stack {:.3f}s, binding map {:.3f}s ({:.1f}x)".format(args.depth, old, new, old / new))
+
+    old = time_lookups(ScopeStackSymbolTable, args.depth, 100000)
+    new = time_lookups(SymbolTable, args.depth, 100000)
+    print("100000 lookups at depth {}: scope stack {:.3f}s, binding map {:.3f}s ({:.1f}x)".format(args.depth, old, new, old / new))
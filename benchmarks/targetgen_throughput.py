@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from miniPythonParser import MiniPythonParser
+from miniPythonIRGen import IRGen
+from miniPythonTargetGen import TargetGen
+
+# A block that exercises the common opcodes, in particular the calls and
+# sequence operations
+BLOCK = """
+def f(a, b):
+    return a
+#
+x = [1, 2, 3]
+y = x[1]
+z = f(y, 2)
+x.append(z)
+w = x[0:2]
+print(w)
+if y > 1:
+    y = y + 1
+#
+else:
+    y = len(x)
+#
+"""
+
+def build_ir(instructions, compact):
+    """
+    Generate IR by repeating BLOCK until it has at least the given number
+    of instructions
+    """
+    parser = MiniPythonParser()
+    parser.build()
+    root = parser.parse(BLOCK)
+
+    ir_generator = IRGen(compact)
+    while len(ir_generator.TAC_lst) < instructions:
+        ir_generator.generate(root)
+    return ir_generator
+
+if __name__ == "__main__":
+    argparser = argparse.ArgumentParser(description='Measure how many TAC instructions TargetGen translates per second')
+    argparser.add_argument('-n', '--instructions', type=int, default=200000, help="Minimum number of TAC instructions to translate")
+    argparser.add_argument('-r', '--repeat', type=int, default=3, help="Number of timed runs, the best one is reported")
+    argparser.add_argument('-c', '--compact-ir', action='store_true', help="Store the IR in compact array-backed form")
+    args = argparser.parse_args()
+
+    ir_generator = build_ir(args.instructions, args.compact_ir)
+    count = len(ir_generator.TAC_lst)
+
+    # The analyses TargetGen makes when it is created are timed along with
+    # emitting, and also reported on their own
+    best = None
+    for _ in range(args.repeat):
+        sink = open(os.devnull, "w")
+        start = time.perf_counter()
+        target_generator = TargetGen(ir_generator)
+        initialized = time.perf_counter()
+        target_generator.emit(sink, "Benchmark")
+        elapsed = time.perf_counter() - start
+        sink.close()
+        if best is None or elapsed < best[0]:
+            best = (elapsed, initialized - start)
+
+    elapsed, init = best
+    print("{} instructions in {:.3f}s (init {:.3f}s, emit {:.3f}s): {:.0f} instructions/s".format(
+        count, elapsed, init, elapsed - init, count / elapsed))
@@ -0,0 +1,93 @@
+total = 0
+for i in range(10):
+    total = total + i
+#
+print(total)
+
+for i in range(2, 20, 3):
+    print(i)
+#
+
+for i in range(10, 0, -2):
+    print(i)
+#
+
+n = 5
+step = 2
+for i in range(0, n * 2, step):
+    print(i)
+#
+
+squares = []
+for i in range(1, 6):
+    squares.append(i * i)
+#
+squares += [36, 49]
+print(squares)
+
+for square in squares:
+    print(square)
+#
+
+names = ["Hee", "Ho", "!"]
+greeting = ""
+for name in names:
+    greeting += name
+#
+print(greeting)
+
+for pair in ((1, 2), (3, 4)):
+    print(pair)
+#
+
+evens = [0]
+for even in evens:
+    print(even)
+    if len(evens) < 5:
+        evens.append(len(evens) * 2)
+    #
+#
+print(evens)
+
+def count(lst):
+    found = 0
+    for item in lst:
+        found += 1
+    #
+    return found
+#
+print(count(names))
+
+def grow(lst):
+    lst += [0]
+    return lst
+#
+grow(evens)
+print(evens)
+
+for i in range(100):
+    if i * i > 50:
+        print(i)
+        break
+    #
+#
+
+cubes = [i * i * i for i in range(1, 6)]
+print(cubes)
+print([n for n in cubes if n % 2 == 1])
+print(len([name for name in names if name != "b"]))
+print([(i, i) for i in cubes][2])
+
+def first(lst):
+    return lst[0]
+#
+print(first([i * 2 for i in range(1, 4)]))
+print([[0], [1]].index([i for i in range(1)]))
+
+labels = [i for i in range(3)]
+labels.append("x")
+print(labels)
+counts = [1, 2]
+halves = [i + 1 for i in counts]
+halves.append(0.5)
+print(halves)
@@ -39,3 +39,18 @@ def func_calls_func():
     #
     return False
 #
+
+
+def halve():
+    y = 7
+    return y / 2
+#
+
+def cube():
+    y = 2
+    return y ** 3
+#
+
+print(7 / 2)
+print(halve())
+print(cube())
@@ -50,4 +50,26 @@ p = ["Woah", 2].index(2)
 q = ["Pop"].pop()
 q = ["Pop"].pop(0)
 
-s = ["I CAN DO ANYTHING", "CHAOS CHAOS"].copy()
\ No newline at end of file
+s = ["I CAN DO ANYTHING", "CHAOS CHAOS"].copy()
+
+ints = [5, 6]
+alias = ints
+alias.append("y")
+print(ints)
+
+def add_word(words):
+    words.append("s")
+    return words
+#
+passed = [1, 2]
+add_word(passed)
+print(passed)
+
+def seven():
+    return 7
+#
+computed = [seven(), 2, seven() * 2]
+called = [seven(), 2]
+called.append(seven())
+print(computed)
+print(called)
@@ -23,4 +23,10 @@ s = (1, 2, 3, 4, 5)[ : : 2]
 u = (2) + (4)
 w = ("Woah", 2).index(2)
 print(("I CAN DO ANYTHING", "CHAOS CHAOS").copy())
-print(u)
\ No newline at end of file
+print(u)
+
+pair = (1, 2)
+kept = pair
+pair += (3,)
+print(pair)
+print(kept)
@@ -72,3 +72,17 @@ if x + y == z - y:
 #
 
 
+n = 0
+found = 0
+while True:
+    n = n + 1
+    if n % 2 == 0:
+        continue
+    #
+    if n > 7:
+        found = n
+        break
+    #
+    print(n)
+#
+print(found)
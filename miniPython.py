@@ -1,14 +1,116 @@
 #!/usr/bin/env python3
 
 import argparse
+import os
+import time
 from miniPythonParser import MiniPythonParser
 from miniPythonSymbolTable import SymbolTable
 from miniPythonTypeChecker import TypeChecker
 from miniPythonIRGen import IRGen
-from miniPythonTargetGen import TargetGen
+from miniPythonTargetGen import TargetGen, write_runtime
+from miniPythonIncremental import IncrementalCompiler
+from miniPythonParallel import ParallelCompiler
 
 import miniPythonAST as ast
 
+# How often to look for changed files in watch mode, and how long files must
+# stay unchanged before a batch of saves is compiled (seconds)
+POLL_INTERVAL = 0.1
+DEBOUNCE = 0.3
+
+def scan_sources(directory):
+    """
+    Map every .py file in directory to its modification time
+    """
+    mtimes = {}
+    for entry in os.scandir(directory):
+        try:
+            if entry.is_file() and entry.name.endswith(".py"):
+                mtimes[entry.path] = entry.stat().st_mtime_ns
+        except FileNotFoundError:
+            # Deleted since the directory was read
+            pass
+    return mtimes
+
+def compile_file(parser, compilers, path, compact_ir, buffered_output):
+    """
+    Recompile one file with its own incremental compiler and write the Java
+    and IR into output/. Errors are reported rather than raised, so that
+    watching goes on.
+    """
+    start = time.perf_counter()
+    try:
+        f = open(path, 'r')
+        data = f.read()
+        f.close()
+
+        name = os.path.basename(os.path.splitext(os.path.normpath(path))[0])
+        if path not in compilers:
+            compilers[path] = IncrementalCompiler(parser, buffered_output)
+
+        result = compilers[path].compile(data, name.capitalize(), ir_file="output/{}_ir.out".format(name), compact_ir=compact_ir)
+        if result.ok:
+            write_runtime("output")
+            file = open("output/{}.java".format(name.capitalize()), "w")
+            file.write(result.java)
+            file.close()
+    except Exception as e:
+        # Such as the file having been deleted since it was found, not being
+        # text or an error in the compiler itself. What the file's compiler
+        # kept from before can't be trusted after that.
+        compilers.pop(path, None)
+        print("* Failed to compile {}: {}: {}".format(path, type(e).__name__, e))
+        return
+    elapsed = (time.perf_counter() - start) * 1000
+
+    if result.ok:
+        print("* Compiled {} in {:.1f} ms".format(path, elapsed))
+    else:
+        print("* Failed to compile {} in {:.1f} ms".format(path, elapsed))
+        for diagnostic in result.diagnostics:
+            print("    " + diagnostic)
+
+def watch(directory, compact_ir, buffered_output):
+    """
+    Compile every .py file in directory, then keep recompiling the ones that
+    change. Saves that follow each other quickly are compiled as one batch.
+    """
+    os.makedirs("output", exist_ok=True)
+    parser = MiniPythonParser()
+    parser.print_errors = False
+    parser.build()
+    compilers = {}
+    mtimes = scan_sources(directory)
+    for path in sorted(mtimes):
+        compile_file(parser, compilers, path, compact_ir, buffered_output)
+    print("* Watching {} for changes...".format(directory))
+
+    while True:
+        time.sleep(POLL_INTERVAL)
+        current = scan_sources(directory)
+        changed = set(path for path in current if current[path] != mtimes.get(path))
+        if not changed:
+            mtimes = current
+            continue
+
+        # Wait until the files have settled
+        last_change = time.monotonic()
+        while time.monotonic() - last_change < DEBOUNCE:
+            time.sleep(POLL_INTERVAL)
+            latest = scan_sources(directory)
+            if latest != current:
+                changed |= set(path for path in latest if latest[path] != current.get(path))
+                current = latest
+                last_change = time.monotonic()
+        mtimes = current
+
+        for path in sorted(changed):
+            if path in mtimes:
+                compile_file(parser, compilers, path, compact_ir, buffered_output)
+        for path in set(compilers) - set(mtimes):
+            # Deleted files
+            del compilers[path]
+
 if __name__ == "__main__":
 
     # Python module "argparse" allows you to easily add commandline flags
@@ -18,12 +120,25 @@ if __name__ == "__main__":
     # Of course, this is entirely optional and not necessary, as long as
     # the compiler functions correctly.
     argparser = argparse.ArgumentParser(description='Take in the miniPython source code and compile it')
-    argparser.add_argument('FILE', help="Input file")
+    argparser.add_argument('FILE', nargs='?', help="Input file")
     argparser.add_argument('-p', '--parse-only', action='store_true', help="Stop after scanning and parsing the input")
     argparser.add_argument('-t', '--typecheck-only', action='store_true', help="Stop after typechecking")
     argparser.add_argument('-v', '--verbose', action='store_true', help="Provides additional output")
+    argparser.add_argument('-c', '--compact-ir', action='store_true', help="Store the IR in compact array-backed form")
+    argparser.add_argument('-j', '--jobs', type=int, default=1, help="Translate the functions with this many processes")
+    argparser.add_argument('-b', '--buffered-output', action='store_true', help="Make the generated program buffer what it prints")
+    argparser.add_argument('-w', '--watch', metavar='DIR', help="Recompile the .py files in DIR into output/ whenever they change")
     args = argparser.parse_args()
 
+    if args.watch is not None:
+        try:
+            watch(args.watch, args.compact_ir, args.buffered_output)
+        except KeyboardInterrupt:
+            pass
+        quit()
+    elif args.FILE is None:
+        argparser.error("the following arguments are required: FILE")
+
     # Prints additional output if the flag is set
     if args.verbose:
         print("* Reading file " + args.FILE + "...")
@@ -38,8 +153,29 @@ if __name__ == "__main__":
     # Build and runs the parser to get AST
     parser = MiniPythonParser()
     parser.build()
+
+    # Typechecking only has nothing to translate in parallel, and writes no
+    # output
+    if args.jobs > 1 and not args.parse_only and not args.typecheck_only:
+        parser.print_errors = False
+        name = os.path.basename(os.path.splitext(os.path.normpath(args.FILE))[0])
+        os.makedirs("output", exist_ok=True)
+        result = ParallelCompiler(parser, args.jobs, args.buffered_output).compile(data, name.capitalize(), ir=False, ir_file="output/{}_ir.out".format(name), compact_ir=args.compact_ir)
+        for diagnostic in result.diagnostics:
+            print(diagnostic)
+        if not result.ok:
+            quit(1)
+        write_runtime("output")
+        file = open("output/{}.java".format(name.capitalize()), "w")
+        file.write(result.java)
+        file.close()
+        quit()
     root = parser.parse(data)
 
+    # The parser has already printed its syntax errors
+    if parser.errors:
+        quit(1)
+
     # If user asks to quit after parsing, do so.
     if args.parse_only:
         quit()
@@ -49,13 +185,21 @@ if __name__ == "__main__":
 
     typechecker = TypeChecker()
     typechecker.typecheck(root, None)
+    if typechecker.errors:
+        for error in typechecker.errors:
+            print(error)
+        quit(1)
+
+    # If user asks to quit after typechecking, do so.
+    if args.typecheck_only:
+        quit()
 
     if args.verbose:
         print("* Generating IR...")
 
-    ir_generator = IRGen()
+    ir_generator = IRGen(args.compact_ir)
     ir_generator.generate(root)
     ir_generator.output_ir(str(args.FILE))
     
     target_generator = TargetGen(ir_generator)
-    target_generator.generate_target(str(args.FILE))
\ No newline at end of file
+    target_generator.generate_target(str(args.FILE), args.buffered_output)
\ No newline at end of file
@@ -64,6 +64,9 @@ class NodeVisitor(object):
                     self.visit(line, offset=offset + 2)
             else:
                 self.visit(child, offset=offset + 2)
+
+    visit_ForStatement = visit_WhileStatement
+    visit_ForRangeStatement = visit_WhileStatement
     
     def visit_IfStatement(self, node, offset=0):
         lead = ' ' * offset
@@ -140,6 +143,8 @@ class FunctionDef(Node):
         self.params = params
         self.body = body
         self.coord = coord
+        # Inferred by the typechecker
+        self.return_type = "Any"
 
     def children(self):
         nodelist = []
@@ -168,6 +173,8 @@ class AssignmentStatement(Node):
         self.name = name
         self.expr = expr
         self.coord = coord
+        # Whether it gives a float to an int variable, set by the typechecker
+        self.widens = False
 
     def children(self):
         nodelist = []
@@ -177,6 +184,21 @@ class AssignmentStatement(Node):
 
     attr_names = ('name', )
 
+class AugmentedAssignmentStatement(Node):
+    def __init__(self, name, op, expr, coord=None):
+        self.name = name
+        self.op = op
+        self.expr = expr
+        self.coord = coord
+
+    def children(self):
+        nodelist = []
+        if self.expr is not None:
+            nodelist.append(('expr', self.expr))
+        return tuple(nodelist)
+
+    attr_names = ('name', 'op', )
+
 class IfStatement(Node):
     def __init__(self, cond, if_body, elif_bodies=None, else_body=None, coord=None):
         self.cond = cond
@@ -236,6 +258,83 @@ class WhileStatement(Node):
     attr_names = ()
 ''' End citation '''
 
+class ForStatement(Node):
+    def __init__(self, name, seq, body, coord=None):
+        self.name = name
+        self.seq = seq
+        self.body = body
+        self.coord = coord
+
+    def children(self):
+        nodelist = []
+        if self.seq is not None:
+            nodelist.append(('seq', self.seq))
+        if self.body is not None:
+            nodelist.append(('body', self.body))
+        return tuple(nodelist)
+
+    attr_names = ('name', )
+
+class ForRangeStatement(Node):
+    def __init__(self, name, start, stop, step, body, coord=None):
+        self.name = name
+        self.start = start
+        self.stop = stop
+        self.step = step
+        self.body = body
+        self.coord = coord
+
+    def children(self):
+        nodelist = []
+        if self.start is not None:
+            nodelist.append(('start', self.start))
+        if self.stop is not None:
+            nodelist.append(('stop', self.stop))
+        if self.step is not None:
+            nodelist.append(('step', self.step))
+        if self.body is not None:
+            nodelist.append(('body', self.body))
+        return tuple(nodelist)
+
+    attr_names = ('name', )
+
+class Range(Node):
+    def __init__(self, start, stop, step, coord=None):
+        self.start = start
+        self.stop = stop
+        self.step = step
+        self.coord = coord
+
+    def children(self):
+        nodelist = []
+        if self.start is not None:
+            nodelist.append(('start', self.start))
+        if self.stop is not None:
+            nodelist.append(('stop', self.stop))
+        if self.step is not None:
+            nodelist.append(('step', self.step))
+        return tuple(nodelist)
+
+    attr_names = ()
+
+class BreakStatement(Node):
+    def __init__(self, coord=None):
+        self.coord = coord
+
+    def children(self):
+        return ()
+
+    attr_names = ()
+
+class ContinueStatement(Node):
+    def __init__(self, coord=None):
+        self.coord = coord
+
+    def children(self):
+        return ()
+
+    attr_names = ()
+
 class ReturnStatement(Node):
     def __init__(self, expr=None, coord=None):
         self.expr = expr
@@ -307,6 +406,8 @@ class FunctionCall(Node):
         self.function_name = function_name
         self.exprs = exprs
         self.coord = coord
+        # The return type the typechecker gave the call
+        self.return_type = "Any"
 
     def children(self):
         nodelist = []
@@ -332,6 +433,26 @@ class Sequence(Node):
 class List(Sequence): pass
 class Tuple(Sequence): pass
 
+class ListComprehension(Node):
+    def __init__(self, expr, name, seq, cond, coord=None):
+        self.expr = expr
+        self.name = name
+        self.seq = seq
+        self.cond = cond
+        self.coord = coord
+
+    def children(self):
+        nodelist = []
+        if self.seq is not None:
+            nodelist.append(('seq', self.seq))
+        if self.cond is not None:
+            nodelist.append(('cond', self.cond))
+        if self.expr is not None:
+            nodelist.append(('expr', self.expr))
+        return tuple(nodelist)
+
+    attr_names = ('name', )
+
 class SequenceIndex(Node):
     def __init__(self, seq, index, coord=None):
         self.seq = seq
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import miniPythonAST as ast
+from threeAddressCode import BLOCK_OPCODES, OP_FDEF, OP_END_LABEL, OP_FCALL, opcode_column, operand_column
+
+class CallGraph(object):
+    """
+    Which functions each function calls. A call is made by the innermost
+    function definition it is in, and calls made by top level code are
+    recorded under MAIN.
+    """
+    MAIN = None
+
+    def __init__(self):
+        self.calls = dict()
+        self.called_by = dict()
+
+    def add_function(self, name):
+        self.calls.setdefault(name, set())
+        self.called_by.setdefault(name, set())
+
+    def add_call(self, caller, callee):
+        self.add_function(caller)
+        self.add_function(callee)
+        self.calls[caller].add(callee)
+        self.called_by[callee].add(caller)
+
+    def callees(self, name):
+        return self.calls.get(name, set())
+
+    def callers(self, name):
+        return self.called_by.get(name, set())
+
+    @classmethod
+    def from_ast(cls, node):
+        """
+        Build the call graph of an AST from its FunctionCall nodes
+        """
+        graph = cls()
+        graph.add_function(cls.MAIN)
+        graph.visit(node, cls.MAIN)
+        return graph
+
+    @classmethod
+    def from_tacs(cls, tacs):
+        """
+        Build the call graph of a list of TACs from its fcall TACs
+        """
+        graph = cls()
+        graph.add_function(cls.MAIN)
+        # The functions the TACs are in, innermost last, and the block depth
+        # each was defined at
+        callers = [cls.MAIN]
+        depths = []
+        depth = 0
+        for opcode, name in zip(opcode_column(tacs), operand_column(tacs, "left_operand")):
+            if opcode == OP_FCALL:
+                graph.add_call(callers[-1], name)
+            elif opcode == OP_FDEF:
+                graph.add_function(name)
+                callers.append(name)
+                depths.append(depth)
+            if opcode in BLOCK_OPCODES:
+                depth += 1
+            elif opcode == OP_END_LABEL:
+                depth -= 1
+                if depths and depths[-1] == depth:
+                    depths.pop()
+                    callers.pop()
+        return graph
+
+    def reachable(self, root=MAIN):
+        """
+        The functions that can be called, directly or not, from root
+        """
+        seen = set()
+        stack = [root]
+        while stack:
+            for callee in self.callees(stack.pop()):
+                if callee not in seen:
+                    seen.add(callee)
+                    stack.append(callee)
+        return seen
+
+    def visit(self, node, caller):
+        if isinstance(node, list):
+            for elem in node:
+                self.visit(elem, caller)
+            return
+        elif not isinstance(node, ast.Node):
+            return
+
+        if isinstance(node, ast.FunctionDef):
+            caller = node.name
+            self.add_function(caller)
+        elif isinstance(node, ast.FunctionCall):
+            self.add_call(caller, node.function_name)
+        for value in vars(node).values():
+            if isinstance(value, (list, ast.Node)):
+                self.visit(value, caller)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+
+import io
+from miniPythonParser import MiniPythonParser
+from miniPythonTypeChecker import TypeChecker
+from miniPythonIRGen import IRGen
+from miniPythonTargetGen import TargetGen, JavaWriter
+
+class CompileResult(object):
+    """
+    The outcome of compiling one miniPython source: the Java source and IR
+    text, or the diagnostics explaining why there are none. Every syntax
+    error is reported, or if there are none, every type error.
+    """
+    def __init__(self, java=None, ir=None, diagnostics=None):
+        self.java = java
+        self.ir = ir
+        self.diagnostics = diagnostics or []
+
+    @property
+    def ok(self):
+        return self.java is not None
+
+def translate(codelines, in_function, indents, compact_ir=False):
+    """
+    Generate the IR of typechecked code lines and translate it to Java on
+    its own, either as the methods for functions or as the body of main.
+    Returns the IR text, the Java source and the declarations of the static
+    final fields for the constants it uses.
+    """
+    ir_generator = IRGen(compact_ir)
+    for codeline in codelines:
+        ir_generator.generate(codeline)
+    ir_sink = io.StringIO()
+    ir_generator.write_ir(ir_sink)
+
+    java_sink = io.StringIO()
+    target_generator = TargetGen(ir_generator)
+    target_generator.out = JavaWriter(java_sink, indents)
+    target_generator.translate(in_function)
+
+    constants_sink = io.StringIO()
+    target_generator.out = JavaWriter(constants_sink, 1)
+    target_generator.write_constants()
+    return ir_sink.getvalue(), java_sink.getvalue(), constants_sink.getvalue()
+
+def write_class(class_name, function_javas, main_java, constant_javas=(), buffered_output=False):
+    """
+    Put a Java class together from separately translated functions and main
+    body, and the constants they use. Only the functions given are included,
+    so leaving out the ones that are never called, and their constants, is up
+    to the caller.
+    """
+    sink = io.StringIO()
+    target_generator = TargetGen(IRGen())
+    target_generator.out = JavaWriter(sink)
+    target_generator.write("import java.util.*")
+    target_generator.write("public class %s {" % class_name)
+    for java in function_javas:
+        sink.write(java)
+    target_generator.write_main_start(buffered_output)
+    sink.write(main_java)
+    target_generator.write("}")
+    for java in constant_javas:
+        sink.write(java)
+    target_generator.write("}")
+    return sink.getvalue()
+
+class Compiler(object):
+    """
+    Compiles miniPython source to Java entirely in memory. The parser is
+    built once and reused for every source, and can be shared between
+    compilers. With buffered_output, the generated programs buffer what they
+    print.
+    """
+    def __init__(self, parser=None, buffered_output=False):
+        if parser is None:
+            parser = MiniPythonParser()
+            parser.print_errors = False
+            # Don't regenerate parsetab.py on disk
+            parser.build(write_tables=False)
+        self.parser = parser
+        self.buffered_output = buffered_output
+
+    def compile(self, text, class_name, ir=True, ir_file=None, compact_ir=False):
+        """
+        Compile text into a Java class named class_name. The IR text is only
+        kept if ir is set, and is also written to ir_file if one is given.
+        """
+        root = self.parser.parse(text)
+        if self.parser.errors or root is None:
+            return CompileResult(diagnostics=[str(e) for e in self.parser.errors] or ["Nothing to compile"])
+
+        typechecker = TypeChecker()
+        typechecker.typecheck(root, None)
+        if typechecker.errors:
+            return CompileResult(diagnostics=[str(e) for e in typechecker.errors])
+
+        ir_generator = IRGen(compact_ir)
+        ir_generator.generate(root)
+
+        ir_text = None
+        if ir or ir_file is not None:
+            sink = io.StringIO()
+            ir_generator.write_ir(sink)
+            ir_text = sink.getvalue()
+            if ir_file is not None:
+                file = open(ir_file, "w")
+                file.write(ir_text)
+                file.close()
+
+        sink = io.StringIO()
+        target_generator = TargetGen(ir_generator)
+        target_generator.emit(sink, class_name, self.buffered_output)
+        return CompileResult(sink.getvalue(), ir_text if ir else None)
+
+_default_compiler = None
+
+def compile_source(text, class_name, ir=True, ir_file=None):
+    """
+    Compile miniPython source text with a shared, already built compiler
+    """
+    global _default_compiler
+    if _default_compiler is None:
+        _default_compiler = Compiler()
+    return _default_compiler.compile(text, class_name, ir, ir_file)
@@ -1,16 +1,30 @@
 #!/usr/bin/env python3
 
 import miniPythonAST as ast
+import math
 import os
-import re
-from threeAddressCode import TAC
+from threeAddressCode import TAC, CompactTAC, Reg, Var, StrLit
 
 class IRGen(object):
-    def __init__(self):
-        self.TAC_lst = []
+    def __init__(self, compact=False):
+        # A CompactTAC stores the instructions in parallel arrays, which
+        # uses much less memory for large programs
+        self.TAC_lst = CompactTAC() if compact else []
         self.register_count = 0
         self.label_count = 0
         self.else_labels_stack = []
+        # Inferred return types of the functions defined and of the registers
+        # holding call results, for TargetGen
+        self.return_types = {}
+        self.register_types = {}
+        # What the variables of the list comprehensions being generated are
+        # called in the IR, innermost last, by their names
+        self.renames = {}
+        # The int variables later given floats, as the top level function
+        # they are in (None for the main method) and their names, and the
+        # top level function being generated
+        self.float_variables = set()
+        self.function = None
 
     def generate(self, node):
         method = 'gen_' + node.__class__.__name__
@@ -19,23 +33,17 @@ class IRGen(object):
     # HELPERS
 
     def is_reg(self, value):
-        if type(value) is not str:
-            return False
-        pattern = re.compile(r"^_t(0|([1-9][0-9]*))$")
-        return pattern.match(value)
+        return type(value) is Reg
 
     def is_str_literal(self, value):
-        if type(value) is not str:
-            return False
-        pattern = re.compile(r'^"[^"]*"$')
-        return pattern.match(value)
+        return type(value) is StrLit
 
     def add_TAC(self, result, operator=None, left_operand=None, right_operand=None):
         tac = TAC(result, operator, left_operand, right_operand)
         self.TAC_lst.append(tac)
     
     def get_register(self):
-        return "_t%d" % self.inc_register()
+        return Reg("_t%d" % self.inc_register())
 
     def get_label(self):
         return "_L%d" % self.inc_label()
@@ -78,10 +86,16 @@ class IRGen(object):
         name = os.path.basename(os.path.splitext(os.path.normpath(file_name))[0])
         os.makedirs("output", exist_ok=True)
         file = open("output/{}_ir.out".format(name), "w")
-        for tac in self.TAC_lst:
-            file.write(str(tac) + "\n")
+        self.write_ir(file)
         file.close()
 
+    def write_ir(self, sink):
+        """
+        Write the generated IR code to a text sink, one TAC per line
+        """
+        for tac in self.TAC_lst:
+            sink.write(str(tac) + "\n")
+
     def gen_Program(self, node):
         for codeline in node.code_lines:
             self.generate(codeline)
@@ -92,10 +106,15 @@ class IRGen(object):
         if node_params is not None:
             params = node_params.copy()
 
+        self.return_types[node.name] = node.return_type
         self.add_TAC(None, "fdef", node.name, tuple(params))
 
+        outer = self.function
+        if outer is None:
+            self.function = node.name
         for codeline in node.body:
             self.generate(codeline)
+        self.function = outer
 
         self.add_TAC(None, "end-label")
 
@@ -104,8 +123,23 @@ class IRGen(object):
 
     def gen_AssignmentStatement(self, node):
         expr = self.generate(node.expr)
+        if node.widens:
+            self.float_variables.add((self.function, node.name))
         self.add_TAC(node.name, None, expr)
 
+    def gen_AugmentedAssignmentStatement(self, node):
+        if node.var_type == list and node.op == "+":
+            # Python extends the list in place
+            expr = self.generate(node.expr)
+            self.add_TAC(self.get_register(), "mcall", "extend", (Var(node.name), expr))
+        elif node.var_type in ("Any", tuple) and node.op == "+":
+            # Only known at runtime whether it is a list to extend, and a
+            # tuple is replaced by a new one
+            self.add_TAC(node.name, "+=", Var(node.name), self.generate(node.expr))
+        else:
+            operation = ast.BinaryOperation(node.op, ast.ID(node.name, node.coord), node.expr, node.coord)
+            self.add_TAC(node.name, None, self.generate(operation))
+
     def gen_IfStatement(self, node):
         cond = self.generate(node.cond)
         self.add_TAC(None, "if", cond)
@@ -144,6 +178,35 @@ class IRGen(object):
         
         self.add_TAC(None, "end-label")
 
+    def gen_ForStatement(self, node):
+        seq = self.generate(node.seq)
+
+        self.add_TAC(node.name, "for-in", seq)
+
+        for codeline in node.body:
+            self.generate(codeline)
+
+        self.add_TAC(None, "end-label")
+
+    def gen_ForRangeStatement(self, node):
+        # range(stop) counts from 0, and the step is 1 unless given
+        start = 0 if node.start is None else self.generate(node.start)
+        stop = self.generate(node.stop)
+        step = 1 if node.step is None else self.generate(node.step)
+
+        self.add_TAC(node.name, "for-range", None, (start, stop, step))
+
+        for codeline in node.body:
+            self.generate(codeline)
+
+        self.add_TAC(None, "end-label")
+
+    def gen_BreakStatement(self, node):
+        self.add_TAC(None, "break")
+
+    def gen_ContinueStatement(self, node):
+        self.add_TAC(None, "continue")
+
     def gen_ReturnStatement(self, node):
         expr = self.generate(node.expr)
         self.add_TAC(None, "return", expr)
@@ -153,14 +216,17 @@ class IRGen(object):
         self.add_TAC(None, "print", expr)
 
     def gen_ID(self, node):
-        return node.name
+        names = self.renames.get(node.name)
+        return Var(names[-1] if names else node.name)
 
     def gen_Literal(self, node):
+        if type(node.value) is str:
+            return StrLit(node.value)
         return node.value
 
     def gen_UnaryOperation(self, node):
         expr = self.generate(node.expr)
-        if type(expr) is not str:
+        if not isinstance(expr, str):
                 if node.op == "+":
                     return expr
                 elif node.op == "-":
@@ -175,7 +241,7 @@ class IRGen(object):
         left = self.generate(node.left)
         right = self.generate(node.right)
 
-        if ((type(left) != str and type(right) != str) or (self.is_str_literal(left) and self.is_str_literal(right))):
+        if ((not isinstance(left, str) and not isinstance(right, str)) or (self.is_str_literal(left) and self.is_str_literal(right))):
             if node.op == "and":
                 return left and right
             if node.op == "or":
@@ -185,8 +251,8 @@ class IRGen(object):
             if node.op == "!=":
                 return left != right
             if node.op == "+":
-                if type(left) == str and type(right) == str:
-                    return left[:-1] + right[1:]
+                if self.is_str_literal(left) and self.is_str_literal(right):
+                    return StrLit(left[:-1] + right[1:])
                 return left + right
             if node.op == "-":
                 return left - right
@@ -195,7 +261,9 @@ class IRGen(object):
             if node.op == "%":
                 return left % right
             if node.op == "**":
-                return left ** right
+                power = self.fold_power(left, right)
+                if power is not None:
+                    return power
             if node.op == "//":
                 return left // right
             if node.op == ">":
@@ -211,6 +279,26 @@ class IRGen(object):
         self.add_TAC(reg, node.op, left, right)
         return reg
 
+    def fold_power(self, left, right):
+        """
+        left ** right worked out as MiniPythonRuntime.pow would, or None if
+        that is left to runtime: an int power wraps around like Java ints and
+        rounds towards zero for negative exponents, and a float power is
+        Math.pow, which gives infinities and NaNs rather than raising
+        """
+        if type(left) in (int, bool) and type(right) in (int, bool):
+            left, right = int(left), int(right)
+            if right >= 0:
+                power = pow(left, right, 2 ** 32)
+                return power - 2 ** 32 if power >= 2 ** 31 else power
+            elif left == 0:
+                return None
+            return int(left ** right)
+        try:
+            return math.pow(left, right)
+        except (OverflowError, ValueError):
+            return None
+
     def gen_FunctionCall(self, node):
         args = []
         exprs = self.generate(node.exprs)
@@ -218,6 +306,7 @@ class IRGen(object):
             args = exprs.copy()
 
         reg = self.get_register()
+        self.register_types[reg] = node.return_type
             
         self.add_TAC(reg, "fcall", "{}".format(node.function_name), tuple(args))
 
@@ -225,7 +314,7 @@ class IRGen(object):
 
     def gen_Tuple(self, node):
         if (node.exprs):
-            return self.generate(node.exprs)
+            return tuple(self.generate(node.exprs))
         else:
             return ()
 
@@ -235,6 +324,40 @@ class IRGen(object):
         else:
             return []
 
+    def gen_ListComprehension(self, node):
+        if isinstance(node.seq, ast.Range):
+            start = 0 if node.seq.start is None else self.generate(node.seq.start)
+            stop = self.generate(node.seq.stop)
+            step = 1 if node.seq.step is None else self.generate(node.seq.step)
+        else:
+            seq = self.generate(node.seq)
+
+        reg = self.get_register()
+        self.register_types[reg] = list
+        self.add_TAC(reg, "list-comp")
+
+        # Java can't hide a local variable, so a variable that would is
+        # given a name of its own
+        names = self.renames.setdefault(node.name, [])
+        name = "%s$c%d" % (node.name, len(names) + 1) if node.shadows else node.name
+        names.append(name)
+
+        if isinstance(node.seq, ast.Range):
+            self.add_TAC(name, "for-range", None, (start, stop, step))
+        else:
+            self.add_TAC(name, "for-in", seq)
+        if node.cond is not None:
+            self.add_TAC(None, "if", self.generate(node.cond))
+        self.add_TAC(self.get_register(), "mcall", "append", (reg, self.generate(node.expr)))
+        if node.cond is not None:
+            self.add_TAC(None, "end-label")
+        self.add_TAC(None, "end-label")
+
+        names.pop()
+        if not names:
+            del self.renames[node.name]
+        return reg
+
     def gen_SequenceIndex(self, node):
         reg = self.get_register()
         self.add_TAC(reg, "index", self.generate(node.seq), self.generate(node.index))
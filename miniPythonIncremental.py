@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+
+import miniPythonAST as ast
+from miniPythonCallGraph import CallGraph
+from miniPythonCompiler import Compiler, CompileResult, translate, write_class
+from miniPythonSymbolTable import SymbolTable, ParseError
+from miniPythonTypeChecker import TypeChecker
+
+class Unit(object):
+    """
+    A top level piece of a source file: either one function definition or a
+    run of top level statements between two function definitions.
+    """
+    def __init__(self, is_function, lineno, text):
+        self.is_function = is_function
+        self.lineno = lineno
+        self.text = text
+
+def split_units(text):
+    """
+    Split source text into units without parsing it. Blocks are opened by a
+    line ending in ':' and closed by a line starting with '#', so a function
+    definition ends at the line that brings the block depth back to 0.
+    """
+    units = []
+    lines = []
+    depth = 0
+    is_function = False
+    lineno = 1
+
+    for number, line in enumerate(text.splitlines(True), 1):
+        stripped = line.strip()
+        if depth == 0 and stripped.startswith("def "):
+            if lines:
+                units.append(Unit(is_function, lineno, "".join(lines)))
+            lines = []
+            is_function = True
+            lineno = number
+        elif depth == 0 and is_function:
+            # Back to top level statements after a function
+            if lines:
+                units.append(Unit(is_function, lineno, "".join(lines)))
+            lines = []
+            is_function = False
+            lineno = number
+
+        lines.append(line)
+        if stripped.startswith("#"):
+            depth -= 1
+        if stripped.endswith(":"):
+            depth += 1
+
+    if lines:
+        units.append(Unit(is_function, lineno, "".join(lines)))
+    return units
+
+def walk(node):
+    """
+    Yield node and every AST node below it
+    """
+    if isinstance(node, list):
+        for elem in node:
+            yield from walk(elem)
+    elif isinstance(node, ast.Node):
+        yield node
+        for value in vars(node).values():
+            if isinstance(value, (list, ast.Node)):
+                yield from walk(value)
+
+def shift_lines(node, delta):
+    """
+    Move every line number in an AST by delta
+    """
+    for child in walk(node):
+        if child.coord:
+            child.coord += delta
+
+class ParsedUnit(object):
+    """
+    The AST of a unit along with the names it depends on and the functions
+    it defines
+    """
+    def __init__(self, lineno, root):
+        self.lineno = lineno
+        self.root = root
+        self.callees = set()
+        self.names = set()
+        self.defines = set()
+        for node in walk(root):
+            if isinstance(node, ast.FunctionDef):
+                self.defines.add(node.name)
+            elif isinstance(node, ast.FunctionCall):
+                self.callees.add(node.function_name)
+            elif isinstance(node, ast.ID):
+                self.names.add(node.name)
+            elif isinstance(node, (ast.AssignmentStatement, ast.AugmentedAssignmentStatement, ast.ForStatement,
+                                   ast.ForRangeStatement)):
+                self.names.add(node.name)
+
+    def move_to(self, lineno):
+        if lineno != self.lineno:
+            shift_lines(self.root, lineno - self.lineno)
+            self.lineno = lineno
+
+def function_signature(st, name):
+    """
+    What typechecking a call to the named function depends on
+    """
+    if name not in st.functions:
+        return None
+    function = st.functions[name]
+    return len(function.params.exprs or []), function.return_type
+
+class CompiledFunction(object):
+    def __init__(self, node, ir, java, constants):
+        self.node = node
+        self.ir = ir
+        self.java = java
+        self.constants = constants
+
+class IncrementalCompiler(Compiler):
+    """
+    Compiles successive versions of the same source, only redoing the work
+    for the parts that changed.
+
+    The source is split into units (see split_units), and each unit is only
+    parsed again when its text changes. A function is only typechecked and
+    translated again when its text, the signatures (number of parameters and
+    return type) of the functions it calls or the types of the global
+    variables it refers to change. The top level
+    statements are typechecked on every compile, since they make up the
+    global scope the functions see, but are only translated again when they
+    or the function signatures change.
+
+    Registers are numbered per function, so the IR text of different
+    functions can reuse register names.
+    """
+    def __init__(self, parser=None, buffered_output=False):
+        Compiler.__init__(self, parser, buffered_output)
+        self.parsed = {}
+        self.functions = {}
+        self.main_key = None
+        self.main_ir = None
+        self.main_java = None
+        self.main_constants = None
+
+    def parse_unit(self, unit, parsed, used, errors):
+        """
+        Parse a unit unless an unchanged copy of it was parsed before. Syntax
+        errors are added to errors and None is returned.
+        """
+        cached = self.parsed.get(unit.text)
+        if cached is None or unit.text in used:
+            root = self.parser.parse(unit.text, unit.lineno)
+            if self.parser.errors:
+                errors += self.parser.errors
+                return None
+            elif root is None:
+                errors.append(ParseError("Nothing to compile", unit.lineno))
+                return None
+            cached = ParsedUnit(unit.lineno, root)
+        cached.move_to(unit.lineno)
+        used.add(unit.text)
+        parsed[unit.text] = cached
+        return cached
+
+    def compile(self, text, class_name, ir=True, ir_file=None, compact_ir=False):
+        parsed = {}
+        functions = {}
+        used = set()
+        errors = []
+        typechecker = TypeChecker()
+        st = SymbolTable()
+        function_parts = []
+        main_lines = []
+        main_texts = []
+        # Which top level functions call which, to leave out the ones that
+        # are never called
+        graph = CallGraph()
+
+        units = []
+        for unit in split_units(text):
+            if not unit.text.strip():
+                continue
+            parsed_unit = self.parse_unit(unit, parsed, used, errors)
+            units.append((unit, parsed_unit))
+        # Keep the units that did parse for the next compile
+        self.parsed = parsed
+        if errors:
+            return CompileResult(diagnostics=[str(e) for e in errors])
+
+        for unit, parsed_unit in units:
+            if not unit.is_function:
+                for codeline in parsed_unit.root.code_lines:
+                    typechecker.typecheck(codeline, st)
+                main_lines += parsed_unit.root.code_lines
+                main_texts.append(unit.text)
+                for callee in parsed_unit.callees:
+                    graph.add_call(CallGraph.MAIN, callee)
+                continue
+
+            key = (unit.text,
+                   tuple(sorted((name, function_signature(st, name)) for name in parsed_unit.callees)),
+                   tuple(sorted((name, st.lookup_variable(name, unit.lineno)) for name in parsed_unit.names if st.check_variable(name))))
+            compiled = self.functions.get(key)
+            if compiled is None or key in functions:
+                codeline = parsed_unit.root.code_lines[0]
+                error_count = len(typechecker.errors)
+                typechecker.typecheck(codeline, st)
+                if len(typechecker.errors) > error_count:
+                    # Not worth translating or keeping
+                    continue
+                compiled = self.translate_function(codeline, compact_ir)
+            else:
+                try:
+                    st.declare_function(compiled.node.name, compiled.node, compiled.node.coord)
+                except ParseError as e:
+                    typechecker.errors.append(e)
+                    continue
+            functions[key] = compiled
+            function_parts.append(compiled)
+            for callee in parsed_unit.callees:
+                graph.add_call(compiled.node.name, callee)
+
+        self.functions = functions
+        if typechecker.errors:
+            return CompileResult(diagnostics=[str(e) for e in typechecker.errors])
+
+        main_key = (tuple(main_texts), tuple((name, function_signature(st, name)) for name in st.functions))
+        if main_key != self.main_key:
+            self.main_ir, self.main_java, self.main_constants = translate(main_lines, False, 2, compact_ir)
+            self.main_key = main_key
+
+        ir_text = None
+        if ir or ir_file is not None:
+            ir_text = "".join(compiled.ir for compiled in function_parts) + self.main_ir
+            if ir_file is not None:
+                file = open(ir_file, "w")
+                file.write(ir_text)
+                file.close()
+
+        live = graph.reachable()
+        live_parts = [compiled for compiled in function_parts if compiled.node.name in live]
+        java = write_class(class_name, [compiled.java for compiled in live_parts], self.main_java,
+                           [compiled.constants for compiled in live_parts] + [self.main_constants], self.buffered_output)
+        return CompileResult(java, ir_text if ir else None)
+
+    def translate_function(self, codeline, compact_ir):
+        ir, java, constants = translate([codeline], True, 1, compact_ir)
+        return CompiledFunction(codeline.code_line, ir, java, constants)
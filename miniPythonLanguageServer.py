@@ -0,0 +1,500 @@
+#!/usr/bin/env python3
+
+import json
+import re
+import sys
+import traceback
+from miniPythonParser import MiniPythonParser
+from miniPythonSymbolTable import SymbolTable, ParseError
+from miniPythonTypeChecker import TypeChecker
+from miniPythonIncremental import IncrementalCompiler, Unit, split_units, function_signature
+
+# LSP constants
+TEXT_DOCUMENT_SYNC_INCREMENTAL = 2
+SEVERITY_ERROR = 1
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+WORD = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+class Declaration(object):
+    """
+    A variable or function declaration. Lines are relative to the start of
+    the unit it was found in, so that it stays valid when the unit moves.
+    """
+    def __init__(self, name, type, line, is_global, node=None):
+        self.name = name
+        self.type = type
+        self.line = line
+        self.is_global = is_global
+        self.node = node
+
+class RecordingSymbolTable(SymbolTable):
+    """
+    A symbol table that also keeps a list of every declaration made in it
+    """
+    def __init__(self):
+        SymbolTable.__init__(self)
+        self.declarations = []
+        self.lineno = 0
+
+    def declare_function(self, function_name, function_node, line_number):
+        SymbolTable.declare_function(self, function_name, function_node, line_number)
+        self.declarations.append(Declaration(function_name, None, line_number - self.lineno, True, function_node))
+
+    def declare_variable(self, name, var_type, line_number):
+        SymbolTable.declare_variable(self, name, var_type, line_number)
+        self.declarations.append(Declaration(name, var_type, line_number - self.lineno, self.get_scope() == 1))
+
+class CheckedUnit(object):
+    """
+    The result of typechecking one unit: the declarations it made and its
+    errors, with lines relative to the start of the unit
+    """
+    def __init__(self, declarations, errors, st):
+        self.declarations = declarations
+        self.errors = errors
+        # What the unit adds to the global scope
+        self.variables = dict((declaration.name, declaration.type) for declaration in declarations
+                              if declaration.is_global and declaration.node is None)
+        self.functions = dict((declaration.name, declaration.node) for declaration in declarations
+                              if declaration.node is not None)
+        self.signatures = dict((name, function_signature(st, name)) for name in self.functions)
+
+    def same_effect(self, other):
+        return self.variables == other.variables and self.signatures == other.signatures
+
+class Analysis(object):
+    """
+    Everything known about one version of a document
+    """
+    def __init__(self):
+        self.units = []
+        self.checked = []
+        self.diagnostics = []
+
+class Analyzer(IncrementalCompiler):
+    """
+    Typechecks successive versions of a document without translating it.
+
+    Units are parsed as in IncrementalCompiler. Typechecking a unit is
+    skipped when its text, the signatures of the functions it calls or
+    defines and the types of the global variables it refers to are all
+    unchanged; the declarations and errors recorded the last time are
+    replayed instead. Up to the first unit that changed, and after it for as
+    long as the changed units declare the same globals as before, even that
+    check is skipped.
+    """
+    def __init__(self, parser):
+        IncrementalCompiler.__init__(self, parser)
+        self.checked = {}
+        # The parsed unit, key and CheckedUnit of each unit last time
+        self.previous = []
+
+    def unit_key(self, unit, parsed_unit, st):
+        # Units are checked in the global scope, so the only variables the
+        # unit can see are in the bottom scope
+        if not hasattr(parsed_unit, "dependencies"):
+            parsed_unit.dependencies = (sorted(parsed_unit.callees | parsed_unit.defines), sorted(parsed_unit.names))
+        functions, names = parsed_unit.dependencies
+        global_scope = st.scopes[0]
+        return (unit.text,
+                tuple(function_signature(st, name) for name in functions),
+                tuple(global_scope.get(name) for name in names))
+
+    def check_unit(self, typechecker, unit, parsed_unit, st):
+        st.lineno = unit.lineno
+        declared = len(st.declarations)
+        error_count = len(typechecker.errors)
+        for codeline in parsed_unit.root.code_lines:
+            typechecker.typecheck(codeline, st)
+        errors = [ParseError(e.message, e.line_number - unit.lineno if e.line_number else None)
+                  for e in typechecker.errors[error_count:]]
+        return CheckedUnit(st.declarations[declared:], errors, st)
+
+    def replay_unit(self, checked, st):
+        # The unit's declarations are already recorded
+        for name, var_type in checked.variables.items():
+            SymbolTable.declare_variable(st, name, var_type, None)
+        st.functions.update(checked.functions)
+
+    def analyze(self, units):
+        analysis = Analysis()
+        parsed = {}
+        used = set()
+        syntax_errors = []
+        for unit in units:
+            if not unit.text.strip():
+                continue
+            parsed_unit = self.parse_unit(unit, parsed, used, syntax_errors)
+            if parsed_unit is not None:
+                analysis.units.append((unit, parsed_unit))
+        self.parsed = parsed
+
+        checked_units = {}
+        previous = []
+        # Whether the global scope is the same as last time at this unit
+        same_scope = True
+        typechecker = TypeChecker()
+        st = RecordingSymbolTable()
+        for index, (unit, parsed_unit) in enumerate(analysis.units):
+            last = self.previous[index] if index < len(self.previous) else None
+            if same_scope and last is not None and last[0] is parsed_unit:
+                key, checked = last[1], last[2]
+                self.replay_unit(checked, st)
+            else:
+                key = self.unit_key(unit, parsed_unit, st)
+                checked = self.checked.get(key)
+                if checked is None or key in checked_units:
+                    checked = self.check_unit(typechecker, unit, parsed_unit, st)
+                else:
+                    self.replay_unit(checked, st)
+                same_scope = same_scope and last is not None and checked.same_effect(last[2])
+            checked_units[key] = checked
+            previous.append((parsed_unit, key, checked))
+            analysis.checked.append(checked)
+        self.checked = checked_units
+        self.previous = previous
+
+        if syntax_errors:
+            analysis.diagnostics = syntax_errors
+        else:
+            for (unit, parsed_unit), checked in zip(analysis.units, analysis.checked):
+                for error in checked.errors:
+                    analysis.diagnostics.append(ParseError(error.message, error.line_number + unit.lineno if error.line_number is not None else None))
+        return analysis
+
+def code_point_index(line, character):
+    """
+    The index into line of an LSP position's character, which counts UTF-16
+    code units, so characters outside the BMP count twice
+    """
+    units = 0
+    for index, char in enumerate(line):
+        if units >= character:
+            return index
+        units += 2 if ord(char) > 0xFFFF else 1
+    return len(line)
+
+def utf16_length(text):
+    """
+    The length of text in UTF-16 code units, as LSP positions count it
+    """
+    return len(text.encode("utf-16-le")) // 2
+
+def type_name(var_type):
+    if isinstance(var_type, type):
+        return var_type.__name__
+    return str(var_type)
+
+class Document(object):
+    """
+    An open document. Its text is kept split into units, and an edit that
+    stays within one unit only splits that unit again.
+    """
+    def __init__(self, uri, text, analyzer):
+        self.uri = uri
+        self.text = text
+        self.units = split_units(text)
+        self.analyzer = analyzer
+        self.analysis = None
+
+    def lines(self):
+        return self.text.split("\n")
+
+    def offset(self, position):
+        """
+        Turn an LSP position into an offset into the text
+        """
+        lines = self.text.split("\n", position["line"])
+        if len(lines) <= position["line"]:
+            return len(self.text)
+        line = lines[-1].split("\n", 1)[0]
+        return len(self.text) - len(lines[-1]) + code_point_index(line, position["character"])
+
+    def apply_change(self, change):
+        self.analysis = None
+        if "range" not in change:
+            self.text = change["text"]
+            self.units = split_units(self.text)
+            return
+
+        start = self.offset(change["range"]["start"])
+        end = self.offset(change["range"]["end"])
+        self.text = self.text[:start] + change["text"] + self.text[end:]
+        if not self.resplit(start, end, change["text"]):
+            self.units = split_units(self.text)
+
+    def resplit(self, start, end, text):
+        """
+        Update the units for text replacing the range from start to end, if
+        the range is within one unit and the edit doesn't move the unit
+        boundaries. Returns whether it could.
+        """
+        unit_start = 0
+        for index, unit in enumerate(self.units):
+            unit_end = unit_start + len(unit.text)
+            if start <= unit_end:
+                break
+            unit_start = unit_end
+        else:
+            return False
+        if end > unit_end:
+            return False
+
+        edited = unit.text[:start - unit_start] + text + unit.text[end - unit_start:]
+        following = self.units[index + 1:]
+        # Splitting the edited unit along with the next one shows whether the
+        # edit ends the unit somewhere else or changes the next unit
+        expected = [(unit.is_function, edited)]
+        if following:
+            expected.append((following[0].is_function, following[0].text))
+        if [(new.is_function, new.text) for new in split_units(edited + (following[0].text if following else ""))] != expected:
+            return False
+
+        delta = edited.count("\n") - unit.text.count("\n")
+        if delta:
+            following = [Unit(later.is_function, later.lineno + delta, later.text) for later in following]
+        self.units[index:] = [Unit(unit.is_function, unit.lineno, edited)] + following
+        return True
+
+    def analyze(self):
+        if self.analysis is None:
+            self.analysis = self.analyzer.analyze(self.units)
+        return self.analysis
+
+    def word_at(self, position):
+        lines = self.lines()
+        if position["line"] >= len(lines):
+            return None
+        line = lines[position["line"]]
+        character = code_point_index(line, position["character"])
+        for match in WORD.finditer(line):
+            if match.start() <= character <= match.end():
+                return match.group()
+        return None
+
+    def lookup(self, name, line):
+        """
+        Find the declaration that name refers to on the given (1 based)
+        line, along with the line it was declared on
+        """
+        analysis = self.analyze()
+        enclosing = None
+        for (unit, parsed_unit), checked in zip(analysis.units, analysis.checked):
+            if unit.lineno > line:
+                break
+            enclosing = (unit, checked)
+
+        # Variables local to the enclosing function or block
+        if enclosing is not None:
+            unit, checked = enclosing
+            found = None
+            for declaration in checked.declarations:
+                if declaration.name == name and not declaration.is_global:
+                    if found is None or declaration.line + unit.lineno <= line:
+                        found = declaration
+            if found is not None:
+                return found, found.line + unit.lineno
+
+        for (unit, parsed_unit), checked in zip(analysis.units, analysis.checked):
+            for declaration in checked.declarations:
+                if declaration.name == name and declaration.is_global:
+                    return declaration, declaration.line + unit.lineno
+        return None, None
+
+    def range(self, line, name=None):
+        """
+        The range of name on the given (1 based) line, or of the whole line
+        """
+        lines = self.lines()
+        text = lines[line - 1] if 0 < line <= len(lines) else ""
+        start, end = 0, len(text)
+        if name is not None:
+            match = re.search(r"\b%s\b" % re.escape(name), text)
+            if match is not None:
+                start, end = match.start(), match.end()
+        return {"start": {"line": line - 1, "character": utf16_length(text[:start])},
+                "end": {"line": line - 1, "character": utf16_length(text[:end])}}
+
+class LanguageServer(object):
+    """
+    A Language Server Protocol server for miniPython over stdio. It reports
+    syntax and type errors as diagnostics, shows the types of variables and
+    the signatures of functions on hover and finds their definitions.
+
+    The parser is built once and shared by every document.
+    """
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.parser = MiniPythonParser()
+        self.parser.print_errors = False
+        self.parser.build(write_tables=False)
+        self.documents = {}
+        self.running = True
+        self.handlers = {
+            "initialize": self.initialize,
+            "shutdown": self.shutdown,
+            "exit": self.exit,
+            "textDocument/didOpen": self.did_open,
+            "textDocument/didChange": self.did_change,
+            "textDocument/didClose": self.did_close,
+            "textDocument/hover": self.hover,
+            "textDocument/definition": self.definition,
+        }
+
+    def read_message(self):
+        """
+        Read the next message, or None at the end of the input. Messages that
+        can't be decoded are logged, answered with an error and skipped.
+        """
+        while True:
+            length = None
+            while True:
+                line = self.reader.readline()
+                if not line:
+                    return None
+                line = line.strip()
+                if not line:
+                    break
+                name, _, value = line.decode("ascii", "replace").partition(":")
+                if name.lower() == "content-length":
+                    length = int(value) if value.strip().isdigit() else None
+            if length is None:
+                # There is no telling where the body ends, so the next
+                # header is looked for instead
+                self.reject(INVALID_REQUEST, "Missing or invalid Content-Length header")
+                continue
+
+            body = self.reader.read(length)
+            try:
+                message = json.loads(body.decode("utf-8"))
+            except ValueError as e:
+                # Including bodies that aren't UTF-8
+                self.reject(PARSE_ERROR, "Invalid JSON: {}".format(e))
+                continue
+            if not isinstance(message, dict):
+                self.reject(INVALID_REQUEST, "Expected a JSON object")
+                continue
+            return message
+
+    def reject(self, code, text):
+        """
+        Log a message that couldn't be read and answer it with an error,
+        which has no id since the message's id is unknown
+        """
+        sys.stderr.write(text + "\n")
+        self.send({"jsonrpc": "2.0", "id": None, "error": {"code": code, "message": text}})
+
+    def send(self, message):
+        body = json.dumps(message).encode("utf-8")
+        self.writer.write(b"Content-Length: %d\r\n\r\n" % len(body))
+        self.writer.write(body)
+        self.writer.flush()
+
+    def run(self):
+        while self.running:
+            message = self.read_message()
+            if message is None:
+                break
+            try:
+                self.handle(message)
+            except Exception as e:
+                # One bad message shouldn't bring down the server
+                if "id" in message:
+                    self.send({"jsonrpc": "2.0", "id": message["id"],
+                               "error": {"code": INTERNAL_ERROR, "message": "{}: {}".format(type(e).__name__, e)}})
+                sys.stderr.write("Error handling {}:\n".format(message.get("method")))
+                traceback.print_exc(file=sys.stderr)
+
+    def handle(self, message):
+        handler = self.handlers.get(message.get("method"))
+        if "id" not in message:
+            # Notifications don't get a response
+            if handler is not None:
+                handler(message.get("params"))
+        elif handler is None:
+            self.send({"jsonrpc": "2.0", "id": message["id"],
+                       "error": {"code": METHOD_NOT_FOUND, "message": "Unknown method " + str(message.get("method"))}})
+        else:
+            result = handler(message.get("params"))
+            self.send({"jsonrpc": "2.0", "id": message["id"], "result": result})
+
+    def initialize(self, params):
+        return {"capabilities": {"textDocumentSync": TEXT_DOCUMENT_SYNC_INCREMENTAL,
+                                 "hoverProvider": True,
+                                 "definitionProvider": True}}
+
+    def shutdown(self, params):
+        return None
+
+    def exit(self, params):
+        self.running = False
+
+    def publish_diagnostics(self, document):
+        diagnostics = []
+        for error in document.analyze().diagnostics:
+            diagnostics.append({"range": document.range(error.line_number or 1),
+                                "severity": SEVERITY_ERROR,
+                                "source": "miniPython",
+                                "message": error.message})
+        self.send({"jsonrpc": "2.0", "method": "textDocument/publishDiagnostics",
+                   "params": {"uri": document.uri, "diagnostics": diagnostics}})
+
+    def did_open(self, params):
+        uri = params["textDocument"]["uri"]
+        document = Document(uri, params["textDocument"]["text"], Analyzer(self.parser))
+        self.documents[uri] = document
+        self.publish_diagnostics(document)
+
+    def did_change(self, params):
+        document = self.documents[params["textDocument"]["uri"]]
+        for change in params["contentChanges"]:
+            document.apply_change(change)
+        self.publish_diagnostics(document)
+
+    def did_close(self, params):
+        uri = params["textDocument"]["uri"]
+        self.documents.pop(uri, None)
+        self.send({"jsonrpc": "2.0", "method": "textDocument/publishDiagnostics",
+                   "params": {"uri": uri, "diagnostics": []}})
+
+    def find(self, params):
+        """
+        The name under the cursor, its declaration and the line it's on
+        """
+        document = self.documents.get(params["textDocument"]["uri"])
+        if document is None:
+            return None, None, None, None
+        name = document.word_at(params["position"])
+        if name is None:
+            return document, None, None, None
+        declaration, line = document.lookup(name, params["position"]["line"] + 1)
+        return document, name, declaration, line
+
+    def hover(self, params):
+        document, name, declaration, line = self.find(params)
+        if declaration is None:
+            return None
+        if declaration.node is not None:
+            params_list = declaration.node.params.exprs or []
+            text = "def {}({}) -> {}".format(name, ", ".join(param.name for param in params_list), type_name(declaration.node.return_type))
+        else:
+            text = "{}: {}".format(name, type_name(declaration.type))
+        return {"contents": {"kind": "plaintext", "value": text},
+                "range": document.range(params["position"]["line"] + 1, name)}
+
+    def definition(self, params):
+        document, name, declaration, line = self.find(params)
+        if declaration is None:
+            return None
+        return {"uri": document.uri, "range": document.range(line, name)}
+
+if __name__ == "__main__":
+    server = LanguageServer(sys.stdin.buffer, sys.stdout.buffer)
+    # stdout carries the protocol, so anything else printed goes to stderr
+    sys.stdout = sys.stderr
+    server.run()
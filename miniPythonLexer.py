@@ -15,7 +15,14 @@ tokens = [
     'LESS_EQUAL',
     'GREATER_EQUAL',
     'NOT_EQUAL',
-    'EQUAL_EQUAL'
+    'EQUAL_EQUAL',
+    'PLUS_EQUAL',
+    'MINUS_EQUAL',
+    'TIMES_EQUAL',
+    'DIVIDE_EQUAL',
+    'MOD_EQUAL',
+    'POWER_EQUAL',
+    'INT_DIVIDE_EQUAL'
 ]
 
 # List of literals
@@ -55,6 +62,13 @@ reserved = {
     'else' : 'ELSE',
     # WHILE
     'while' : 'WHILE',
+    # FOR
+    'for' : 'FOR',
+    'in' : 'IN',
+    'range' : 'RANGE',
+    # LOOP EXITS
+    'break' : 'BREAK',
+    'continue' : 'CONTINUE',
     # FUNCTION DEFINITION
     'def' : 'DEF',
     # CALLS
@@ -83,6 +97,13 @@ class MiniPythonLexer():
     t_GREATER_EQUAL = r'\>='
     t_NOT_EQUAL = r'\!='
     t_EQUAL_EQUAL = r'\=='
+    t_PLUS_EQUAL = r'\+='
+    t_MINUS_EQUAL = r'-='
+    t_TIMES_EQUAL = r'\*='
+    t_DIVIDE_EQUAL = r'/='
+    t_MOD_EQUAL = r'%='
+    t_POWER_EQUAL = r'\*\*='
+    t_INT_DIVIDE_EQUAL = r'//='
 
     # Regex rules with action code
     def t_NEW_LINE(self, t):
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+from miniPythonCallGraph import CallGraph
+from threeAddressCode import (TAC, CompactTAC, BLOCK_OPCODES, OP_ASSIGN, OP_FDEF, OP_END_LABEL, OP_MCALL, Reg, Var,
+                              opcode_column, operand_column)
+
+def remove_dead_functions(tacs):
+    """
+    Remove the definitions of functions that can't be reached from the top
+    level code. Functions defined in a live function are kept with it.
+    Returns tacs itself if every function is live, and otherwise a new list
+    of the same kind.
+    """
+    live = CallGraph.from_tacs(tacs).reachable()
+    # Where the TACs kept are
+    kept = []
+    depth = 0
+    # The depth of the function being kept or dropped, if in one
+    function_depth = None
+    dropping = False
+    for index, (opcode, name) in enumerate(zip(opcode_column(tacs), operand_column(tacs, "left_operand"))):
+        if opcode == OP_FDEF and function_depth is None:
+            function_depth = depth
+            dropping = name not in live
+        if not dropping:
+            kept.append(index)
+        if opcode in BLOCK_OPCODES:
+            depth += 1
+        elif opcode == OP_END_LABEL:
+            depth -= 1
+            if depth == function_depth:
+                function_depth = None
+                dropping = False
+
+    if len(kept) == len(tacs):
+        return tacs
+    elif isinstance(tacs, CompactTAC):
+        return CompactTAC.from_tacs(tacs[index] for index in kept)
+    return [tacs[index] for index in kept]
+
+def leaf_operands(operand):
+    """
+    Yield an operand, or the elements of a sequence operand, or of the
+    sequences in it
+    """
+    if type(operand) is list or type(operand) is tuple:
+        for elem in operand:
+            yield from leaf_operands(elem)
+    else:
+        yield operand
+
+def used_registers(tacs):
+    """
+    The registers read by any of the TACs
+    """
+    used = set()
+    for tac in tacs:
+        for operand in (tac.left_operand, tac.right_operand):
+            used.update(leaf for leaf in leaf_operands(operand) if type(leaf) is Reg)
+    return used
+
+def can_fuse(assign, extend):
+    """
+    Whether an extend TAC can be folded into the assignment before it
+    """
+    lst, arg = extend.right_operand
+    if assign.opcode != OP_ASSIGN or assign.result != lst or type(lst) is not Var:
+        return False
+    elif type(assign.left_operand) is not list or type(arg) not in (list, tuple):
+        return False
+    for leaf in leaf_operands([assign.left_operand, arg]):
+        if type(leaf) is Reg or (type(leaf) is Var and leaf == lst):
+            return False
+    return True
+
+def fuse_extends(tacs):
+    """
+    Fold v.extend(sequence literal) right after v = list literal into the
+    literal, so the list is built once at its final size rather than grown.
+    Literals holding registers aren't fused, since a register's expression is
+    evaluated where it is used, and neither are ones holding v itself.
+    Returns tacs itself if there is nothing to fuse, and otherwise a new list
+    of the same kind.
+    """
+    if not any(opcode == OP_MCALL and name == "extend"
+               for opcode, name in zip(opcode_column(tacs), operand_column(tacs, "left_operand"))):
+        return tacs
+    used = used_registers(tacs)
+    fused = []
+    for tac in tacs:
+        if (tac.opcode == OP_MCALL and tac.left_operand == "extend" and tac.result not in used
+                and fused and can_fuse(fused[-1], tac)):
+            assign = fused[-1]
+            fused[-1] = TAC(assign.result, None, assign.left_operand + list(tac.right_operand[1]))
+            continue
+        fused.append(tac)
+
+    if len(fused) == len(tacs):
+        return tacs
+    elif isinstance(tacs, CompactTAC):
+        return CompactTAC.from_tacs(fused)
+    return fused
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+import miniPythonAST as ast
+from miniPythonCallGraph import CallGraph
+from miniPythonCompiler import Compiler, CompileResult, translate, write_class
+from miniPythonTypeChecker import TypeChecker
+
+# The state of each worker: the functions to translate and how to store the
+# IR, set when the worker starts
+worker_functions = None
+worker_compact_ir = False
+
+def init_worker(functions, compact_ir):
+    global worker_functions, worker_compact_ir
+    worker_functions = functions
+    worker_compact_ir = compact_ir
+
+def translate_function(index):
+    """
+    Translate a typechecked top level function. Returns the IR text, Java and
+    constant declarations.
+    """
+    return translate([worker_functions[index]], True, 1, worker_compact_ir)
+
+class ParallelCompiler(Compiler):
+    """
+    Compiles miniPython source to Java with the top level functions
+    translated in parallel by a pool of processes.
+
+    The whole program is typechecked first, since the return type of a
+    function depends on its body and is needed to check the code after it.
+    The translated functions and top level code are then put together as in
+    IncrementalCompiler, so registers are numbered per function.
+    """
+    def __init__(self, parser=None, jobs=None, buffered_output=False):
+        Compiler.__init__(self, parser, buffered_output)
+        self.jobs = jobs or os.cpu_count()
+
+    def compile(self, text, class_name, ir=True, ir_file=None, compact_ir=False):
+        root = self.parser.parse(text)
+        if self.parser.errors or root is None:
+            return CompileResult(diagnostics=[str(e) for e in self.parser.errors] or ["Nothing to compile"])
+
+        typechecker = TypeChecker()
+        typechecker.typecheck(root, None)
+        if typechecker.errors:
+            return CompileResult(diagnostics=[str(e) for e in typechecker.errors])
+
+        functions = []
+        main_lines = []
+        for codeline in root.code_lines:
+            if isinstance(codeline.code_line, ast.FunctionDef):
+                functions.append(codeline)
+            else:
+                main_lines.append(codeline)
+
+        results = []
+        if functions:
+            chunksize = max(1, len(functions) // (self.jobs * 4))
+            # The functions are sent once to each worker, if at all, rather
+            # than with every task
+            with ProcessPoolExecutor(self.jobs, initializer=init_worker, initargs=(functions, compact_ir)) as pool:
+                results = list(pool.map(translate_function, range(len(functions)), chunksize=chunksize))
+
+        main_ir, main_java, main_constants = translate(main_lines, False, 2, compact_ir)
+        live = CallGraph.from_ast(root).reachable()
+        live_results = [result for codeline, result in zip(functions, results)
+                        if codeline.code_line.name in live]
+        java = write_class(class_name, [function_java for _, function_java, _ in live_results], main_java,
+                           [constants for _, _, constants in live_results] + [main_constants], self.buffered_output)
+
+        ir_text = None
+        if ir or ir_file is not None:
+            ir_text = "".join(function_ir for function_ir, _, _ in results) + main_ir
+            if ir_file is not None:
+                file = open(ir_file, "w")
+                file.write(ir_text)
+                file.close()
+
+        return CompileResult(java, ir_text if ir else None)
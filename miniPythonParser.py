@@ -4,10 +4,12 @@ import argparse
 from ply import yacc
 from miniPythonLexer import MiniPythonLexer
 from miniPythonLexer import tokens
+from miniPythonSymbolTable import ParseError
 import miniPythonAST as ast
 
 class MiniPythonParser:
     debug_messages = False
+    print_errors = True
 
     precedence = (
         ('left', 'OR'),
@@ -54,6 +56,14 @@ class MiniPythonParser:
         self.debug("DEBUG", "code_line")
         p[0] = ast.CodeLine(p[1], p.lineno(1))
 
+    def p_code_line_error(self, p):
+        '''
+        code_line : error NEW_LINE
+        '''
+        # Error recovery, see p_error
+        self.debug("DEBUG", "code_line_error")
+        p[0] = None
+
     def p_block(self, p):
         '''
         block : ':' new_lines optional_new_lines code_lines '#' new_lines
@@ -81,8 +91,12 @@ class MiniPythonParser:
     def p_statement(self, p):
         '''
         statement : assignment_statement
+                  | augmented_assignment_statement
                   | if_statement 
                   | while_statement
+                  | for_statement
+                  | break_statement
+                  | continue_statement
                   | return_statement
                   | print_statement
         '''
@@ -96,6 +110,20 @@ class MiniPythonParser:
         self.debug("DEBUG", "assignment_statement")
         p[0] = ast.AssignmentStatement(p[1], p[3], p.lineno(1))
 
+    def p_augmented_assignment_statement(self, p):
+        '''
+        augmented_assignment_statement : ID PLUS_EQUAL expr
+                                       | ID MINUS_EQUAL expr
+                                       | ID TIMES_EQUAL expr
+                                       | ID DIVIDE_EQUAL expr
+                                       | ID MOD_EQUAL expr
+                                       | ID POWER_EQUAL expr
+                                       | ID INT_DIVIDE_EQUAL expr
+        '''
+        self.debug("DEBUG", "augmented_assignment_statement")
+        # The operator without its '='
+        p[0] = ast.AugmentedAssignmentStatement(p[1], p[2][:-1], p[3], p.lineno(1))
+
     def p_params(self, p):
         '''
         params : expr
@@ -154,6 +182,45 @@ class MiniPythonParser:
         '''
         p[0] = ast.WhileStatement(p[2], p[3], p.lineno(1))
 
+    def p_for_statement(self, p):
+        '''
+        for_statement : FOR ID IN expr block
+                      | FOR ID IN range block
+        '''
+        self.debug("DEBUG", "for_statement")
+        if isinstance(p[4], ast.Range):
+            p[0] = ast.ForRangeStatement(p[2], p[4].start, p[4].stop, p[4].step, p[5], p.lineno(1))
+        else:
+            p[0] = ast.ForStatement(p[2], p[4], p[5], p.lineno(1))
+
+    def p_range(self, p):
+        '''
+        range : RANGE '(' expr ')'
+              | RANGE '(' expr ',' expr ')'
+              | RANGE '(' expr ',' expr ',' expr ')'
+        '''
+        self.debug("DEBUG", "range")
+        if len(p) == 5:
+            p[0] = ast.Range(None, p[3], None, p.lineno(1))
+        elif len(p) == 7:
+            p[0] = ast.Range(p[3], p[5], None, p.lineno(1))
+        else:
+            p[0] = ast.Range(p[3], p[5], p[7], p.lineno(1))
+
+    def p_break_statement(self, p):
+        '''
+        break_statement : BREAK
+        '''
+        self.debug("DEBUG", "break_statement")
+        p[0] = ast.BreakStatement(p.lineno(1))
+
+    def p_continue_statement(self, p):
+        '''
+        continue_statement : CONTINUE
+        '''
+        self.debug("DEBUG", "continue_statement")
+        p[0] = ast.ContinueStatement(p.lineno(1))
+
     def p_return_statement(self, p):
         '''
         return_statement : RETURN expr
@@ -201,6 +268,13 @@ class MiniPythonParser:
         self.debug("DEBUG", "expr_list")
         p[0] = p[1]
 
+    def p_expr_list_comprehension(self, p):
+        '''
+        expr : list_comprehension
+        '''
+        self.debug("DEBUG", "expr_list_comprehension")
+        p[0] = p[1]
+
     def p_expr_tuple(self, p):
         '''
         expr : tuple
@@ -301,6 +375,19 @@ class MiniPythonParser:
         else:
             p[0] = ast.List(p[2], p.lineno(1))
 
+    def p_list_comprehension(self, p):
+        '''
+        list_comprehension : '[' expr FOR ID IN expr ']'
+                           | '[' expr FOR ID IN range ']'
+                           | '[' expr FOR ID IN expr IF expr ']'
+                           | '[' expr FOR ID IN range IF expr ']'
+        '''
+        self.debug("DEBUG", "list_comprehension")
+        if len(p) == 8:
+            p[0] = ast.ListComprehension(p[2], p[4], p[6], None, p.lineno(1))
+        else:
+            p[0] = ast.ListComprehension(p[2], p[4], p[6], p[8], p.lineno(1))
+
     def p_sequence_call(self, p):
         '''
         sequence_call : sequence_index
@@ -421,18 +508,74 @@ class MiniPythonParser:
     ''' Useful code from: miniJavaParser.py from tutorial '''
     # Error handling rule
     def p_error(self, p):
-        print("Syntax error at token", p)
+        if p is None:
+            error = ParseError("Syntax error at end of input", self.lexer.lexer.lineno)
+        else:
+            error = ParseError("Syntax error at token %s" % repr(p.value), p.lineno)
+        self.errors.append(error)
+        if self.print_errors:
+            print(error)
+
+        # The parser then discards tokens up to the next NEW_LINE and turns
+        # what it skipped into an error code_line
+        if p is not None and p.type not in ('NEW_LINE', '#'):
+            self.skip_line(p)
+
+    def skip_line(self, p):
+        """
+        Error recovery: move the lexer past the rest of the line holding the
+        erroneous token, so parsing resumes at its NEW_LINE. If that line
+        opens a block, the whole block is skipped up to its closing '#'.
+        """
+        lexer = self.lexer.lexer
+        data = lexer.lexdata
+        line_start = data.rfind('\n', 0, p.lexpos) + 1
+        end = self.line_end(data, p.lexpos)
+        if data[line_start:end].strip().endswith(':'):
+            end = self.block_end(data, end)
+        lexer.lineno += data.count('\n', p.lexpos, end)
+        lexer.lexpos = end
+
+    def line_end(self, data, pos):
+        end = data.find('\n', pos)
+        return len(data) if end == -1 else end
+
+    def block_end(self, data, pos):
+        """
+        Find the end of the line closing the block opened by the line ending
+        at pos, including any elif and else blocks that follow it
+        """
+        depth = 1
+        while pos < len(data):
+            end = self.line_end(data, pos + 1)
+            line = data[pos + 1:end].strip()
+            if line.startswith('#'):
+                depth -= 1
+            if line.endswith(':'):
+                depth += 1
+            pos = end
+            if depth == 0:
+                following = data[pos:].lstrip()
+                if not (following.startswith('elif') or following.startswith('else')):
+                    break
+        return pos
 
     # Build the parser
     def build(self, **kwargs):
         self.tokens = tokens
+        self.errors = []
         self.lexer = MiniPythonLexer()
         self.lexer.build()
         self.parser = yacc.yacc(debug=False, module=self, **kwargs)
     ''' End citation '''
 
-    def parse(self, data):
-        return self.parser.parse(data)
+    def parse(self, data, lineno=1):
+        """
+        Parse data, numbering its lines from lineno
+        """
+        self.errors = []
+        self.lexer.lexer.lineno = lineno
+        return self.parser.parse(data, lexer=self.lexer.lexer)
 
     def test(self, data):
         result = self.parser.parse(data, debug=False)
@@ -1,21 +1,42 @@
 #!/usr/bin/env python3
 
-class ParseError(Exception): pass
+class ParseError(Exception):
+    def __init__(self, message, line_number=None):
+        Exception.__init__(self, message, line_number)
+        self.message = message
+        self.line_number = line_number
+
+    def __str__(self):
+        if not self.line_number:
+            return self.message
+        return "line {}: {}".format(self.line_number, self.message)
 
 class SymbolTable(object):
+    """
+    Variables are kept in a single map from each name to the stack of types
+    bound to it, innermost last, so looking one up takes the same time at
+    any scope depth. Each scope maps the names declared in it to their
+    types, which also serves as the log of what to undo when it is popped.
+    """
     def __init__(self):
         self.functions = dict()
-        self.scope_stack = [dict()]
+        self.bindings = dict()
+        self.scopes = [dict()]
 
     def get_scope(self):
-        return len(self.scope_stack)
+        return len(self.scopes)
 
     def push_scope(self):
-        self.scope_stack.append(dict())
+        self.scopes.append(dict())
 
     def pop_scope(self):
-        assert len(self.scope_stack) > 1
-        self.scope_stack.pop()
+        assert len(self.scopes) > 1
+        for name in self.scopes.pop():
+            stack = self.bindings[name]
+            if len(stack) == 1:
+                del self.bindings[name]
+            else:
+                stack.pop()
 
     def declare_function(self, function_name, function_node, line_number):
         if function_name in self.functions:
@@ -24,23 +45,37 @@ class SymbolTable(object):
 
     def lookup_function(self, function_name, line_number):
         if function_name not in self.functions:
-            raise ParseError("Referencing undefined function \"" + function_name + "\"")
+            raise ParseError("Referencing undefined function \"" + function_name + "\"", line_number)
         return self.functions[function_name]
 
     def declare_variable(self, name, var_type, line_number):
-        if name in self.scope_stack[-1]:
+        scope = self.scopes[-1]
+        if name in scope:
             raise ParseError("Redeclaring variable named \"" + name + "\"", line_number)
-        self.scope_stack[-1][name] = var_type
+        scope[name] = var_type
+        stack = self.bindings.get(name)
+        if stack is None:
+            self.bindings[name] = [var_type]
+        else:
+            stack.append(var_type)
 
-    def lookup_variable(self, name, line_number):
-        # You should traverse through the entire scope stack
-        for scope in reversed(self.scope_stack):
+    def set_variable_type(self, name, var_type):
+        """
+        Change the type of the innermost variable bound to name, in the
+        scope it was declared in
+        """
+        stack = self.bindings[name]
+        stack[-1] = var_type
+        for scope in reversed(self.scopes):
             if name in scope:
-                return scope[name]
-        raise ParseError("Referencing undefined variable \"" + name + "\"", line_number)
+                scope[name] = var_type
+                break
+
+    def lookup_variable(self, name, line_number):
+        stack = self.bindings.get(name)
+        if stack is None:
+            raise ParseError("Referencing undefined variable \"" + name + "\"", line_number)
+        return stack[-1]
     
     def check_variable(self, name):
-        for scope in reversed(self.scope_stack):
-            if name in scope:
-                return True
-        return False
\ No newline at end of file
+        return name in self.bindings
@@ -1,46 +1,152 @@
 #!/usr/bin/env python3
 
 import os
+import shutil
 import argparse
-import re
 from miniPythonSymbolTable import SymbolTable
 from miniPythonIRGen import IRGen
+from miniPythonOptimizer import remove_dead_functions, fuse_extends, leaf_operands
+from threeAddressCode import (EMITTERS, BLOCK_OPCODES, EXPR_OPCODES, OP_ASSIGN, OP_NE, OP_ADD, OP_SUB, OP_MUL, OP_DIV, OP_MOD, OP_POW,
+                              OP_FLOOR_DIV, OP_GT, OP_LT, OP_GE, OP_LE, OP_FDEF, OP_IF, OP_ELSE_IF, OP_WHILE, OP_FOR_RANGE,
+                              OP_FOR_IN, OP_END_LABEL, OP_PRINT, OP_RETURN, OP_CONTINUE, OP_FCALL, OP_INDEX, OP_SLICE, OP_MCALL,
+                              OP_LIST_COMP, OP_IADD,
+                              TAC, Reg, Var, StrLit, operand_key, opcode_column, operand_column)
+
+# The Java class with the operations generated code shares, which has to be
+# compiled along with it
+RUNTIME_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "runtime", "MiniPythonRuntime.java")
+
+def write_runtime(output_dir):
+    """
+    Copy the runtime class into the directory the Java classes are written to
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    shutil.copyfile(RUNTIME_SOURCE, os.path.join(output_dir, os.path.basename(RUNTIME_SOURCE)))
+
+# The runtime lists that keep elements of one primitive type unboxed
+PRIMITIVE_LISTS = {int: "IntList", float: "DoubleList", bool: "BoolList"}
+
+# Operators that give an int when used on ints
+INT_OPCODES = (OP_ADD, OP_SUB, OP_MUL, OP_MOD, OP_POW, OP_FLOOR_DIV)
+
+# Opcodes that open a loop
+LOOP_OPCODES = (OP_WHILE, OP_FOR_RANGE, OP_FOR_IN)
+
+# Operators that can be left out when their result isn't needed, since they
+# can't fail the way a division by zero does
+PURE_OPCODES = EXPR_OPCODES - {OP_DIV, OP_FLOOR_DIV, OP_MOD, OP_POW}
+
+# Comparisons a counted loop's condition can make
+COUNTED_LOOP_OPCODES = (OP_NE, OP_GT, OP_LT, OP_GE, OP_LE)
+
+# List methods that only read the list they are called on, and the ones that
+# only read the list they are given
+READ_ONLY_METHODS = ("index", "copy")
+READ_ONLY_ARG_METHODS = ("index", "extend")
+
+class JavaWriter(object):
+    """
+    Indents Java lines and terminates statements as they are written, so
+    that they can go straight to a file or any other text sink.
+    """
+    def __init__(self, sink, indents=0):
+        self.sink = sink
+        self.indents = indents
+
+    def write(self, line):
+        if line[-1] == "{":
+            self.sink.write("{}{}{}".format("    "*self.indents, line, "\n"))
+            self.indents += 1
+        elif line[-1] == "}":
+            self.indents -= 1
+            self.sink.write("{}{}{}".format("    "*self.indents, line, "\n"))
+        else:
+            self.sink.write("{}{}{}".format("    "*self.indents, line, ";\n"))
 
 class TargetGen(object):
 
     def __init__(self, IR):
         self.IR = IR
-        self.TAC_lst = IR.TAC_lst
+        self.TAC_lst = fuse_extends(IR.TAC_lst)
+        self.read_columns()
         self.regs = [None] * (IR.register_count + 1)
-        self.register_count = 0
         self.in_func_def = False
-        self.function_defs = []
-        self.target = []
+        self.out = None
         self.st = SymbolTable()
         self.fcall_statement_regs = {}
         self.mcall_statement_regs = {}
-        self.indents = 0
+        self.scan_statement_calls()
+        # The TACs of the main method and of each top level function
+        self.groups = self.split_groups()
+        # The variables kept in primitive lists in the main method and in
+        # each function, and in the code being translated, and the element
+        # each list comprehension appends, by the register holding its list
+        self.group_primitive_lists = {}
+        self.comprehension_elements = {}
+        self.scan_primitive_lists()
+        self.primitive_lists = self.group_primitive_lists[None]
+        # The variables that are never changed and never handed to code that
+        # could change them, so constant lists assigned to them can be shared,
+        # and the registers holding slices and copies that can be views of
+        # the list instead
+        self.group_shared_lists = {}
+        self.view_regs = set()
+        self.scan_list_uses()
+        self.shared_lists = self.group_shared_lists[None]
+        # The top level function being translated, or None for the main
+        # method, and the constant sequences hoisted out of each into static
+        # final fields, as lists of field types, names and values
+        self.group = None
+        self.constants = {}
+        self.constant_names = {}
+        self.constant_counts = {}
+        # Where the TAC being translated is, where each block it is in ends,
+        # where the function or main method it is in ends and where the TAC
+        # making each register is, set by translate
+        self.index = None
+        self.block_ends = {}
+        self.group_end = None
+        self.reg_defs = {}
+        # Where each register is read, and where each variable is last used
+        # or set in the main method and each function, found by translate
+        # the first time
+        self.register_reads = None
+        self.last_uses = None
+        # The declarations moved into the headers of counted loops, by where
+        # the loop starts, and the TACs not to translate: the ones left to
+        # those headers and the ones that can't be reached
+        self.loop_inits = {}
+        self.skipped = set()
+        # The StringBuilders strings are being added to in loops instead, by
+        # the variable they stand for, the variables to set from them at the
+        # end of each loop and how many the method being translated has
+        self.builders = {}
+        self.builder_ends = {}
+        self.builder_count = 0
+        # How many for loops the method being translated has, for naming the
+        # variables they declare
+        self.loop_count = 0
+        # What to write instead of each append a list comprehension makes, by
+        # where it is, and the index to read the element at for the loops of
+        # list comprehensions only one element of is used, see gen_list_comp
+        self.comp_appends = {}
+        self.comp_picks = {}
+        # Emitter for each opcode, see threeAddressCode.register_opcode
+        self.emitters = [getattr(self, emitter) for emitter in EMITTERS]
     
     # HELPER FUNCTIONS
 
     def write(self, line):
-        if self.in_func_def:
-            self.function_defs.append(line)
-        else:
-            self.target.append(line)
+        self.out.write(line)
 
-    def assign_reg(self, value):
-        self.register_count += 1
-        self.regs[self.register_count] = value
+    def assign_reg(self, reg, value):
+        self.regs[reg.number] = value
 
     def is_reg(self, value):
-        if type(value) is not str:
-            return False
-        pattern = re.compile(r"^_t(0|([1-9][0-9]*))$")
-        return pattern.match(value)
+        return type(value) is Reg
     
-    def get_reg(self, reg_str):
-        return self.regs[int(reg_str[2:])]
+    def get_reg(self, reg):
+        return self.regs[reg.number]
 
     def translate_primitives(self, prim):
         t = type(prim)
@@ -59,6 +165,31 @@ class TargetGen(object):
             return "Integer.valueOf(%s)" % (1 if bool else 0)
         raise Exception("translate_into_integer can only take in ints or bools.")
 
+    def translate_int(self, expr):
+        """
+        Translate an operand that has to be a Java int
+        """
+        t = type(expr)
+        if t == bool:
+            return "1" if expr else "0"
+        elif self.is_int(expr):
+            return self.translate_expr(expr)
+        elif t == Var and self.st.check_variable(expr) and self.st.lookup_variable(expr, -1) == bool:
+            return "({} ? 1 : 0)".format(expr)
+        return "(Integer) %s" % self.translate_expr(expr)
+
+    def translate_cast(self, var_type, expr):
+        """
+        Cast an Object expression to the Java type of a variable
+        """
+        boxed = {bool: "Boolean", int: "Integer", float: "Double"}
+        if var_type in boxed:
+            return "({}) {}".format(boxed[var_type], expr)
+        type_str = self.translate_type(var_type)
+        if type_str == "Object":
+            return expr
+        return "({}) {}".format(type_str, expr)
+
     def translate_string(self, string):
         return "%s" % string
 
@@ -68,17 +199,152 @@ class TargetGen(object):
             elems += str(self.translate_expr(seq[0]))
         for elem in seq[1:]:
             elems += ", {}".format(self.translate_expr(elem))
+        if type(seq) == tuple:
+            if self.is_constant(seq):
+                return self.hoist_constant(seq, "java.util.List", "java.util.List.of(%s)" % elems)
+            return "MiniPythonRuntime.tuple(%s)" % elems
         return "new ArrayList(Arrays.asList(%s))" % elems
 
+    def translate_read(self, expr):
+        """
+        Translate an operand that is only read, so a constant list literal
+        can be shared rather than built every time, and other list literals
+        don't need to be growable
+        """
+        if type(expr) == list:
+            elems = ", ".join(self.translate_expr(elem) for elem in expr)
+            if self.is_constant_list(expr):
+                return self.hoist_constant(expr, "java.util.List", "java.util.List.of(%s)" % elems)
+            return "Arrays.asList(%s)" % elems
+        return self.translate_expr(expr)
+
+    def is_constant(self, expr):
+        """
+        Whether an operand is a literal that can't change: a primitive, a
+        string or a tuple of those
+        """
+        t = type(expr)
+        if t == tuple:
+            return all(self.is_constant(elem) for elem in expr)
+        return t == StrLit or t in PRIMITIVE_LISTS
+
+    def is_constant_list(self, expr):
+        """
+        Whether an operand is a list literal of constants
+        """
+        return type(expr) == list and all(self.is_constant(elem) for elem in expr)
+
+    def is_constant_seq(self, expr):
+        return self.is_constant_list(expr) or (type(expr) == tuple and self.is_constant(expr))
+
+    def hoist_constant(self, expr, field_type, value):
+        """
+        The name of the private static final field holding a constant,
+        declared the first time the constant is used in the function being
+        translated. Fields are named after the top level function they are
+        used in, so that functions translated on their own don't clash.
+        """
+        key = (self.group, field_type, operand_key(expr))
+        name = self.constant_names.get(key)
+        if name is None:
+            prefix = "TUPLE" if type(expr) == tuple else "LIST"
+            if self.group is not None:
+                prefix += "_" + self.group
+            name = "%s_%d" % (prefix, self.constant_counts.get(prefix, 0))
+            self.constant_counts[prefix] = self.constant_counts.get(prefix, 0) + 1
+            self.constants.setdefault(self.group, []).append((field_type, name, value))
+            self.constant_names[key] = name
+        return name
+
+    def fold_index(self, seq, index):
+        """
+        The element of a constant sequence at a literal index, as a Java
+        expression, or None if it can't be known at compile time
+        """
+        if not self.is_constant_seq(seq) or type(index) not in (int, bool):
+            return None
+        index = int(index)
+        if -len(seq) <= index < len(seq):
+            return self.translate_expr(seq[index])
+        return None
+
     def translate_expr(self, expr):
         if self.is_reg(expr):
             return self.get_reg(expr)
-        elif type(expr) == str:
+        elif isinstance(expr, str):
             return self.translate_string(expr)
         elif type(expr) == list or type(expr) == tuple:
             return self.translate_seq(expr)
         return self.translate_primitives(expr)
 
+    def translate_type(self, expr_type):
+        if expr_type == bool:
+            return "boolean"
+        elif expr_type == int:
+            return "int"
+        elif expr_type == float:
+            return "double"
+        elif expr_type == str:
+            return "String"
+        elif expr_type == list or expr_type == tuple:
+            # Qualified, since the generated class can be named List
+            return "java.util.List"
+        elif expr_type in PRIMITIVE_LISTS.values():
+            return "MiniPythonRuntime." + expr_type
+        return "Object"
+
+    def scalar_type(self, operand, scalars):
+        """
+        The primitive type of an operand, if it is known to have one
+        """
+        t = type(operand)
+        if t in PRIMITIVE_LISTS:
+            return t
+        elif t == Var:
+            return scalars.get(operand)
+        elif t == Reg:
+            return_type = self.IR.register_types.get(operand)
+            if return_type in PRIMITIVE_LISTS:
+                return return_type
+        return None
+
+    def element_type(self, operand, scalars, lists):
+        """
+        The primitive type of all the elements of a list operand, if they
+        are known to have the same one
+        """
+        t = type(operand)
+        if t == list or t == tuple:
+            types = set(self.scalar_type(elem, scalars) for elem in operand)
+            if len(types) == 1:
+                return types.pop()
+        elif t == Var:
+            return lists.get(operand)
+        elif t == Reg and operand in self.comprehension_elements:
+            return self.expression_type(self.comprehension_elements[operand], scalars)
+        return None
+
+    def expression_type(self, operand, scalars):
+        """
+        The primitive type of an operand, if it is known to have one,
+        including int arithmetic on ints
+        """
+        tac = self.reg_def(operand)
+        if tac is not None and tac.opcode in INT_OPCODES:
+            # Unary operations have no right operand
+            args = [arg for arg in (tac.left_operand, tac.right_operand) if arg is not None]
+            return int if all(self.expression_type(arg, scalars) == int for arg in args) else None
+        return self.scalar_type(operand, scalars)
+
+    def primitive_list(self, operand):
+        """
+        The runtime list class a variable is kept in, if it is a primitive
+        list
+        """
+        if type(operand) == Var:
+            return self.primitive_lists.get(operand)
+        return None
+
     def translate_operator(self, op):
         if op == "or":
             return "||"
@@ -103,26 +369,71 @@ class TargetGen(object):
 
     def gen_assign_stmnt(self, tac):
         assignment_str = ""
+
+        widened = (self.group, tac.result) in self.IR.float_variables
+        if type(tac.left_operand) == int and not self.st.check_variable(tac.result) and not widened:
+            start = self.counted_loop_after(tac.result)
+            if start is not None:
+                # Declared in the loop's header instead
+                self.loop_inits[start] = (tac.result, "int {} = {}".format(tac.result, tac.left_operand))
+                return
+
+        if tac.result in self.builders:
+            # Adding to a string in a loop
+            operands = self.concat_operands(tac.left_operand)[1:]
+            appends = "".join(".append({})".format(self.translate_expr(operand)) for operand in operands)
+            self.write(self.builders[tac.result] + appends)
+            return
+
+        compound = self.compound_assignment(tac)
+        if compound is not None:
+            self.write(compound)
+            return
         
-        if self.is_reg(tac.left_operand):
-            expr_type = object
-            type_str = "Object"
+        if tac.result in self.primitive_lists:
+            expr = tac.left_operand
+            expr_type = self.primitive_lists[tac.result]
+            type_str = self.translate_type(expr_type)
+            if type(expr) == Var or self.is_reg(expr):
+                # Another such list, or a list comprehension
+                expr_str = self.translate_expr(expr)
+            else:
+                # Elements can also be variables and registers, such as
+                # calls returning the same type
+                elems = ", ".join(self.translate_expr(elem) for elem in expr)
+                expr_str = "{}.of({})".format(type_str, elems)
+                if tac.result in self.shared_lists and self.is_constant_list(expr):
+                    expr_str = self.hoist_constant(expr, type_str, expr_str)
+        elif self.is_reg(tac.left_operand):
+            # Only function calls have a known type
+            expr_type = self.IR.register_types.get(tac.left_operand, object)
+            type_str = self.translate_type(expr_type)
             expr_str = self.get_reg(tac.left_operand)
         else:
             expr = tac.left_operand
             expr_type = type(expr)
-            if expr_type == bool:
-                type_str = "boolean"
-            elif expr_type == int:
-                type_str = "int"
-            elif expr_type == float:
-                type_str = "double"
-            elif expr_type == str:
-                type_str = "String"
-            elif expr_type == list or expr_type == tuple:
-                type_str = "ArrayList"
-            expr_str = self.translate_expr(expr)
+            if expr_type == Var:
+                # Copying another variable, which has the type it was declared with
+                if self.st.check_variable(expr):
+                    expr_type = self.st.lookup_variable(expr, -1)
+                else:
+                    expr_type = object
+            elif expr_type == StrLit:
+                expr_type = str
+            if expr_type in PRIMITIVE_LISTS.values():
+                # A copy of a primitive list into a variable that can hold
+                # any list
+                expr_type = list
+            type_str = self.translate_type(expr_type)
+            if tac.result in self.shared_lists:
+                expr_str = self.translate_read(expr)
+            else:
+                expr_str = self.translate_expr(expr)
         
+        if widened and expr_type in (int, bool):
+            # Given a float later on
+            expr_type = float
+            type_str = self.translate_type(expr_type)
         if self.st.check_variable(tac.result):
             assignment_str = "{} = {}".format(tac.result, expr_str)
         else:
@@ -130,30 +441,64 @@ class TargetGen(object):
             assignment_str = "{} {} = {}".format(type_str, tac.result, expr_str)
         self.write(assignment_str)
         
+    def compound_assignment(self, tac):
+        """
+        An assignment that updates a number or string variable with an
+        operation on itself, as a Java compound assignment such as i += 2 or
+        i++, or None if it isn't one
+        """
+        operation = self.reg_def(tac.left_operand)
+        if operation is None or operation.right_operand is None or not self.st.check_variable(tac.result):
+            return None
+        elif type(operation.left_operand) != Var or operation.left_operand != tac.result:
+            return None
+
+        var_type = self.st.lookup_variable(tac.result, -1)
+        if var_type == int:
+            opcodes = (OP_ADD, OP_SUB, OP_MUL)
+        elif var_type == float:
+            opcodes = (OP_ADD, OP_SUB, OP_MUL, OP_DIV)
+        elif var_type == str:
+            opcodes = (OP_ADD,)
+        else:
+            return None
+        if operation.opcode not in opcodes:
+            return None
+
+        right = operation.right_operand
+        if var_type == int and type(right) == int and right == 1 and operation.opcode != OP_MUL:
+            return tac.result + ("++" if operation.opcode == OP_ADD else "--")
+        return "{} {}= {}".format(tac.result, operation.operator, self.translate_expr(right))
+
     # END HELPERS
 
     def gen_unary_op(self, tac):
         op = self.translate_operator(tac.operator)
         operand = self.translate_expr(tac.left_operand)
         if op == "!":
-            expr = "({} (Boolean) ({}))".format(op, operand)
+            expr = "(! MiniPythonRuntime.truthy({}))".format(operand)
         else:
             expr = "({} ({}))".format(op, operand)
-        self.assign_reg(expr)
+        self.assign_reg(tac.result, expr)
 
     def gen_bin_op(self, tac):
         op = self.translate_operator(tac.operator)
         left = self.translate_expr(tac.left_operand)
         right = self.translate_expr(tac.right_operand)
         if op == "**":
-            expr = "Math.pow({}, {})".format(left, right)
+            expr = "MiniPythonRuntime.pow({}, {})".format(left, right)
+        elif op == "/" and self.is_int(tac.left_operand) and self.is_int(tac.right_operand):
+            # Java would divide ints to an int
+            expr = "((double) ({}) / ({}))".format(left, right)
         elif op == "//":
-            expr = "Math.floor(({}) / ({}))".format(left, right)
+            expr = "MiniPythonRuntime.floorDiv({}, {})".format(left, right)
+        elif op == "%":
+            expr = "MiniPythonRuntime.mod({}, {})".format(left, right)
         elif op == "&&" or op == "||":
-            expr = "(Boolean) (((Boolean) {}) {} ((Boolean) {}))".format(left, op, right)
+            expr = "(MiniPythonRuntime.truthy({}) {} MiniPythonRuntime.truthy({}))".format(left, op, right)
         else:
             expr = "(({}) {} ({}))".format(left, op, right)
-        self.assign_reg(expr)
+        self.assign_reg(tac.result, expr)
     
     def gen_func_def(self, tac):
         self.in_func_def = True
@@ -166,8 +511,12 @@ class TargetGen(object):
             params_str += "Object " + params[0]
             for param in params[1:]:
                 params_str += ", Object " + param
+        for param in params:
+            # Assigned to rather than declared again
+            self.st.declare_variable(param, object, -1)
 
-        self.write("static Object %s(%s) {" % (tac.left_operand, params_str))
+        return_type = self.translate_type(self.IR.return_types.get(tac.left_operand))
+        self.write("static %s %s(%s) {" % (return_type, tac.left_operand, params_str))
 
     def gen_ret_stmnt(self, tac):
         if tac.left_operand is None:
@@ -177,36 +526,40 @@ class TargetGen(object):
         self.write(stmnt)
 
     def gen_seq_index(self, tac):
-        lst = self.translate_expr(tac.left_operand)
+        folded = self.fold_index(tac.left_operand, tac.right_operand)
+        if folded is not None:
+            self.assign_reg(tac.result, folded)
+            return
+        lst = self.translate_read(tac.left_operand)
         index = self.translate_into_integer(tac.right_operand)
-        expr = "{}.get({})".format(lst, index)
-        self.assign_reg(expr)
-
-    def gen_seq_slice(self, tac):
-        lst = self.translate_expr(tac.left_operand)
-
-        if tac.right_operand[0] is None:
-            start = "0"
+        if self.primitive_list(tac.left_operand):
+            expr = "{}.item({})".format(lst, index)
         else:
-            start = self.translate_into_integer(tac.right_operand[0])
+            expr = "MiniPythonRuntime.get({}, {})".format(lst, index)
+        self.assign_reg(tac.result, expr)
 
-        if tac.right_operand[1] is None:
-            end = "{}.size()".format(lst)
-        else:
-            end = self.translate_into_integer(tac.right_operand[1])
-
-        if tac.right_operand[2] is None:
-            expr = "{}.subList({}, {})".format(lst, start, end)
+    def gen_seq_slice(self, tac):
+        lst = self.translate_read(tac.left_operand)
+        bounds = []
+        for bound in tac.right_operand:
+            # Bounds that are left out are passed as null
+            bounds.append("null" if bound is None else self.translate_into_integer(bound))
+        if tac.result in self.view_regs:
+            expr = "MiniPythonRuntime.sliceView({}, {}, {}, {})".format(lst, *bounds)
+        elif self.primitive_list(tac.left_operand):
+            expr = "{}.slice({}, {}, {})".format(lst, *bounds)
         else:
-            step = self.translate_into_integer(tac.right_operand[2])
-            expr = "step_method({}, {}, {}, {})".format(lst, start, end, step)
-        
-        self.assign_reg(expr)
+            expr = "MiniPythonRuntime.slice({}, {}, {}, {})".format(lst, *bounds)
+        self.assign_reg(tac.result, expr)
         
     def gen_func_call(self, tac):
-        if tac.left_operand == "len":
+        if tac.left_operand == "len" and self.is_constant_seq(tac.right_operand[0]):
+            # Known at compile time, and nothing to run as a statement
+            self.assign_reg(tac.result, str(len(tac.right_operand[0])))
+            return
+        elif tac.left_operand == "len":
             # List and tuple `len` function call
-            expr = "{}.size()".format(self.translate_expr(tac.right_operand[0]))
+            expr = "{}.size()".format(self.translate_read(tac.right_operand[0]))
         else:
             # General function call
             expr = "{}(".format(tac.left_operand)
@@ -216,15 +569,38 @@ class TargetGen(object):
                 expr += ", {}".format(self.translate_expr(arg))
             expr += ")"
 
-        self.assign_reg(expr)
+        self.assign_reg(tac.result, expr)
         if tac.result in self.fcall_statement_regs:
             self.write(expr)
 
     def gen_seq_method_call(self, tac):
-        lst = self.translate_expr(tac.right_operand[0])
+        append = self.comp_appends.pop(self.index, None)
+        if append is not None:
+            self.write(append.format(self.translate_expr(tac.right_operand[1])))
+            return
+        if tac.left_operand in READ_ONLY_METHODS:
+            lst = self.translate_read(tac.right_operand[0])
+        else:
+            lst = self.translate_expr(tac.right_operand[0])
+        if tac.result in self.view_regs:
+            # A copy that is only read can be the list itself
+            self.assign_reg(tac.result, lst)
+            return
         expr = "{}.".format(lst)
 
-        if tac.left_operand == "append":
+        if self.primitive_list(tac.right_operand[0]):
+            # The runtime's primitive lists have methods named after Python's
+            if tac.left_operand == "insert":
+                expr += "insert((int)"
+            elif tac.left_operand == "pop" and len(tac.right_operand[1:]) > 0:
+                expr += "pop((int)"
+            elif tac.left_operand == "extend":
+                expr += "addAll("
+            elif tac.left_operand == "index":
+                expr += "indexOf("
+            else:
+                expr += tac.left_operand + "("
+        elif tac.left_operand == "append":
             expr += "add("
         elif tac.left_operand == "extend":
             expr += "addAll("
@@ -238,26 +614,28 @@ class TargetGen(object):
             else:
                 expr += "remove("
         elif tac.left_operand == "copy":
-            expr += "clone("
+            expr = "new ArrayList({}".format(lst)
         
-        if len(tac.right_operand[1:]) > 0:
+        if len(tac.right_operand[1:]) > 0 and tac.left_operand in READ_ONLY_ARG_METHODS:
+            expr += "{}".format(self.translate_read(tac.right_operand[1]))
+        elif len(tac.right_operand[1:]) > 0:
             expr += "{}".format(self.translate_expr(tac.right_operand[1]))
 
         for arg in tac.right_operand[2:]:
             expr += ", {}".format(self.translate_expr(arg))
 
         expr += ")"
-        self.assign_reg(expr)
+        self.assign_reg(tac.result, expr)
 
         if tac.result in self.mcall_statement_regs:
             self.write(expr)
 
     def gen_if_stmnt(self, tac):
-        self.write("if ((Boolean) %s) {" % (self.translate_expr(tac.left_operand)))
+        self.write("if (MiniPythonRuntime.truthy(%s)) {" % (self.translate_expr(tac.left_operand)))
         self.st.push_scope()
     
     def gen_else_if_stmnt(self, tac):
-        self.write("else if ((Boolean) %s) {" % (self.translate_expr(tac.left_operand)))
+        self.write("else if (MiniPythonRuntime.truthy(%s)) {" % (self.translate_expr(tac.left_operand)))
         self.st.push_scope()
         
     def gen_else_stmnt(self, tac):
@@ -265,130 +643,965 @@ class TargetGen(object):
         self.st.push_scope()
         
     def gen_while_stmnt(self, tac):
-        self.write("while (%s) {" % (self.translate_expr(tac.left_operand)))
+        end = self.block_ends[self.index]
+        self.open_string_builders(end, tac.left_operand)
+        counter, init = self.loop_inits.pop(self.index, (None, ""))
+        loop = self.counted_loop(self.index, counter)
+        if loop is None:
+            self.write("while (MiniPythonRuntime.truthy(%s)) {" % (self.translate_expr(tac.left_operand)))
+            self.st.push_scope()
+            return
+
+        name, step = loop
+        if step.right_operand == 1:
+            update = name + ("++" if step.opcode == OP_ADD else "--")
+        else:
+            update = "{} {}= {}".format(name, step.operator, self.translate_expr(step.right_operand))
+        self.write("for ({}; {}; {}) {{".format(init, self.translate_expr(tac.left_operand), update))
+        self.st.push_scope()
+        if init:
+            self.st.declare_variable(name, int, -1)
+        # The update is made by the header
+        self.skipped.add(end - 1)
+
+    def gen_for_range_stmnt(self, tac):
+        end = self.block_ends[self.index]
+        self.open_string_builders(end, tac.right_operand)
+        start, stop, step = tac.right_operand
+        number = self.loop_count
+        self.loop_count += 1
+
+        # range() works out its bounds once, so one that could change or
+        # costs something to work out is kept in a variable
+        stop_str = self.translate_int(stop)
+        if not self.loop_invariant_int(stop, end):
+            self.write("int stop${} = {}".format(number, stop_str))
+            stop_str = "stop$%d" % number
+        step_value = int(step) if type(step) in (int, bool) else None
+        step_str = self.translate_int(step)
+        if not self.loop_invariant_int(step, end):
+            self.write("int step${} = {}".format(number, step_str))
+            step_str = "step$%d" % number
+
+        # The loop counts in the variable itself unless it outlives the loop
+        # or is set in the body, which must not change what comes next
+        name = tac.result
+        if self.st.check_variable(name) or self.assigned_in(name, self.index, end):
+            counter = "index$%d" % number
+        else:
+            counter = name
+        if step_value is None:
+            cond = "({0} > 0 ? {1} < {2} : {1} > {2})".format(step_str, counter, stop_str)
+        else:
+            cond = "{} {} {}".format(counter, "<" if step_value > 0 else ">", stop_str)
+        if step_value == 1:
+            update = counter + "++"
+        elif step_value == -1:
+            update = counter + "--"
+        else:
+            update = "{} += {}".format(counter, step_str)
+        self.write("for (int {} = {}; {}; {}) {{".format(counter, self.translate_int(start), cond, update))
         self.st.push_scope()
+        if counter == name:
+            self.st.declare_variable(name, int, -1)
+        else:
+            self.assign_loop_variable(name, counter, int)
+
+    def gen_for_in_stmnt(self, tac):
+        end = self.block_ends[self.index]
+        self.open_string_builders(end, tac.left_operand)
+        seq = tac.left_operand
+        name = tac.result
+        number = self.loop_count
+        self.loop_count += 1
+
+        lst = self.translate_iterable(seq)
+        list_class = self.primitive_list(seq)
+
+        pick = self.comp_picks.pop(self.index, None)
+        if pick is not None:
+            # Only the element at pick is used, so it is all that is worked out
+            self.write("{")
+            self.st.push_scope()
+            if list_class is None:
+                self.assign_loop_variable(name, "MiniPythonRuntime.get({}, {})".format(lst, self.translate_int(pick)), object)
+            else:
+                item_type = next(t for t, c in PRIMITIVE_LISTS.items() if c == list_class)
+                self.assign_loop_variable(name, "{}.item({})".format(lst, self.translate_int(pick)), item_type)
+            return
+
+        if list_class is None and not self.may_change_lists(self.index, end):
+            # Nothing in the body can change the list, so it can't tell
+            # an iterator from Python's
+            if self.st.check_variable(name) or self.assigned_in(name, self.index, end):
+                item = "item$%d" % number
+            else:
+                item = name
+            self.write("for (Object {} : {}) {{".format(item, lst))
+            self.st.push_scope()
+            if item == name:
+                self.st.declare_variable(name, object, -1)
+            else:
+                self.assign_loop_variable(name, item, object)
+            return
+
+        # Otherwise by index, which like Python sees the changes the body
+        # makes, and for a primitive list reads the elements without boxing
+        if type(seq) != Var or self.assigned_in(seq, self.index, end):
+            # The loop goes over the list it started with
+            seq_type = list_class or list
+            self.write("{} seq${} = {}".format(self.translate_type(seq_type), number, lst))
+            lst = "seq$%d" % number
+        index = "index$%d" % number
+        self.write("for (int {0} = 0; {0} < {1}.size(); {0}++) {{".format(index, lst))
+        self.st.push_scope()
+        if list_class is None:
+            self.assign_loop_variable(name, "{}.get({})".format(lst, index), object)
+        elif self.assigned_in(name, self.index, end):
+            # The body can set it to anything
+            self.assign_loop_variable(name, "{}.item({})".format(lst, index), object)
+        else:
+            item_type = next(t for t, c in PRIMITIVE_LISTS.items() if c == list_class)
+            self.assign_loop_variable(name, "{}.item({})".format(lst, index), item_type)
+
+    def gen_list_comp(self, tac):
+        """
+        Start the list a list comprehension builds, sized for every element
+        of what it loops over. A comprehension that is only given to len()
+        counts its elements instead, or isn't looped over at all when they
+        all count, and one that is only indexed works out just that element.
+        """
+        loop_index = self.index + 1
+        loop = self.TAC_lst[loop_index]
+        end = self.block_ends[loop_index]
+        filtered = self.TAC_lst[end - 1].opcode == OP_END_LABEL
+        append_index = end - 2 if filtered else end - 1
+        element = self.TAC_lst[append_index].right_operand[1]
+        number = self.loop_count
+        self.loop_count += 1
+        name = "comp$%d" % number
+
+        if loop.opcode == OP_FOR_RANGE or self.primitive_list(loop.left_operand) == "IntList":
+            counter = loop.result
+        else:
+            counter = None
+        uses = self.register_uses(tac.result, end)
+        use = self.TAC_lst[uses[0]] if len(uses) == 1 and self.is_pure(element) else None
+
+        if use is not None and use.opcode == OP_FCALL and use.left_operand == "len":
+            length = None if filtered else self.comprehension_length(loop)
+            self.skipped.add(uses[0])
+            if length is not None:
+                self.skipped.update(range(loop_index, end + 1))
+                self.assign_reg(use.result, length)
+                return
+            self.write("int {} = 0".format(name))
+            self.comp_appends[append_index] = name + "++"
+            self.assign_reg(use.result, name)
+            return
+        elif (use is not None and use.opcode == OP_INDEX and use.left_operand == tac.result and not filtered
+                and loop.opcode == OP_FOR_IN and self.is_pure(use.right_operand)):
+            self.skipped.add(uses[0])
+            self.write("{} {}".format("int" if self.is_int(element, counter) else "Object", name))
+            self.comp_picks[loop_index] = use.right_operand
+            self.comp_appends[append_index] = name + " = {}"
+            self.assign_reg(use.result, name)
+            return
+
+        seq = loop.left_operand
+        if loop.opcode == OP_FOR_IN and type(seq) == Reg:
+            # Worked out once, for both the size and the loop
+            source = self.reg_def(seq)
+            expr = self.get_reg(seq)
+            if (self.IR.register_types.get(seq) not in (list, tuple) and source.opcode not in (OP_SLICE, OP_LIST_COMP)
+                    and not (source.opcode == OP_MCALL and source.left_operand == "copy")):
+                expr = "(java.util.List) " + expr
+            self.write("java.util.List source${} = {}".format(number, expr))
+            self.assign_reg(seq, "source$%d" % number)
+        length = self.comprehension_length(loop)
+        # Only a list assigned to a variable kept in a primitive list is
+        # known never to be given an element of another type
+        target = self.TAC_lst[uses[0]] if len(uses) == 1 else None
+        list_class = self.primitive_lists.get(target.result) if target is not None and target.opcode == OP_ASSIGN else None
+        if list_class is not None:
+            self.write("MiniPythonRuntime.{0} {1} = new MiniPythonRuntime.{0}({2})".format(list_class, name, length or 0))
+            self.comp_appends[append_index] = name + ".append({})"
+        else:
+            self.write("java.util.List {} = new ArrayList({})".format(name, length or ""))
+            self.comp_appends[append_index] = name + ".add({})"
+        self.assign_reg(tac.result, name)
+
+    def gen_in_place_add(self, tac):
+        value = self.translate_expr(tac.right_operand)
+        var_type = self.st.lookup_variable(tac.result, -1)
+        if var_type in (int, float, str):
+            # Such as a loop variable over a primitive list
+            self.write("{} += {}".format(tac.result, value))
+        elif var_type == tuple:
+            self.write("{0} = MiniPythonRuntime.concat({0}, {1})".format(tac.result, value))
+        else:
+            self.write("{0} = MiniPythonRuntime.iadd({0}, {1})".format(tac.result, value))
 
     def gen_end_label(self, tac):
         self.st.pop_scope()
         self.write("}")
+        for name in self.builder_ends.pop(self.index, []):
+            self.write("{} = {}.toString()".format(name, self.builders.pop(name)))
         if self.st.get_scope() == 1:
             self.in_func_def = False
 
+    def gen_break_stmnt(self, tac):
+        self.write("break")
+        self.skip_unreachable()
+
+    def gen_continue_stmnt(self, tac):
+        self.write("continue")
+        self.skip_unreachable()
+
     def gen_print_statement(self, tac):
-        self.write("System.out.println(" + self.translate_expr(tac.left_operand) + ")")
-
-    def create_step_method(self, lst):
-        lst.append("static ArrayList step_method(ArrayList lst, int p_start, int p_end, int step) {")
-        lst.append("ArrayList return_lst = new ArrayList()")
-        lst.append("if (step == 0) {")
-        lst.append('throw new IllegalArgumentException("step_method() cannot have step param be 0!")')
-        lst.append("}")
-        lst.append("int start = p_start")
-        lst.append("int end = p_end")
-        lst.append("if (start < 0) {")
-        lst.append("start = lst.size() - p_start")
-        lst.append("}")
-        lst.append("if (end < 0) {")
-        lst.append("end = lst.size() - p_end")
-        lst.append("}")
-        lst.append("if (step > 0) {")
-        lst.append("for (int index = start; index < end; index += step) {")
-        lst.append("return_lst.add(lst.get(index))")
-        lst.append("}")
-        lst.append("}")
-        lst.append("else {")
-        lst.append("for (int index = start; index > end; index += step) {")
-        lst.append("return_lst.add(lst.get(index))")
-        lst.append("}")
-        lst.append("}")
-        lst.append("return return_lst")
-        lst.append("}")
+        self.write("MiniPythonRuntime.print(" + self.translate_read(tac.left_operand) + ")")
 
-    def generate(self, tac):
-        if tac.operator is None:
-            # Assignment
-            self.gen_assign_stmnt(tac)
-        elif tac.operator in ["and", "or", "not", "==", "!=", "+", "-", "*", "/", "%", "**", "//", ">", "<", ">=", "<="]:
-            if tac.right_operand is not None:
-                # Binary operation
-                self.gen_bin_op(tac)
-            else:
-                # Unary Operation
-                self.gen_unary_op(tac)
-        elif tac.operator == "fdef":
-            self.gen_func_def(tac)
-        elif tac.operator == "if":
-            self.gen_if_stmnt(tac)
-        elif tac.operator == "else-if":
-            self.gen_else_if_stmnt(tac)
-        elif tac.operator == "else":
-            self.gen_else_stmnt(tac)
-        elif tac.operator == "while":
-            self.gen_while_stmnt(tac)
-        elif tac.operator == "end-label":
-            self.gen_end_label(tac)
-        elif tac.operator == "print":
-            self.gen_print_statement(tac)
-        elif tac.operator == "return":
-            self.gen_ret_stmnt(tac)
-        elif tac.operator == "fcall":
-            self.gen_func_call(tac)
-        elif tac.operator == "index":
-            self.gen_seq_index(tac)
-        elif tac.operator == "slice":
-            self.gen_seq_slice(tac)
-        elif tac.operator == "mcall":
-            self.gen_seq_method_call(tac)
+    def gen_operation(self, tac):
+        if tac.right_operand is not None:
+            self.gen_bin_op(tac)
         else:
+            self.gen_unary_op(tac)
+
+    def generate(self, tac):
+        if tac.opcode is None:
             raise Exception("Unrecognized operator found: " + tac.operator)
+        self.emitters[tac.opcode](tac)
     
-    def format_lines(self, lines):
-        for i in range(len(lines)):
-            line = lines[i]
-            if line[-1] == "{":
-                lines[i] = "{}{}{}".format("    "*self.indents, line, "\n")
-                self.indents += 1
-            elif line[-1] == "}":
-                self.indents -= 1
-                lines[i] = "{}{}{}".format("    "*self.indents, line, "\n")
-            else:
-                lines[i] = "{}{}{}".format("    "*self.indents, line, ";\n")
+    def scan_statement_calls(self):
+        # For knowing which function calls are standalone statements, rather
+        # than giving a value used later
+        for index, opcode in enumerate(self.opcodes):
+            for operand, _ in self.operand_uses(index):
+                for leaf in leaf_operands(operand):
+                    if type(leaf) == Reg:
+                        self.fcall_statement_regs.pop(leaf, None)
+                        self.mcall_statement_regs.pop(leaf, None)
+            if opcode == OP_FCALL:
+                self.fcall_statement_regs[self.results[index]] = None
+            elif opcode == OP_MCALL:
+                self.mcall_statement_regs[self.results[index]] = None
+
+    def read_columns(self):
+        """
+        Read the opcode and operands of every TAC into columns, which are
+        indexed instead of making a TAC object for each TAC looked at
+        """
+        self.register_reads = None
+        self.opcodes = opcode_column(self.TAC_lst)
+        self.results = operand_column(self.TAC_lst, "result")
+        self.left_operands = operand_column(self.TAC_lst, "left_operand")
+        self.right_operands = operand_column(self.TAC_lst, "right_operand")
+
+    def split_groups(self):
+        """
+        Split the TACs into the ones of the main method and the ones of each
+        top level function, since they are translated separately, as lists
+        of where they are
+        """
+        groups = {None: []}
+        depth = 0
+        function_depth = None
+        group = groups[None]
+        for index, opcode in enumerate(self.opcodes):
+            if opcode == OP_FDEF and function_depth is None:
+                function_depth = depth
+                group = groups.setdefault(self.left_operands[index], [])
+            group.append(index)
+            if opcode in BLOCK_OPCODES:
+                depth += 1
+            elif opcode == OP_END_LABEL:
+                depth -= 1
+                if depth == function_depth:
+                    function_depth = None
+                    group = groups[None]
+        return groups
+
+    def scan_primitive_lists(self):
+        """
+        Find the variables that can be kept in the runtime's primitive lists,
+        in the main method and in each function
+        """
+        # The scan reads what the registers of comprehension elements hold
+        self.match_blocks()
+        for name, indices in self.groups.items():
+            params = []
+            assignments = []
+            method_calls = []
+            # The variables whose lists other code gets hold of, which could
+            # put elements of any type in them
+            escaped = set()
+            for index in indices:
+                opcode = self.opcodes[index]
+                result = self.results[index]
+                left = self.left_operands[index]
+                right = self.right_operands[index]
+                for operand, _ in self.operand_uses(index):
+                    if type(operand) == list or type(operand) == tuple:
+                        # Put in another sequence
+                        escaped.update(leaf for leaf in leaf_operands(operand) if type(leaf) == Var)
+                if opcode == OP_FCALL and left != "len":
+                    escaped.update(leaf for leaf in leaf_operands(right) if type(leaf) == Var)
+                elif opcode == OP_RETURN and type(left) == Var:
+                    escaped.add(left)
+                elif opcode == OP_MCALL and left in ("append", "insert") and type(right[-1]) == Var:
+                    escaped.add(right[-1])
+                if opcode == OP_FDEF:
+                    params.extend(right)
+                elif opcode == OP_ASSIGN:
+                    assignments.append(self.TAC_lst[index])
+                elif opcode == OP_FOR_RANGE:
+                    # The loop variable only ever holds ints
+                    assignments.append(TAC(result, None, 0))
+                elif opcode == OP_FOR_IN:
+                    # Nothing is known about the elements
+                    params.append(result)
+                elif opcode == OP_MCALL and type(right[0]) == Var:
+                    method_calls.append(self.TAC_lst[index])
+                elif opcode == OP_MCALL and self.builds_comprehension(right):
+                    self.comprehension_elements[right[0]] = right[1]
+            self.group_primitive_lists[name] = self.find_primitive_lists(params, assignments, method_calls, escaped)
+
+    def scan_list_uses(self):
+        """
+        Find, in the main method and in each function, the variables that
+        are never changed or handed on: copied into another variable, put in
+        a sequence, passed to a function or returned. Names are not told
+        apart by scope, so a variable only counts if every one with its name
+        does. Constant lists assigned to such variables can share one copy.
+
+        Slices and copies can be views of their list, or the list itself, if
+        they are only read right where they are made, or are assigned to such
+        a variable and made from another such variable or a constant.
+        """
+        for name, indices in self.groups.items():
+            constant = set()
+            handed_on = set()
+            # The list each slice or copy is made from, and where each of
+            # those registers is used, along with whether it is only read
+            sources = {}
+            reg_uses = {}
+            for index in indices:
+                opcode = self.opcodes[index]
+                left = self.left_operands[index]
+                if opcode == OP_ASSIGN and self.is_constant_list(left):
+                    constant.add(self.results[index])
+                elif opcode == OP_SLICE or (opcode == OP_MCALL and left == "copy"):
+                    sources[self.results[index]] = left if opcode == OP_SLICE else self.right_operands[index][0]
+                # Lists given to a method that changes a list might be the
+                # one being changed
+                changing = opcode == OP_MCALL and left not in READ_ONLY_METHODS
+                for operand, read in self.operand_uses(index):
+                    if read and type(operand) == Var:
+                        continue
+                    elif read and type(operand) == Reg:
+                        # A loop's body runs after a slice it goes over is
+                        # made, and could change the list it was made from
+                        reg_uses.setdefault(operand, []).append((index, not changing and opcode != OP_FOR_IN))
+                        continue
+                    for leaf in leaf_operands(operand):
+                        if type(leaf) == Var:
+                            handed_on.add(leaf)
+                        elif type(leaf) == Reg:
+                            reg_uses.setdefault(leaf, []).append((index, False))
+            self.group_shared_lists[name] = constant - handed_on
+
+            for reg, source in sources.items():
+                if type(source) == Var:
+                    unchanged = source not in handed_on
+                else:
+                    unchanged = self.is_constant_seq(source)
+                if all(read or (unchanged and self.opcodes[index] == OP_ASSIGN and self.results[index] not in handed_on)
+                       for index, read in reg_uses.get(reg, [])):
+                    self.view_regs.add(reg)
+
+    def operand_uses(self, index):
+        """
+        The operands of the TAC at index, each along with whether it is only
+        read there, rather than changed or kept somewhere
+        """
+        opcode = self.opcodes[index]
+        left_operand = self.left_operands[index]
+        right_operand = self.right_operands[index]
+        if opcode == OP_ASSIGN:
+            return [(left_operand, False)]
+        elif opcode in EXPR_OPCODES:
+            return [(left_operand, True), (right_operand, True)]
+        elif opcode in (OP_IF, OP_ELSE_IF, OP_WHILE, OP_PRINT, OP_INDEX):
+            return [(left_operand, True), (right_operand, True)]
+        elif opcode == OP_FOR_RANGE:
+            return [(bound, True) for bound in right_operand]
+        elif opcode == OP_FOR_IN:
+            return [(left_operand, True)]
+        elif opcode == OP_IADD:
+            # Only the elements of a sequence added are kept
+            return [(left_operand, False), (right_operand, True)]
+        elif opcode == OP_SLICE:
+            return [(left_operand, True)] + [(bound, True) for bound in right_operand]
+        elif opcode == OP_FCALL:
+            return [(arg, left_operand == "len") for arg in right_operand]
+        elif opcode == OP_MCALL:
+            receiver = right_operand[0]
+            args = right_operand[1:]
+            return ([(receiver, left_operand in READ_ONLY_METHODS)] +
+                    [(arg, left_operand in READ_ONLY_ARG_METHODS) for arg in args])
+        elif opcode == OP_FDEF:
+            return []
+        return [(left_operand, False)]
+
+    def find_primitive_lists(self, params, assignments, method_calls, escaped):
+        """
+        The variables among the given TACs that are only ever assigned lists
+        whose elements all have the same primitive type, or other such
+        variables, and are never given an element of another type. A list
+        that escaped, or is copied into a variable that isn't kept in the
+        same kind of list, could be given anything through the other
+        reference, so it isn't kept in one either. Names are not told apart
+        by scope, so a name is only kept in a primitive list if every
+        variable with that name can be.
+        """
+        values = {}
+        for tac in assignments:
+            values.setdefault(tac.result, []).append(tac.left_operand)
+
+        # Variables only ever assigned literals of one primitive type
+        scalars = {}
+        for name, assigned in values.items():
+            types = set(type(value) for value in assigned)
+            if len(types) == 1 and name not in params:
+                value_type = types.pop()
+                if value_type in PRIMITIVE_LISTS:
+                    scalars[name] = value_type
+
+        lists = {}
+        for name, assigned in values.items():
+            if name not in params and name not in escaped and (type(assigned[0]) == list or type(assigned[0]) == Reg):
+                element_type = self.element_type(assigned[0], scalars, lists)
+                if element_type is not None:
+                    lists[name] = element_type
+        # Then the variables the lists are copied into
+        changed = True
+        while changed:
+            changed = False
+            for name, assigned in values.items():
+                if name not in lists and name not in params and name not in escaped and type(assigned[0]) == Var:
+                    element_type = lists.get(assigned[0])
+                    if element_type is not None:
+                        lists[name] = element_type
+                        changed = True
+
+        changed = True
+        while changed:
+            changed = False
+            for name in list(lists):
+                element_type = lists[name]
+                if any(self.element_type(value, scalars, lists) != element_type for value in values[name]):
+                    del lists[name]
+                    changed = True
+            for tac in assignments:
+                # Both names have to hold the same kind of list
+                source = tac.left_operand
+                if type(source) == Var and source in lists and lists.get(tac.result) != lists[source]:
+                    del lists[source]
+                    changed = True
+            for tac in method_calls:
+                name = tac.right_operand[0]
+                if name not in lists:
+                    continue
+                element_type = lists[name]
+                args = tac.right_operand[1:]
+                if tac.left_operand == "append":
+                    kept = self.scalar_type(args[0], scalars) == element_type
+                elif tac.left_operand == "insert":
+                    kept = self.scalar_type(args[1], scalars) == element_type
+                elif tac.left_operand == "extend":
+                    kept = self.element_type(args[0], scalars, lists) == element_type
+                else:
+                    kept = True
+                if not kept:
+                    del lists[name]
+                    changed = True
+
+        return dict((name, PRIMITIVE_LISTS[element_type]) for name, element_type in lists.items())
+
+    def assign_loop_variable(self, name, value, value_type):
+        """
+        Set the variable of the for loop being translated to the element the
+        loop is at, at the start of its body, where it is declared unless it
+        outlives the loop
+        """
+        if self.st.check_variable(name):
+            if value_type == object:
+                value = self.translate_cast(self.st.lookup_variable(name, -1), value)
+            self.write("{} = {}".format(name, value))
+            return
+        self.st.declare_variable(name, value_type, -1)
+        self.write("{} {} = {}".format(self.translate_type(value_type), name, value))
+
+    def loop_invariant_int(self, operand, end):
+        """
+        Whether an operand of the loop being translated is an int literal or
+        an int variable its body doesn't set
+        """
+        if type(operand) in (int, bool):
+            return True
+        return type(operand) == Var and self.is_int(operand) and not self.assigned_in(operand, self.index, end)
+
+    def assigned_in(self, name, start, end):
+        """
+        Whether a variable is set in the body of the block from start to end
+        """
+        return any(self.results[index] == name for index in range(start + 1, end))
+
+    def may_change_lists(self, start, end):
+        """
+        Whether the body of the block from start to end could change a list:
+        calls a list method that changes its list, or a function, which
+        could change the lists it is given, or adds to a variable that
+        could hold a list
+        """
+        for index in range(start + 1, end):
+            opcode = self.opcodes[index]
+            method = self.left_operands[index]
+            if opcode == OP_MCALL and self.builds_comprehension(self.right_operands[index]):
+                continue
+            elif opcode == OP_MCALL and method not in READ_ONLY_METHODS:
+                return True
+            elif opcode == OP_FCALL and method != "len":
+                return True
+            elif opcode == OP_IADD:
+                # Could be extending a list in place
+                return True
+        return False
+
+    def translate_iterable(self, seq):
+        """
+        Translate the sequence a for loop goes over, as a java.util.List
+        """
+        lst = self.translate_read(seq)
+        if type(seq) == Var:
+            seq_type = self.st.lookup_variable(seq, -1) if self.st.check_variable(seq) else object
+            if seq_type != list and seq_type != tuple and seq_type not in PRIMITIVE_LISTS.values():
+                # Such as a parameter
+                lst = "((java.util.List) {})".format(lst)
+        return lst
+
+    def comprehension_length(self, loop):
+        """
+        How many times the for loop of a list comprehension goes round, as a
+        Java expression, or None if its bounds would have to be worked out
+        twice
+        """
+        if loop.opcode == OP_FOR_IN:
+            seq = loop.left_operand
+            if type(seq) in (list, tuple):
+                return str(len(seq))
+            return "{}.size()".format(self.translate_iterable(seq))
+        bounds = loop.right_operand
+        if all(type(bound) in (int, bool) for bound in bounds):
+            return str(len(range(*(int(bound) for bound in bounds))))
+        elif not all(self.is_pure(bound) for bound in bounds):
+            return None
+        return "MiniPythonRuntime.rangeLength({}, {}, {})".format(*(self.translate_int(bound) for bound in bounds))
+
+    def is_pure(self, operand):
+        """
+        Whether working out an operand only reads variables, so it can be
+        left out when its value isn't needed, or worked out twice
+        """
+        for leaf in leaf_operands(operand):
+            if type(leaf) != Reg:
+                continue
+            index = self.reg_defs.get(leaf)
+            if index is None:
+                return False
+            opcode = self.opcodes[index]
+            if not (opcode in PURE_OPCODES or (opcode == OP_FCALL and self.left_operands[index] == "len")):
+                return False
+            elif not all(self.is_pure(use) for use, _ in self.operand_uses(index)):
+                return False
+        return True
 
-    def generate_target(self, file_name):
+    def builds_comprehension(self, args):
+        """
+        Whether a method call with these arguments appends to the new list
+        of a list comprehension, which nothing else can see yet
+        """
+        return self.reg_opcode(args[0]) == OP_LIST_COMP
+
+    def reg_def(self, operand):
+        """
+        The TAC making a register, or None if operand isn't a register made
+        by one
+        """
+        index = self.reg_defs.get(operand) if type(operand) == Reg else None
+        return None if index is None else self.TAC_lst[index]
+
+    def reg_opcode(self, operand):
+        """
+        The opcode of the TAC making a register, like reg_def
+        """
+        index = self.reg_defs.get(operand) if type(operand) == Reg else None
+        return None if index is None else self.opcodes[index]
+
+    def concat_operands(self, operand):
+        """
+        The strings a chain of additions adds together, in order
+        """
+        if self.reg_opcode(operand) != OP_ADD:
+            return [operand]
+        index = self.reg_defs[operand]
+        return self.concat_operands(self.left_operands[index]) + [self.right_operands[index]]
+
+    def concat_regs(self, operand):
+        """
+        The registers holding the partial sums of a chain of additions
+        """
+        regs = []
+        while self.reg_opcode(operand) == OP_ADD:
+            regs.append(operand)
+            operand = self.left_operands[self.reg_defs[operand]]
+        return regs
+
+    def condition_vars(self, operand):
+        """
+        The variables a condition reads, including through registers
+        """
+        names = set()
+        for leaf in leaf_operands(operand):
+            if type(leaf) == Var:
+                names.add(leaf)
+            elif type(leaf) == Reg and leaf in self.reg_defs:
+                for use, _ in self.operand_uses(self.reg_defs[leaf]):
+                    names |= self.condition_vars(use)
+        return names
+
+    def open_string_builders(self, end, condition):
+        """
+        Declare StringBuilders for the strings the loop being translated only
+        adds to, see find_string_builders
+        """
+        for name in self.find_string_builders(self.index, end, condition):
+            builder = "builder$%d" % self.builder_count
+            self.builder_count += 1
+            self.write("StringBuilder {} = new StringBuilder({})".format(builder, name))
+            self.builders[name] = builder
+            self.builder_ends.setdefault(end, []).append(name)
+
+    def find_string_builders(self, start, end, condition):
+        """
+        The string variables that a loop, from the TAC at start to its end
+        label, only adds to the end of. Those can be kept in a
+        StringBuilder for the loop and set once it is done, rather than
+        copied every time something is added.
+        """
+        body = range(start + 1, end)
+        if any(self.opcodes[index] == OP_FDEF for index in body):
+            return []
+
+        candidates = []
+        for index in body:
+            name = self.results[index]
+            if (self.opcodes[index] == OP_ASSIGN and name not in self.builders and name not in candidates
+                    and self.st.check_variable(name) and self.st.lookup_variable(name, -1) == str):
+                candidates.append(name)
+        read = self.condition_vars(condition)
+
+        names = []
+        for name in candidates:
+            if name in read:
+                continue
+            # Nor can it be set by a for loop, including this one
+            if any(self.opcodes[index] in (OP_FOR_RANGE, OP_FOR_IN) and self.results[index] == name
+                   for index in range(start, end)):
+                continue
+            # The additions each assignment to the variable is made of
+            chain_regs = set()
+            kept = True
+            for index in body:
+                if self.opcodes[index] == OP_ASSIGN and self.results[index] == name:
+                    operands = self.concat_operands(self.left_operands[index])
+                    if len(operands) < 2 or operands[0] != name or type(operands[0]) != Var:
+                        kept = False
+                        break
+                    chain_regs.update(self.concat_regs(self.left_operands[index]))
+            # The variable can't be read anywhere else in the loop
+            for index in body:
+                if not kept:
+                    break
+                result = self.results[index]
+                for operand, _ in self.operand_uses(index):
+                    if any(type(leaf) == Var and leaf == name for leaf in leaf_operands(operand)):
+                        if not (result in chain_regs and operand is self.left_operands[index]
+                                and self.concat_operands(result)[0] == name):
+                            kept = False
+                            break
+            if kept:
+                names.append(name)
+        return names
+
+    def is_int(self, operand, counter=None):
+        """
+        Whether an operand is known to be a Java int: an int literal, a
+        variable declared as one, the counter of a loop being declared, the
+        size of a list or int arithmetic on those
+        """
+        t = type(operand)
+        if t == int:
+            return True
+        elif t == Var:
+            return operand == counter or (self.st.check_variable(operand) and self.st.lookup_variable(operand, -1) == int)
+        elif t == Reg and operand in self.reg_defs:
+            index = self.reg_defs[operand]
+            left = self.left_operands[index]
+            if self.opcodes[index] in INT_OPCODES:
+                # Unary operations have no right operand
+                return all(self.is_int(arg, counter) for arg in (left, self.right_operands[index]) if arg is not None)
+            return self.opcodes[index] == OP_FCALL and left == "len"
+        return False
+
+    def counted_loop(self, start, counter=None):
+        """
+        If the while loop at start counts: its condition compares an int
+        variable with an int, and its body ends by adding an int to or
+        taking one from the variable, return the variable and the TAC making
+        its new value. Such a loop is written as a for loop with the update
+        in its header, which the JVM optimizes better.
+        """
+        end = self.block_ends[start]
+        cond = self.left_operands[start]
+        if self.reg_def(cond) is None or end - 1 <= start:
+            return None
+        update = self.TAC_lst[end - 1]
+        compare = self.reg_def(cond)
+        if compare.opcode not in COUNTED_LOOP_OPCODES or update.opcode != OP_ASSIGN:
+            return None
+        elif self.loop_continues(start, end):
+            # A for loop would make the update on continue too
+            return None
+        step = self.reg_def(update.left_operand)
+        if step is None or step.opcode not in (OP_ADD, OP_SUB):
+            return None
+
+        name = step.left_operand
+        if type(name) != Var or name != update.result:
+            return None
+        elif type(compare.left_operand) == Var and compare.left_operand == name:
+            bound = compare.right_operand
+        elif type(compare.right_operand) == Var and compare.right_operand == name:
+            bound = compare.left_operand
+        else:
+            return None
+        if not (self.is_int(name, counter) and self.is_int(bound, counter) and self.is_int(step.right_operand, counter)):
+            return None
+        return name, step
+
+    def loop_continues(self, start, end):
+        """
+        Whether the body of the loop from start to end has a continue that
+        goes back to it, rather than to a loop in it
+        """
+        index = start + 1
+        while index < end:
+            opcode = self.opcodes[index]
+            if opcode in LOOP_OPCODES:
+                index = self.block_ends[index]
+            elif opcode == OP_CONTINUE:
+                return True
+            index += 1
+        return False
+
+    def skip_unreachable(self):
+        """
+        Leave out the rest of the block the TAC being translated is in, which
+        Java doesn't allow after a break or continue
+        """
+        depth = 0
+        index = self.index + 1
+        while depth >= 0:
+            opcode = self.opcodes[index]
+            if opcode in BLOCK_OPCODES:
+                depth += 1
+            elif opcode == OP_END_LABEL:
+                depth -= 1
+            if depth >= 0:
+                self.skipped.add(index)
+            index += 1
+
+    def counted_loop_after(self, name):
+        """
+        Where the counted loop that comes right after the TAC being
+        translated starts, if name is its counter and isn't used after it,
+        so that it can be declared in the loop's header
+        """
+        index = self.index + 1
+        # Skip the TACs making the loop's condition
+        while index < len(self.opcodes) and type(self.results[index]) == Reg:
+            index += 1
+        if index == len(self.opcodes) or self.opcodes[index] != OP_WHILE:
+            return None
+        loop = self.counted_loop(index, name)
+        if loop is None or loop[0] != name or self.used_after(name, self.block_ends[index]):
+            return None
+        return index
+
+    def used_after(self, name, index):
+        """
+        Whether a variable is used or set after the TAC at index in the
+        function or main method being translated
+        """
+        return self.last_uses[self.group].get(name, -1) > index
+
+    def register_uses(self, reg, index):
+        """
+        Where a register is read after the TAC at index in the function or
+        main method being translated
+        """
+        return [use for use in self.register_reads.get(reg, ()) if use > index]
+
+    def find_uses(self):
+        """
+        Find where each register is read, and where each variable is last
+        used or set in the main method and in each function, going backwards
+        through each once. Registers are only read in the function or main
+        method that makes them.
+        """
+        self.register_reads = {}
+        self.last_uses = {}
+        for group, indices in self.split_groups().items():
+            last_uses = self.last_uses[group] = {}
+            for index in reversed(indices):
+                result = self.results[index]
+                if result is not None and type(result) != Reg and result not in last_uses:
+                    last_uses[result] = index
+                regs = set()
+                for operand, _ in self.operand_uses(index):
+                    for leaf in leaf_operands(operand):
+                        if type(leaf) == Reg:
+                            regs.add(leaf)
+                        elif type(leaf) == Var and leaf not in last_uses:
+                            last_uses[leaf] = index
+                for reg in regs:
+                    self.register_reads.setdefault(reg, []).append(index)
+        for reads in self.register_reads.values():
+            reads.reverse()
+
+    def translate(self, in_function):
+        """
+        Translate either the TACs that make up function definitions or the
+        ones that make up the main method. Functions can be declared in
+        between top level statements, so this is done in two passes over
+        the IR rather than by holding one part back in memory.
+        """
+        self.match_blocks()
+        if self.register_reads is None:
+            self.find_uses()
+        self.builder_count = 0
+        self.loop_count = 0
+        self.group_end = len(self.opcodes)
+        depth = 0
+        function_depth = None
+        for index, opcode in enumerate(self.opcodes):
+            self.index = index
+            if opcode == OP_FDEF and function_depth is None:
+                function_depth = depth
+                self.group = self.left_operands[index]
+                self.group_end = self.block_ends[index]
+                if in_function:
+                    self.builder_count = 0
+                    self.loop_count = 0
+                self.primitive_lists = self.group_primitive_lists[self.group]
+                self.shared_lists = self.group_shared_lists[self.group]
+            if (function_depth is not None) == in_function and index not in self.skipped:
+                # Only the TACs translated are made into TAC objects
+                self.generate(self.TAC_lst[index])
+            if opcode in BLOCK_OPCODES:
+                depth += 1
+            elif opcode == OP_END_LABEL:
+                depth -= 1
+                if depth == function_depth:
+                    function_depth = None
+                    self.group = None
+                    self.group_end = len(self.opcodes)
+                    self.primitive_lists = self.group_primitive_lists[None]
+                    self.shared_lists = self.group_shared_lists[None]
+
+    def match_blocks(self):
+        """
+        Find where each block ends and where the TAC making each register is
+        """
+        self.block_ends = {}
+        self.reg_defs = {}
+        starts = []
+        for index, (opcode, result) in enumerate(zip(self.opcodes, self.results)):
+            if type(result) == Reg:
+                self.reg_defs[result] = index
+            if opcode in BLOCK_OPCODES:
+                starts.append(index)
+            elif opcode == OP_END_LABEL:
+                self.block_ends[starts.pop()] = index
+
+    def write_constants(self):
+        """
+        Declare the static final fields for the constants hoisted so far, in
+        the order the functions and main method using them were translated
+        """
+        for constants in self.constants.values():
+            for field_type, name, value in constants:
+                self.write("private static final %s %s = %s" % (field_type, name, value))
+
+    def emit_functions(self):
+        """
+        Write the Java methods for the functions defined in the IR
+        """
+        self.translate(True)
+
+    def emit_main(self):
+        """
+        Write the statements of the main method
+        """
+        self.translate(False)
+
+    def write_main_start(self, buffered_output=False):
+        """
+        Open the main method, which first has print buffer its output if
+        buffered_output is set
+        """
+        self.write("public static void main(String args[]) {")
+        if buffered_output:
+            self.write("MiniPythonRuntime.bufferOutput()")
+
+    def emit(self, sink, class_name, buffered_output=False):
+        """
+        Write the Java class for the IR to sink, line by line. Functions that
+        can't be called from the main method are left out.
+        """
+        tacs = remove_dead_functions(self.TAC_lst)
+        if tacs is not self.TAC_lst:
+            self.TAC_lst = tacs
+            self.read_columns()
+        self.out = JavaWriter(sink)
+        self.write("import java.util.*")
+        self.write("public class %s {" % class_name)
+
+        self.emit_functions()
+        self.write_main_start(buffered_output)
+        self.emit_main()
+        self.write("}")
+        self.write_constants()
+        self.write("}")
+
+    def generate_target(self, file_name, buffered_output=False):
         file_name_no_ext = os.path.splitext(os.path.normpath(file_name))[0]
         class_name = os.path.basename(file_name_no_ext).capitalize()
 
-        starting_code = []
-        starting_code.append("import java.util.*")
-        starting_code.append("public class %s {" % class_name)
-        self.create_step_method(starting_code)
-        self.target.append("public static void main(String args[]) {")
-        self.format_lines(starting_code)
-
-        for tac in self.TAC_lst:
-            # For knowing which function calls are standalone statements
-            if tac.operator == "fcall":
-                self.fcall_statement_regs[tac.result] = None
-            elif tac.operator == "mcall":
-                self.mcall_statement_regs[tac.result] = None
-            elif tac.result in self.fcall_statement_regs:
-                self.fcall_statement_regs.pop(tac.result, None)
-            elif tac.result in self.mcall_statement_regs:
-                self.mcall_statement_regs.pop(tac.result, None)
-
-        for tac in self.TAC_lst:
-            self.generate(tac)
-        self.target.append("}")
-        self.target.append("}")
-
-        self.format_lines(self.function_defs)
-        self.format_lines(self.target)
-
         output_dir = "output"
         os.makedirs(output_dir, exist_ok=True)
+        write_runtime(output_dir)
         file = open("{}/{}.java".format(output_dir, class_name), "w")
-        file.writelines(starting_code)
-        file.writelines(self.function_defs)
-        file.writelines(self.target)
+        self.emit(file, class_name, buffered_output)
         file.close()
-        
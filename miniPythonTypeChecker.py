@@ -1,9 +1,81 @@
 #!/usr/bin/env python3
 
 from miniPythonSymbolTable import SymbolTable, ParseError
+from miniPythonCallGraph import CallGraph
 import miniPythonAST as ast
 
+# The return type of a function that is still being inferred. It is below
+# every other type, so a return statement that depends on it adds nothing.
+UNKNOWN = "Unknown"
+
+def join_types(left, right):
+    """
+    The most specific type that values of both types have
+    """
+    if left == UNKNOWN:
+        return right
+    if right == UNKNOWN or left == right:
+        return left
+    return "Any"
+
+def always_returns(body):
+    """
+    Whether every way through a list of code lines ends in a return
+    """
+    if not body:
+        return False
+    statement = getattr(body[-1], "code_line", None)
+    if isinstance(statement, ast.ReturnStatement):
+        return True
+    elif isinstance(statement, ast.IfStatement):
+        if statement.else_body is None or not always_returns(statement.if_body) or not always_returns(statement.else_body):
+            return False
+        elif_statement = statement.elif_bodies
+        while elif_statement is not None:
+            if not always_returns(elif_statement.elif_body):
+                return False
+            elif_statement = elif_statement.other_elifs
+        return True
+    return False
+
+def has_comprehension(node):
+    """
+    Whether there is a list comprehension anywhere in an expression
+    """
+    if isinstance(node, list):
+        return any(has_comprehension(elem) for elem in node)
+    elif isinstance(node, ast.ListComprehension):
+        return True
+    elif isinstance(node, ast.Node):
+        return any(has_comprehension(value) for value in vars(node).values() if isinstance(value, (list, ast.Node)))
+    return False
+
 class TypeChecker(object):
+    # Whether to record the return type of each call, the type of the
+    # variable of each augmented assignment, whether each assignment turns
+    # an int variable into a float one and whether the variable of each
+    # list comprehension hides another, on its node for codegen
+    annotate_calls = True
+
+    def __init__(self):
+        # Errors found so far. Checking carries on past an erroneous line so
+        # that every error in the program is reported at once.
+        self.errors = []
+        # The return type inferred so far for each function being checked,
+        # innermost last, and whether it called a function whose return type
+        # was unknown
+        self.returns = []
+        # Set when a call to a function whose return type is unknown is
+        # checked
+        self.read_unknown = False
+        # The functions checked as part of the current top level function,
+        # with the return types inferred on the first pass and, for those
+        # that need another, the variables in scope at their definition
+        self.group = []
+        # How many loops the code being checked is in, within the function
+        # it is in, for telling where break and continue can go
+        self.loop_depth = 0
+
     def typecheck(self, node, st):
         method = 'check_' + node.__class__.__name__
         return getattr(self, method, self.generic_typecheck)(node, st)
@@ -29,32 +101,160 @@ class TypeChecker(object):
         return global_st
 
     def check_FunctionDef(self, node, st):
+        # Declared before its body is checked so that it can call itself,
+        # with its return type unknown until the top level function it is in
+        # has been checked
+        node.return_type = UNKNOWN
+        redeclared = node.name in st.functions
+        if not redeclared:
+            st.declare_function(node.name, node, node.coord)
+
+        if st.get_scope() > 1:
+            self.check_function(node, st)
+        else:
+            try:
+                self.check_function(node, st)
+                self.solve_return_types(node, st)
+            finally:
+                # Functions whose checking stopped part way can return anything
+                for function, _, _ in self.group:
+                    if function.return_type == UNKNOWN:
+                        function.return_type = "Any"
+                self.group = []
+
+        if redeclared:
+            st.declare_function(node.name, node, node.coord)
+        return "Any"
+
+    def check_function(self, node, st):
+        """
+        Check a function definition and infer its return type from the
+        return statements that don't depend on an unknown return type
+        """
+        self.returns.append([UNKNOWN, False])
+        try:
+            self.check_function_body(node, st)
+        finally:
+            return_type, read_unknown = self.returns.pop()
+        if not always_returns(node.body):
+            return_type = join_types(return_type, "Any")
+
+        environment = None
+        if read_unknown and st.get_scope() > 1:
+            # The variables of the enclosing functions are gone by the time
+            # the return types are solved
+            environment = dict()
+            for scope in st.scopes:
+                environment.update(scope)
+        self.group.append((node, return_type, environment if read_unknown else False))
+
+    def solve_return_types(self, node, st):
+        """
+        Infer the return types of a top level function and the functions
+        defined in it. A call to any of them while they are being checked
+        has type Any, and the return statements it is in are left out at
+        first. The functions that made such calls are then checked again with
+        the return types inferred so far, from a worklist, and the callers of
+        a function whose return type changes are put back on the worklist
+        until nothing changes.
+        """
+        estimates = dict((function.name, return_type) for function, return_type, _ in self.group)
+        environments = dict((function.name, (function, environment)) for function, _, environment in self.group
+                            if environment is not False)
+        if environments:
+            graph = CallGraph.from_ast(node)
+            checker = ReturnTypeChecker(estimates)
+            worklist = list(environments)
+            while worklist:
+                name = worklist.pop()
+                function, environment = environments[name]
+                if environment is None:
+                    environment = st.scopes[0]
+                return_type = join_types(estimates[name], checker.infer(function, environment, st.functions))
+                if return_type != estimates[name]:
+                    estimates[name] = return_type
+                    for caller in graph.callers(name):
+                        if caller in environments and caller not in worklist:
+                            worklist.append(caller)
+
+        for function, _, _ in self.group:
+            function.return_type = estimates[function.name]
+
+    def check_function_body(self, node, st):
         st.push_scope()
 
         self.typecheck(node.params, st)
 
-        # Go through the method body and type check each statements
-        for codeline in node.body:
-            self.typecheck(codeline, st)
+        # A loop the function is defined in can't be left from its body
+        loop_depth = self.loop_depth
+        self.loop_depth = 0
+        try:
+            # Go through the method body and type check each statements
+            for codeline in node.body:
+                self.typecheck(codeline, st)
+        finally:
+            self.loop_depth = loop_depth
 
         st.pop_scope()
 
-        st.declare_function(node.name, node, node.coord)
-        return "Any"
-
     def check_CodeLine(self, node, st):
-        return self.typecheck(node.code_line, st)
+        scope = st.get_scope()
+        try:
+            return self.typecheck(node.code_line, st)
+        except ParseError as e:
+            self.errors.append(e)
+            # Leave any scope the line opened
+            while st.get_scope() > scope:
+                st.pop_scope()
+            # Declare the variable anyway so its uses don't cause more errors
+            statement = node.code_line
+            if isinstance(statement, ast.AssignmentStatement) and not st.check_variable(statement.name):
+                st.declare_variable(statement.name, "Any", statement.coord)
+            return None
 
     def check_AssignmentStatement(self, node, st):
         expr_type = self.typecheck(node.expr, st)
         if expr_type is None:
             raise ParseError("Cannot use None type", node.coord)
+        widens = False
         if not st.check_variable(node.name):
             st.declare_variable(node.name, expr_type, node.coord)
         else:
             old_type = st.lookup_variable(node.name, node.coord)
+            if old_type == int and expr_type == float:
+                # The variable holds floats from then on, and can still be
+                # given ints
+                st.set_variable_type(node.name, float)
+                widens = True
+            elif old_type == float and expr_type == int:
+                pass
+            elif old_type != expr_type and (old_type != "Any" and expr_type != "Any"):
+                raise ParseError("Cannot change already assigned variable type: " + str(old_type) + " to: " + str(expr_type), node.coord)
+        if self.annotate_calls:
+            node.widens = widens
+        return expr_type
+
+    def check_AugmentedAssignmentStatement(self, node, st):
+        old_type = st.lookup_variable(node.name, node.coord)
+        if old_type == list and node.op == "+":
+            # Extends the list in place, so any sequence can be added
+            expr_type = self.typecheck(node.expr, st)
+            if expr_type is None:
+                raise ParseError("Cannot use None type", node.coord)
+            elif expr_type not in [list, tuple, "Any"]:
+                raise ParseError("Can only add lists or tuples to a list in place, was %s" % expr_type, node.coord)
+            expr_type = list
+        elif old_type in [int, bool] and node.op == "/":
+            raise ParseError("Cannot use /= on an int or bool variable, since it gives a float", node.coord)
+        else:
+            operation = ast.BinaryOperation(node.op, ast.ID(node.name, node.coord), node.expr, node.coord)
+            expr_type = self.typecheck(operation, st)
+            if expr_type is None:
+                raise ParseError("Cannot use None type", node.coord)
             if old_type != expr_type and (old_type != "Any" and expr_type != "Any"):
                 raise ParseError("Cannot change already assigned variable type: " + str(old_type) + " to: " + str(expr_type), node.coord)
+        if self.annotate_calls:
+            node.var_type = old_type
         return expr_type
 
     def check_IfStatement(self, node, st):
@@ -79,6 +279,9 @@ class TypeChecker(object):
     def check_ElifStatement(self, node, st):
         if self.typecheck(node.cond, st) is None:
             raise ParseError("Cannot use None type", node.coord)
+        if has_comprehension(node.cond):
+            # Its loop would have to be written before the condition
+            raise ParseError("Cannot use a list comprehension in an elif condition", node.coord)
         
         st.push_scope()
         for codeline in node.elif_body:
@@ -93,19 +296,96 @@ class TypeChecker(object):
     def check_WhileStatement(self, node, st):
         if self.typecheck(node.cond, st) is None:
             raise ParseError("Cannot use None type", node.coord)
+        if has_comprehension(node.cond):
+            # Its loop would have to be written before the condition
+            raise ParseError("Cannot use a list comprehension in a while condition", node.coord)
 
         if node.body is not None:
             st.push_scope()
-            for codeline in node.body:
-                self.typecheck(codeline, st)
+            self.check_loop_body(node.body, st)
             st.pop_scope()
 
         return None
 
+    def check_ForStatement(self, node, st):
+        seq_type = self.typecheck(node.seq, st)
+        if seq_type is None:
+            raise ParseError("Cannot use None type", node.coord)
+        elif seq_type not in [list, tuple, "Any"]:
+            raise ParseError("Can only loop over a list or tuple, was %s" % seq_type, node.coord)
+
+        st.push_scope()
+        self.declare_loop_variable(node, "Any", st)
+        self.check_loop_body(node.body, st)
+        st.pop_scope()
+
+        return None
+
+    def check_ForRangeStatement(self, node, st):
+        self.check_range(node, st)
+
+        st.push_scope()
+        self.declare_loop_variable(node, int, st)
+        self.check_loop_body(node.body, st)
+        st.pop_scope()
+
+        return None
+
+    def check_range(self, node, st):
+        """
+        Check the arguments of a range(), from a for loop or a list
+        comprehension
+        """
+        for bound in (node.start, node.stop, node.step):
+            if bound is None:
+                continue
+            bound_type = self.typecheck(bound, st)
+            if bound_type is None:
+                raise ParseError("Cannot use None type", node.coord)
+            elif bound_type not in [bool, int, "Any"]:
+                raise ParseError("range() arguments must be ints or bools, was %s" % bound_type, node.coord)
+        if isinstance(node.step, ast.Literal) and node.step.value == 0:
+            raise ParseError("range() step cannot be zero", node.coord)
+
+    def check_loop_body(self, body, st):
+        self.loop_depth += 1
+        try:
+            for codeline in body:
+                self.typecheck(codeline, st)
+        finally:
+            self.loop_depth -= 1
+
+    def check_BreakStatement(self, node, st):
+        if self.loop_depth == 0:
+            raise ParseError("'break' outside loop", node.coord)
+        return None
+
+    def check_ContinueStatement(self, node, st):
+        if self.loop_depth == 0:
+            raise ParseError("'continue' not properly in loop", node.coord)
+        return None
+
+    def declare_loop_variable(self, node, var_type, st):
+        """
+        Declare the variable of a for loop in the scope of its body, unless
+        it is already declared, in which case the loop assigns to it
+        """
+        if not st.check_variable(node.name):
+            st.declare_variable(node.name, var_type, node.coord)
+        else:
+            old_type = st.lookup_variable(node.name, node.coord)
+            if old_type != var_type and (old_type != "Any" and var_type != "Any"):
+                raise ParseError("Cannot change already assigned variable type: " + str(old_type) + " to: " + str(var_type), node.coord)
+
     def check_ReturnStatement(self, node, st):
+        self.read_unknown = False
         return_type = self.typecheck(node.expr, st)
         if return_type is None:
             raise ParseError("Cannot use None type", node.coord)
+        if self.returns and not self.read_unknown:
+            returns = self.returns[-1]
+            # A bare return gives None
+            returns[0] = join_types(returns[0], return_type if node.expr is not None else "Any")
         return return_type
     
     def check_PrintStatement(self, node, st):
@@ -233,6 +513,9 @@ class TypeChecker(object):
         elif node.op in ["-", "/", "%", "**", "//"]:
             if left_type not in [bool, int, float] or right_type not in [bool, int, float]:
                 raise ParseError(node.op + " can only work with bools, ints, and floats, was %s and %s" % (left_type, right_type), node.coord)
+            elif node.op == "/":
+                # Division always gives a float
+                return float
             elif left_type in [bool, int]:
                 if right_type == float:
                     return float
@@ -251,8 +534,21 @@ class TypeChecker(object):
 
         if len(function.params.exprs or []) != len(node.exprs.exprs or []):
             raise ParseError("Argument length mismatch with function", node.coord)
+        self.typecheck(node.exprs, st)
+
+        return_type = self.function_return_type(function)
+        if return_type == UNKNOWN:
+            # Still being inferred, see solve_return_types
+            self.read_unknown = True
+            if self.returns:
+                self.returns[-1][1] = True
+            return_type = "Any"
+        if self.annotate_calls:
+            node.return_type = return_type
+        return return_type
 
-        return "Any"
+    def function_return_type(self, function):
+        return function.return_type
 
     def check_Tuple(self, node, st):
         if node.exprs != None:
@@ -268,6 +564,33 @@ class TypeChecker(object):
                     raise ParseError("Cannot use None type", node.coord)
         return list
 
+    def check_ListComprehension(self, node, st):
+        if isinstance(node.seq, ast.Range):
+            self.check_range(node.seq, st)
+            var_type = int
+        else:
+            seq_type = self.typecheck(node.seq, st)
+            if seq_type is None:
+                raise ParseError("Cannot use None type", node.coord)
+            elif seq_type not in [list, tuple, "Any"]:
+                raise ParseError("Can only loop over a list or tuple, was %s" % seq_type, node.coord)
+            var_type = "Any"
+
+        # The variable only exists inside the comprehension, hiding any
+        # variable of the same name
+        shadows = st.check_variable(node.name)
+        st.push_scope()
+        st.declare_variable(node.name, var_type, node.coord)
+        if node.cond is not None and self.typecheck(node.cond, st) is None:
+            raise ParseError("Cannot use None type", node.coord)
+        if self.typecheck(node.expr, st) is None:
+            raise ParseError("Cannot use None type", node.coord)
+        st.pop_scope()
+
+        if self.annotate_calls:
+            node.shadows = shadows
+        return list
+
     def check_SequenceIndex(self, node, st):
         seq_type = self.typecheck(node.seq, st)
         if seq_type is None:
@@ -348,10 +671,14 @@ class TypeChecker(object):
                 raise ParseError("Sequence method insert() requires 2 arguments", node.coord)
             if self.typecheck(node.arg1, st) not in [int, bool, "Any"]:
                 raise ParseError("Sequence method insert()'s first argument must be either an int or bool, not " + self.typecheck(node.arg1, st), node.coord)
+            elif self.typecheck(node.arg2, st) is None:
+                raise ParseError("Cannot use None type", node.coord)
             return None
         elif node.method_name == "index":
             if node.arg1 is None:
                 raise ParseError("Sequence method index() requires an argument", node.coord)
+            elif self.typecheck(node.arg1, st) is None:
+                raise ParseError("Cannot use None type", node.coord)
             return int
         elif node.method_name == "pop":
             if seq_type == tuple:
@@ -372,7 +699,7 @@ class TypeChecker(object):
                 st.declare_variable(expr.name, "Any", node.coord)
 
     def check_ArgsList(self, node, st):
-        for expr in node.exprs:
+        for expr in node.exprs or []:
             if self.typecheck(expr, st) is None:
                 raise ParseError("Cannot use None type", node.coord)
         return None
@@ -382,3 +709,36 @@ class TypeChecker(object):
             if self.typecheck(expr, st) is None:
                 raise ParseError("Cannot use None type", node.coord)
         return None
+
+class ReturnTypeChecker(TypeChecker):
+    """
+    Checks function bodies again to infer their return types from the
+    return types inferred so far for the functions they call. Errors are
+    ignored, and functions defined in the bodies are left alone since they
+    are inferred on their own.
+    """
+    annotate_calls = False
+
+    def __init__(self, estimates):
+        TypeChecker.__init__(self)
+        self.estimates = estimates
+
+    def function_return_type(self, function):
+        return self.estimates.get(function.name, function.return_type)
+
+    def check_FunctionDef(self, node, st):
+        return "Any"
+
+    def infer(self, node, environment, functions):
+        """
+        The return type of a function defined where the variables in
+        environment are in scope
+        """
+        st = SymbolTable()
+        for name, var_type in environment.items():
+            st.declare_variable(name, var_type, None)
+        st.functions = functions
+        self.group = []
+        self.check_function(node, st)
+        self.errors = []
+        return self.group[0][1]
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = "programleftORleftANDrightNOTleft<LESS_EQUAL>GREATER_EQUALNOT_EQUALEQUAL_EQUALleft+-left*/INT_DIVIDE%leftPOWERrightUPLUSUMINUSAND APPEND COPY DEF ELIF ELSE EQUAL_EQUAL EXTEND FALSE FLOAT GREATER_EQUAL ID IF INDEX INSERT INT INT_DIVIDE LEN LESS_EQUAL NEW_LINE NOT NOT_EQUAL OR POP POWER RETURN STR TRUE WHILE\n        program : code_lines\n                | optional_new_lines code_lines\n        \n        code_lines : code_line\n                   | code_line new_lines\n                   | code_line new_lines code_lines\n                   | code_line optional_new_lines code_lines\n        \n        code_line : function_def\n                  | statement\n                  | expr\n        \n        block : ':' new_lines optional_new_lines code_lines '#' new_lines\n              | ':' new_lines optional_new_lines code_lines '#'\n        \n        optional_new_lines : new_lines\n                           | empty\n        \n        new_lines : NEW_LINE\n                  | NEW_LINE new_lines\n        \n        statement : assignment_statement\n                  | if_statement \n                  | while_statement\n                  | return_statement\n        \n        assignment_statement : ID '=' expr\n        \n        params : expr\n               | expr ',' params\n        \n        params_or_empty : params\n                        | empty\n        \n        function_def : DEF ID '(' params_or_empty ')' block\n        \n        if_statement : IF expr block\n                     | IF expr block elif_statements\n                     | IF expr block ELSE block\n                     | IF expr block elif_statements ELSE block\n        \n        elif_statements : ELIF expr block\n                        | ELIF expr block elif_statements\n        \n        while_statement : WHILE expr block\n        \n        return_statement : RETURN expr\n                         | RETURN\n        \n        expr : ID\n        \n        expr : TRUE\n             | FALSE\n             | INT\n             | FLOAT\n             | STR\n        \n        expr : list\n        \n        expr : tuple\n        \n        expr : sequence_call\n        \n        expr : function_call\n        \n        expr : NOT expr\n             | '+' expr %prec UPLUS\n             | '-' expr %prec UMINUS\n        \n        expr : expr AND expr\n             | expr OR expr\n             | expr EQUAL_EQUAL expr\n             | expr NOT_EQUAL expr\n             | expr '+' expr\n             | expr '-' expr\n             | expr '*' expr\n             | expr '/' expr\n             | expr '%' expr\n             | expr POWER expr\n             | expr INT_DIVIDE expr\n             | expr '>' expr\n             | expr '<' expr\n             | expr GREATER_EQUAL expr\n             | expr LESS_EQUAL expr\n        \n        expr : '(' expr ')'\n        \n        elements : expr ',' elements\n                 | expr ','\n                 | expr\n        \n        elements_or_empty : elements\n                          | empty\n        \n        tuple : '(' elements_or_empty ')'\n              | '(' ')'\n        \n        list : '[' elements_or_empty ']'\n             | '[' ']'\n        \n        sequence_call : sequence_index\n                      | sequence_slice\n                      | sequence_function_call\n                      | sequence_method\n        \n        sequence_index : expr '[' expr ']'\n        \n        sequence_slice : expr '[' ':' ']'\n                       | expr '[' expr ':' ']'\n                       | expr '[' ':' expr ']'\n                       | expr '[' expr ':' expr ']'\n                       | expr '[' ':' ':' ']'\n                       | expr '[' expr ':' ':' ']'\n                       | expr '[' ':' expr ':' ']'\n                       | expr '[' ':' ':' expr ']'\n                       | expr '[' expr ':' expr ':' ']'\n                       | expr '[' expr ':' ':' expr ']'\n                       | expr '[' ':' expr ':' expr ']'\n                       | expr '[' expr ':' expr ':' expr ']'\n        \n        sequence_function_call : LEN '(' expr ')'\n        \n        sequence_method : expr '.' APPEND '(' expr ')'\n                        | expr '.' EXTEND '(' expr ')'\n                        | expr '.' INSERT '(' expr ',' expr ')'\n                        | expr '.' INDEX '(' expr ')'\n                        | expr '.' POP '(' ')'\n                        | expr '.' POP '(' expr ')'\n                        | expr '.' COPY '(' ')'\n        \n        args : expr\n             | expr ',' args\n        \n        args_or_empty : args\n                      | empty\n        \n        function_call : ID '(' args_or_empty ')'\n        \n        empty :\n        "
+_lr_signature = "programleftORleftANDrightNOTleft<LESS_EQUAL>GREATER_EQUALNOT_EQUALEQUAL_EQUALleft+-left*/INT_DIVIDE%leftPOWERrightUPLUSUMINUSAND APPEND BREAK CONTINUE COPY DEF DIVIDE_EQUAL ELIF ELSE EQUAL_EQUAL EXTEND FALSE FLOAT FOR GREATER_EQUAL ID IF IN INDEX INSERT INT INT_DIVIDE INT_DIVIDE_EQUAL LEN LESS_EQUAL MINUS_EQUAL MOD_EQUAL NEW_LINE NOT NOT_EQUAL OR PLUS_EQUAL POP POWER POWER_EQUAL PRINT RANGE RETURN STR TIMES_EQUAL TRUE WHILE\n        program : code_lines\n                | optional_new_lines code_lines\n        \n        code_lines : code_line\n                   | code_line new_lines\n                   | code_line new_lines code_lines\n                   | code_line optional_new_lines code_lines\n        \n        code_line : function_def\n                  | statement\n                  | expr\n        \n        code_line : error NEW_LINE\n        \n        block : ':' new_lines optional_new_lines code_lines '#' new_lines\n              | ':' new_lines optional_new_lines code_lines '#'\n        \n        optional_new_lines : new_lines\n                           | empty\n        \n        new_lines : NEW_LINE\n                  | NEW_LINE new_lines\n        \n        statement : assignment_statement\n                  | augmented_assignment_statement\n                  | if_statement \n                  | while_statement\n                  | for_statement\n                  | break_statement\n                  | continue_statement\n                  | return_statement\n                  | print_statement\n        \n        assignment_statement : ID '=' expr\n        \n        augmented_assignment_statement : ID PLUS_EQUAL expr\n                                       | ID MINUS_EQUAL expr\n                                       | ID TIMES_EQUAL expr\n                                       | ID DIVIDE_EQUAL expr\n                                       | ID MOD_EQUAL expr\n                                       | ID POWER_EQUAL expr\n                                       | ID INT_DIVIDE_EQUAL expr\n        \n        params : expr\n               | expr ',' params\n        \n        params_or_empty : params\n                        | empty\n        \n        function_def : DEF ID '(' params_or_empty ')' block\n        \n        if_statement : IF expr block\n                     | IF expr block elif_statements\n                     | IF expr block ELSE block\n                     | IF expr block elif_statements ELSE block\n        \n        elif_statements : ELIF expr block\n                        | ELIF expr block elif_statements\n        \n        while_statement : WHILE expr block\n        \n        for_statement : FOR ID IN expr block\n                      | FOR ID IN range block\n        \n        range : RANGE '(' expr ')'\n              | RANGE '(' expr ',' expr ')'\n              | RANGE '(' expr ',' expr ',' expr ')'\n        \n        break_statement : BREAK\n        \n        continue_statement : CONTINUE\n        \n        return_statement : RETURN expr\n                         | RETURN\n        \n        print_statement : PRINT '(' expr ')'\n                        | PRINT '(' ')'\n        \n        expr : ID\n        \n        expr : TRUE\n             | FALSE\n             | INT\n             | FLOAT\n             | STR\n        \n        expr : list\n        \n        expr : list_comprehension\n        \n        expr : tuple\n        \n        expr : sequence_call\n        \n        expr : function_call\n        \n        expr : NOT expr\n             | '+' expr %prec UPLUS\n             | '-' expr %prec UMINUS\n        \n        expr : expr AND expr\n             | expr OR expr\n             | expr EQUAL_EQUAL expr\n             | expr NOT_EQUAL expr\n             | expr '+' expr\n             | expr '-' expr\n             | expr '*' expr\n             | expr '/' expr\n             | expr '%' expr\n             | expr POWER expr\n             | expr INT_DIVIDE expr\n             | expr '>' expr\n             | expr '<' expr\n             | expr GREATER_EQUAL expr\n             | expr LESS_EQUAL expr\n        \n        expr : '(' expr ')'\n        \n        elements : expr ',' elements\n                 | expr ','\n                 | expr\n        \n        elements_or_empty : elements\n                          | empty\n        \n        tuple : '(' elements_or_empty ')'\n              | '(' ')'\n        \n        list : '[' elements_or_empty ']'\n             | '[' ']'\n        \n        list_comprehension : '[' expr FOR ID IN expr ']'\n                           | '[' expr FOR ID IN range ']'\n                           | '[' expr FOR ID IN expr IF expr ']'\n                           | '[' expr FOR ID IN range IF expr ']'\n        \n        sequence_call : sequence_index\n                      | sequence_slice\n                      | sequence_function_call\n                      | sequence_method\n        \n        sequence_index : expr '[' expr ']'\n        \n        sequence_slice : expr '[' ':' ']'\n                       | expr '[' expr ':' ']'\n                       | expr '[' ':' expr ']'\n                       | expr '[' expr ':' expr ']'\n                       | expr '[' ':' ':' ']'\n                       | expr '[' expr ':' ':' ']'\n                       | expr '[' ':' expr ':' ']'\n                       | expr '[' ':' ':' expr ']'\n                       | expr '[' expr ':' expr ':' ']'\n                       | expr '[' expr ':' ':' expr ']'\n                       | expr '[' ':' expr ':' expr ']'\n                       | expr '[' expr ':' expr ':' expr ']'\n        \n        sequence_function_call : LEN '(' expr ')'\n        \n        sequence_method : expr '.' APPEND '(' expr ')'\n                        | expr '.' EXTEND '(' expr ')'\n                        | expr '.' INSERT '(' expr ',' expr ')'\n                        | expr '.' INDEX '(' expr ')'\n                        | expr '.' POP '(' ')'\n                        | expr '.' POP '(' expr ')'\n                        | expr '.' COPY '(' ')'\n        \n        args : expr\n             | expr ',' args\n        \n        args_or_empty : args\n                      | empty\n        \n        function_call : ID '(' args_or_empty ')'\n        \n        empty :\n        "
     
-_lr_action_items = {'NEW_LINE':([0,4,7,8,9,10,12,14,15,16,17,18,19,20,21,22,23,24,25,26,32,34,35,36,37,59,64,66,69,70,71,74,76,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,105,110,112,113,114,115,116,118,122,133,136,139,140,143,145,147,153,154,159,163,165,167,168,169,170,172,173,174,176,177,180,181,182,184,185,186,187,188,],[10,10,-7,-8,-9,10,-35,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,-34,-73,-74,-75,-76,-15,-70,-35,-45,-46,-47,-33,-72,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-20,-63,-69,-26,10,-32,-71,-77,-78,-102,-27,10,-90,-79,-80,-82,-95,-97,-28,-81,-83,-84,-85,-91,-92,-94,-96,-25,-29,-30,-86,-87,-88,-31,10,-89,-93,-10,]),'DEF':([0,3,4,5,6,7,8,9,10,12,14,15,16,17,18,19,20,21,22,23,24,25,26,32,34,35,36,37,40,41,59,64,66,69,70,71,74,76,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,105,110,112,113,115,116,118,122,133,136,139,140,143,145,147,153,154,159,161,163,165,167,168,169,170,172,173,174,176,177,180,181,182,184,185,186,187,188,],[11,11,-103,-12,-13,-7,-8,-9,-14,-35,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,-34,-73,-74,-75,-76,11,11,-15,-70,-35,-45,-46,-47,-33,-72,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-20,-63,-69,-26,-32,-71,-77,-78,-102,-27,-103,-90,-79,-80,-82,-95,-97,-28,11,-81,-83,-84,-85,-91,-92,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'ID':([0,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,64,66,69,70,71,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,104,105,110,111,112,113,115,116,118,119,121,122,123,124,125,126,127,133,134,136,138,139,140,142,143,144,145,147,153,154,156,159,161,162,163,165,167,168,169,170,171,172,173,174,176,177,180,181,182,184,185,186,187,188,],[12,12,-103,-12,-13,-7,-8,-9,-14,60,-35,66,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,66,66,66,66,66,66,66,-73,-74,-75,-76,12,12,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,66,-15,66,66,-70,-35,-45,-46,-47,-33,-72,66,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,66,66,-20,-63,66,-69,-26,-32,-71,-77,66,66,-78,66,66,66,66,66,-102,66,-27,66,-103,-90,66,-79,66,-80,-82,-95,-97,66,-28,12,66,-81,-83,-84,-85,-91,-92,66,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'TRUE':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,64,66,69,70,71,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,104,105,110,111,112,113,115,116,118,119,121,122,123,124,125,126,127,133,134,136,138,139,140,142,143,144,145,147,153,154,156,159,161,162,163,165,167,168,169,170,171,172,173,174,176,177,180,181,182,184,185,186,187,188,],[18,18,-103,-12,-13,-7,-8,-9,-14,-35,18,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,18,18,18,18,18,18,18,-73,-74,-75,-76,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,18,-15,18,18,-70,-35,-45,-46,-47,-33,-72,18,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,18,18,-20,-63,18,-69,-26,-32,-71,-77,18,18,-78,18,18,18,18,18,-102,18,-27,18,-103,-90,18,-79,18,-80,-82,-95,-97,18,-28,18,18,-81,-83,-84,-85,-91,-92,18,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'FALSE':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,64,66,69,70,71,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,104,105,110,111,112,113,115,116,118,119,121,122,123,124,125,126,127,133,134,136,138,139,140,142,143,144,145,147,153,154,156,159,161,162,163,165,167,168,169,170,171,172,173,174,176,177,180,181,182,184,185,186,187,188,],[19,19,-103,-12,-13,-7,-8,-9,-14,-35,19,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,19,19,19,19,19,19,19,-73,-74,-75,-76,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,19,-15,19,19,-70,-35,-45,-46,-47,-33,-72,19,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,19,19,-20,-63,19,-69,-26,-32,-71,-77,19,19,-78,19,19,19,19,19,-102,19,-27,19,-103,-90,19,-79,19,-80,-82,-95,-97,19,-28,19,19,-81,-83,-84,-85,-91,-92,19,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'INT':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,64,66,69,70,71,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,104,105,110,111,112,113,115,116,118,119,121,122,123,124,125,126,127,133,134,136,138,139,140,142,143,144,145,147,153,154,156,159,161,162,163,165,167,168,169,170,171,172,173,174,176,177,180,181,182,184,185,186,187,188,],[20,20,-103,-12,-13,-7,-8,-9,-14,-35,20,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,20,20,20,20,20,20,20,-73,-74,-75,-76,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,20,-15,20,20,-70,-35,-45,-46,-47,-33,-72,20,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,20,20,-20,-63,20,-69,-26,-32,-71,-77,20,20,-78,20,20,20,20,20,-102,20,-27,20,-103,-90,20,-79,20,-80,-82,-95,-97,20,-28,20,20,-81,-83,-84,-85,-91,-92,20,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'FLOAT':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,64,66,69,70,71,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,104,105,110,111,112,113,115,116,118,119,121,122,123,124,125,126,127,133,134,136,138,139,140,142,143,144,145,147,153,154,156,159,161,162,163,165,167,168,169,170,171,172,173,174,176,177,180,181,182,184,185,186,187,188,],[21,21,-103,-12,-13,-7,-8,-9,-14,-35,21,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,21,21,21,21,21,21,21,-73,-74,-75,-76,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,21,-15,21,21,-70,-35,-45,-46,-47,-33,-72,21,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,21,21,-20,-63,21,-69,-26,-32,-71,-77,21,21,-78,21,21,21,21,21,-102,21,-27,21,-103,-90,21,-79,21,-80,-82,-95,-97,21,-28,21,21,-81,-83,-84,-85,-91,-92,21,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'STR':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,64,66,69,70,71,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,104,105,110,111,112,113,115,116,118,119,121,122,123,124,125,126,127,133,134,136,138,139,140,142,143,144,145,147,153,154,156,159,161,162,163,165,167,168,169,170,171,172,173,174,176,177,180,181,182,184,185,186,187,188,],[22,22,-103,-12,-13,-7,-8,-9,-14,-35,22,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,22,22,22,22,22,22,22,-73,-74,-75,-76,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,22,-15,22,22,-70,-35,-45,-46,-47,-33,-72,22,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,22,22,-20,-63,22,-69,-26,-32,-71,-77,22,22,-78,22,22,22,22,22,-102,22,-27,22,-103,-90,22,-79,22,-80,-82,-95,-97,22,-28,22,22,-81,-83,-84,-85,-91,-92,22,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'NOT':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,64,66,69,70,71,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,104,105,110,111,112,113,115,116,118,119,121,122,123,124,125,126,127,133,134,136,138,139,140,142,143,144,145,147,153,154,156,159,161,162,163,165,167,168,169,170,171,172,173,174,176,177,180,181,182,184,185,186,187,188,],[27,27,-103,-12,-13,-7,-8,-9,-14,-35,27,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,27,27,27,27,27,27,27,-73,-74,-75,-76,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-15,27,27,-70,-35,-45,-46,-47,-33,-72,27,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,27,27,-20,-63,27,-69,-26,-32,-71,-77,27,27,-78,27,27,27,27,27,-102,27,-27,27,-103,-90,27,-79,27,-80,-82,-95,-97,27,-28,27,27,-81,-83,-84,-85,-91,-92,27,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'+':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,63,64,66,69,70,71,72,73,74,76,77,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,104,105,109,110,111,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,132,133,134,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,156,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,176,177,179,180,181,182,183,184,185,186,187,188,],[28,28,-103,-12,-13,-7,-8,46,-14,-35,28,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,28,28,28,28,28,28,28,-73,-74,-75,-76,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-15,28,28,46,-70,-35,46,-46,-47,46,46,46,-72,46,28,46,46,46,46,-52,-53,-54,-55,-56,-57,-58,46,46,46,46,46,28,28,46,46,-63,28,-69,-26,-32,-71,46,-77,28,46,28,-78,28,28,28,28,28,46,-102,28,-27,28,-103,-90,46,28,-79,28,-80,46,-82,46,46,46,46,46,-95,-97,28,-28,46,28,28,-81,46,-83,46,-84,-85,-91,-92,28,-94,-96,-25,-29,-30,46,-86,-87,-88,46,-31,-11,-89,-93,-10,]),'-':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,63,64,66,69,70,71,72,73,74,76,77,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,104,105,109,110,111,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,132,133,134,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,156,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,176,177,179,180,181,182,183,184,185,186,187,188,],[29,29,-103,-12,-13,-7,-8,47,-14,-35,29,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,29,29,29,29,29,29,29,-73,-74,-75,-76,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,-15,29,29,47,-70,-35,47,-46,-47,47,47,47,-72,47,29,47,47,47,47,-52,-53,-54,-55,-56,-57,-58,47,47,47,47,47,29,29,47,47,-63,29,-69,-26,-32,-71,47,-77,29,47,29,-78,29,29,29,29,29,47,-102,29,-27,29,-103,-90,47,29,-79,29,-80,47,-82,47,47,47,47,47,-95,-97,29,-28,47,29,29,-81,47,-83,47,-84,-85,-91,-92,29,-94,-96,-25,-29,-30,47,-86,-87,-88,47,-31,-11,-89,-93,-10,]),'(':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,60,61,62,64,66,69,70,71,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,98,99,100,101,102,103,104,105,110,111,112,113,115,116,118,119,121,122,123,124,125,126,127,133,134,136,138,139,140,142,143,144,145,147,153,154,156,159,161,162,163,165,167,168,169,170,171,172,173,174,176,177,180,181,182,184,185,186,187,188,],[13,13,-103,-12,-13,-7,-8,-9,-14,62,13,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,13,13,13,13,13,13,13,-73,-74,-75,-76,78,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,-15,104,13,13,-70,62,-45,-46,-47,-33,-72,13,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,13,123,124,125,126,127,128,13,-20,-63,13,-69,-26,-32,-71,-77,13,13,-78,13,13,13,13,13,-102,13,-27,13,-103,-90,13,-79,13,-80,-82,-95,-97,13,-28,13,13,-81,-83,-84,-85,-91,-92,13,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'IF':([0,3,4,5,6,7,8,9,10,12,14,15,16,17,18,19,20,21,22,23,24,25,26,32,34,35,36,37,40,41,59,64,66,69,70,71,74,76,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,105,110,112,113,115,116,118,122,133,136,139,140,143,145,147,153,154,159,161,163,165,167,168,169,170,172,173,174,176,177,180,181,182,184,185,186,187,188,],[30,30,-103,-12,-13,-7,-8,-9,-14,-35,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,-34,-73,-74,-75,-76,30,30,-15,-70,-35,-45,-46,-47,-33,-72,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-20,-63,-69,-26,-32,-71,-77,-78,-102,-27,-103,-90,-79,-80,-82,-95,-97,-28,30,-81,-83,-84,-85,-91,-92,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'WHILE':([0,3,4,5,6,7,8,9,10,12,14,15,16,17,18,19,20,21,22,23,24,25,26,32,34,35,36,37,40,41,59,64,66,69,70,71,74,76,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,105,110,112,113,115,116,118,122,133,136,139,140,143,145,147,153,154,159,161,163,165,167,168,169,170,172,173,174,176,177,180,181,182,184,185,186,187,188,],[31,31,-103,-12,-13,-7,-8,-9,-14,-35,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,-34,-73,-74,-75,-76,31,31,-15,-70,-35,-45,-46,-47,-33,-72,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-20,-63,-69,-26,-32,-71,-77,-78,-102,-27,-103,-90,-79,-80,-82,-95,-97,-28,31,-81,-83,-84,-85,-91,-92,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'RETURN':([0,3,4,5,6,7,8,9,10,12,14,15,16,17,18,19,20,21,22,23,24,25,26,32,34,35,36,37,40,41,59,64,66,69,70,71,74,76,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,105,110,112,113,115,116,118,122,133,136,139,140,143,145,147,153,154,159,161,163,165,167,168,169,170,172,173,174,176,177,180,181,182,184,185,186,187,188,],[32,32,-103,-12,-13,-7,-8,-9,-14,-35,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,-34,-73,-74,-75,-76,32,32,-15,-70,-35,-45,-46,-47,-33,-72,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-20,-63,-69,-26,-32,-71,-77,-78,-102,-27,-103,-90,-79,-80,-82,-95,-97,-28,32,-81,-83,-84,-85,-91,-92,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'[':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,63,64,66,69,70,71,72,73,74,76,77,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,104,105,109,110,111,112,113,115,116,117,118,119,120,121,122,123,124,125,126,127,132,133,134,136,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,156,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,176,177,179,180,181,182,183,184,185,186,187,188,],[33,33,-103,-12,-13,-7,-8,57,-14,-35,33,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,33,33,33,33,33,33,33,-73,-74,-75,-76,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,-15,33,33,57,-70,-35,-45,-46,-47,57,57,57,-72,57,33,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,57,33,33,57,57,-63,33,-69,-26,-32,-71,57,-77,33,57,33,-78,33,33,33,33,33,57,-102,33,-27,33,-103,-90,57,33,-79,33,-80,57,-82,57,57,57,57,57,-95,-97,33,-28,57,33,33,-81,57,-83,57,-84,-85,-91,-92,33,-94,-96,-25,-29,-30,57,-86,-87,-88,57,-31,-11,-89,-93,-10,]),'LEN':([0,3,4,5,6,7,8,9,10,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,59,61,62,64,66,69,70,71,74,76,78,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,97,104,105,110,111,112,113,115,116,118,119,121,122,123,124,125,126,127,133,134,136,138,139,140,142,143,144,145,147,153,154,156,159,161,162,163,165,167,168,169,170,171,172,173,174,176,177,180,181,182,184,185,186,187,188,],[38,38,-103,-12,-13,-7,-8,-9,-14,-35,38,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,38,38,38,38,38,38,38,-73,-74,-75,-76,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-15,38,38,-70,-35,-45,-46,-47,-33,-72,38,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,38,38,-20,-63,38,-69,-26,-32,-71,-77,38,38,-78,38,38,38,38,38,-102,38,-27,38,-103,-90,38,-79,38,-80,-82,-95,-97,38,-28,38,38,-81,-83,-84,-85,-91,-92,38,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'$end':([1,2,4,7,8,9,10,12,14,15,16,17,18,19,20,21,22,23,24,25,26,32,34,35,36,37,39,40,59,64,66,69,70,71,74,76,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,105,110,112,113,115,116,118,122,133,136,140,143,145,147,153,154,159,163,165,167,168,169,170,172,173,174,176,177,180,181,182,184,185,186,187,188,],[0,-1,-3,-7,-8,-9,-14,-35,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,-34,-73,-74,-75,-76,-2,-4,-15,-70,-35,-45,-46,-47,-33,-72,-5,-6,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-20,-63,-69,-26,-32,-71,-77,-78,-102,-27,-90,-79,-80,-82,-95,-97,-28,-81,-83,-84,-85,-91,-92,-94,-96,-25,-29,-30,-86,-87,-88,-31,-11,-89,-93,-10,]),'#':([4,7,8,9,10,12,14,15,16,17,18,19,20,21,22,23,24,25,26,32,34,35,36,37,40,59,64,66,69,70,71,74,76,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,105,110,112,113,115,116,118,122,133,136,140,143,145,147,153,154,159,163,165,167,168,169,170,172,173,174,176,177,178,180,181,182,184,185,186,187,188,],[-3,-7,-8,-9,-14,-35,-16,-17,-18,-19,-36,-37,-38,-39,-40,-41,-42,-43,-44,-34,-73,-74,-75,-76,-4,-15,-70,-35,-45,-46,-47,-33,-72,-5,-6,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-20,-63,-69,-26,-32,-71,-77,-78,-102,-27,-90,-79,-80,-82,-95,-97,-28,-81,-83,-84,-85,-91,-92,-94,-96,-25,-29,-30,185,-86,-87,-88,-31,-11,-89,-93,-10,]),'AND':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[42,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,42,-70,-35,-45,-46,-47,42,42,42,-72,42,-48,42,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,42,42,42,-63,-69,-71,42,-77,42,-78,42,-102,-90,42,-79,-80,42,-82,42,42,42,42,42,-95,-97,42,-81,42,-83,42,-84,-85,-91,-92,-94,-96,42,-86,-87,-88,42,-89,-93,]),'OR':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[43,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,43,-70,-35,-45,-46,-47,43,43,43,-72,43,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,43,43,43,-63,-69,-71,43,-77,43,-78,43,-102,-90,43,-79,-80,43,-82,43,43,43,43,43,-95,-97,43,-81,43,-83,43,-84,-85,-91,-92,-94,-96,43,-86,-87,-88,43,-89,-93,]),'EQUAL_EQUAL':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[44,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,44,-70,-35,44,-46,-47,44,44,44,-72,44,44,44,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,44,44,44,-63,-69,-71,44,-77,44,-78,44,-102,-90,44,-79,-80,44,-82,44,44,44,44,44,-95,-97,44,-81,44,-83,44,-84,-85,-91,-92,-94,-96,44,-86,-87,-88,44,-89,-93,]),'NOT_EQUAL':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[45,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,45,-70,-35,45,-46,-47,45,45,45,-72,45,45,45,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,45,45,45,-63,-69,-71,45,-77,45,-78,45,-102,-90,45,-79,-80,45,-82,45,45,45,45,45,-95,-97,45,-81,45,-83,45,-84,-85,-91,-92,-94,-96,45,-86,-87,-88,45,-89,-93,]),'*':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[48,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,48,-70,-35,48,-46,-47,48,48,48,-72,48,48,48,48,48,48,48,-54,-55,-56,-57,-58,48,48,48,48,48,48,48,-63,-69,-71,48,-77,48,-78,48,-102,-90,48,-79,-80,48,-82,48,48,48,48,48,-95,-97,48,-81,48,-83,48,-84,-85,-91,-92,-94,-96,48,-86,-87,-88,48,-89,-93,]),'/':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[49,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,49,-70,-35,49,-46,-47,49,49,49,-72,49,49,49,49,49,49,49,-54,-55,-56,-57,-58,49,49,49,49,49,49,49,-63,-69,-71,49,-77,49,-78,49,-102,-90,49,-79,-80,49,-82,49,49,49,49,49,-95,-97,49,-81,49,-83,49,-84,-85,-91,-92,-94,-96,49,-86,-87,-88,49,-89,-93,]),'%':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[50,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,50,-70,-35,50,-46,-47,50,50,50,-72,50,50,50,50,50,50,50,-54,-55,-56,-57,-58,50,50,50,50,50,50,50,-63,-69,-71,50,-77,50,-78,50,-102,-90,50,-79,-80,50,-82,50,50,50,50,50,-95,-97,50,-81,50,-83,50,-84,-85,-91,-92,-94,-96,50,-86,-87,-88,50,-89,-93,]),'POWER':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[51,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,51,-70,-35,51,-46,-47,51,51,51,-72,51,51,51,51,51,51,51,51,51,51,-57,51,51,51,51,51,51,51,51,-63,-69,-71,51,-77,51,-78,51,-102,-90,51,-79,-80,51,-82,51,51,51,51,51,-95,-97,51,-81,51,-83,51,-84,-85,-91,-92,-94,-96,51,-86,-87,-88,51,-89,-93,]),'INT_DIVIDE':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[52,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,52,-70,-35,52,-46,-47,52,52,52,-72,52,52,52,52,52,52,52,-54,-55,-56,-57,-58,52,52,52,52,52,52,52,-63,-69,-71,52,-77,52,-78,52,-102,-90,52,-79,-80,52,-82,52,52,52,52,52,-95,-97,52,-81,52,-83,52,-84,-85,-91,-92,-94,-96,52,-86,-87,-88,52,-89,-93,]),'>':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[53,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,53,-70,-35,53,-46,-47,53,53,53,-72,53,53,53,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,53,53,53,-63,-69,-71,53,-77,53,-78,53,-102,-90,53,-79,-80,53,-82,53,53,53,53,53,-95,-97,53,-81,53,-83,53,-84,-85,-91,-92,-94,-96,53,-86,-87,-88,53,-89,-93,]),'<':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[54,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,54,-70,-35,54,-46,-47,54,54,54,-72,54,54,54,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,54,54,54,-63,-69,-71,54,-77,54,-78,54,-102,-90,54,-79,-80,54,-82,54,54,54,54,54,-95,-97,54,-81,54,-83,54,-84,-85,-91,-92,-94,-96,54,-86,-87,-88,54,-89,-93,]),'GREATER_EQUAL':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[55,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,55,-70,-35,55,-46,-47,55,55,55,-72,55,55,55,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,55,55,55,-63,-69,-71,55,-77,55,-78,55,-102,-90,55,-79,-80,55,-82,55,55,55,55,55,-95,-97,55,-81,55,-83,55,-84,-85,-91,-92,-94,-96,55,-86,-87,-88,55,-89,-93,]),'LESS_EQUAL':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[56,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,56,-70,-35,56,-46,-47,56,56,56,-72,56,56,56,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,56,56,56,-63,-69,-71,56,-77,56,-78,56,-102,-90,56,-79,-80,56,-82,56,56,56,56,56,-95,-97,56,-81,56,-83,56,-84,-85,-91,-92,-94,-96,56,-86,-87,-88,56,-89,-93,]),'.':([9,12,18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,72,73,74,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,110,112,116,117,118,120,122,132,133,140,141,143,145,146,147,148,149,150,151,152,153,154,160,163,164,165,166,167,168,169,170,172,173,179,180,181,182,183,186,187,],[58,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,58,-70,-35,-45,-46,-47,58,58,58,-72,58,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,58,58,58,-63,-69,-71,58,-77,58,-78,58,-102,-90,58,-79,-80,58,-82,58,58,58,58,58,-95,-97,58,-81,58,-83,58,-84,-85,-91,-92,-94,-96,58,-86,-87,-88,58,-89,-93,]),'ELSE':([10,59,113,136,177,184,185,188,],[-14,-15,137,158,-30,-31,-11,-10,]),'ELIF':([10,59,113,177,185,188,],[-14,-15,138,138,-11,-10,]),'=':([12,],[61,]),')':([13,18,19,20,21,22,23,24,25,26,34,35,36,37,62,63,64,65,66,67,68,69,70,71,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,104,106,107,108,109,110,111,112,116,117,118,122,127,128,129,130,131,132,133,135,140,143,145,147,148,149,151,152,153,154,157,163,165,167,168,169,170,172,173,175,180,181,182,183,186,187,],[64,-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,-103,110,-70,112,-35,-67,-68,-45,-46,-47,-72,-66,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,-103,133,-100,-101,-98,-63,-65,-69,-71,140,-77,-78,153,154,155,-23,-24,-21,-102,-64,-90,-79,-80,-82,169,170,172,173,-95,-97,-99,-81,-83,-84,-85,-91,-92,-94,-96,-22,-86,-87,-88,187,-89,-93,]),',':([18,19,20,21,22,23,24,25,26,34,35,36,37,63,64,66,69,70,71,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,109,110,112,116,118,122,132,133,140,143,145,147,150,153,154,163,165,167,168,169,170,172,173,180,181,182,186,187,],[-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,111,-70,-35,-45,-46,-47,-72,111,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,134,-63,-69,-71,-77,-78,156,-102,-90,-79,-80,-82,171,-95,-97,-81,-83,-84,-85,-91,-92,-94,-96,-86,-87,-88,-89,-93,]),':':([18,19,20,21,22,23,24,25,26,34,35,36,37,57,64,66,69,70,71,72,73,76,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,110,112,116,118,119,120,122,133,137,140,141,143,145,147,153,154,155,158,160,163,165,167,168,169,170,172,173,180,181,182,186,187,],[-36,-37,-38,-39,-40,-41,-42,-43,-44,-73,-74,-75,-76,97,-70,-35,-45,-46,-47,114,114,-72,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,119,121,-63,-69,-71,-77,142,144,-78,-102,114,-90,162,-79,-80,-82,-95,-97,114,114,114,-81,-83,-84,-85,-91,-92,-94,-96,-86,-87,-88,-89,-93,]),']':([18,19,20,21,22,23,24,25,26,33,34,35,36,37,64,66,67,68,69,70,71,75,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,110,111,112,116,118,119,120,121,122,133,135,140,141,142,143,144,145,146,147,153,154,162,163,164,165,166,167,168,169,170,172,173,179,180,181,182,186,187,],[-36,-37,-38,-39,-40,-41,-42,-43,-44,76,-73,-74,-75,-76,-70,-35,-67,-68,-45,-46,-47,116,-72,-66,-48,-49,-50,-51,-52,-53,-54,-55,-56,-57,-58,-59,-60,-61,-62,118,122,-63,-65,-69,-71,-77,143,145,147,-78,-102,-64,-90,163,165,-79,167,-80,168,-82,-95,-97,180,-81,181,-83,182,-84,-85,-91,-92,-94,-96,186,-86,-87,-88,-89,-93,]),'APPEND':([58,],[98,]),'EXTEND':([58,],[99,]),'INSERT':([58,],[100,]),'INDEX':([58,],[101,]),'POP':([58,],[102,]),'COPY':([58,],[103,]),}
+_lr_action_items = {'error':([0,3,4,5,6,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,52,70,71,83,85,88,89,90,94,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,199,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[10,10,-130,-13,-14,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,10,10,-10,-16,-93,-57,-68,-69,-70,-53,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-130,-55,-117,-106,-107,-109,-122,-124,-41,10,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'NEW_LINE':([0,4,7,8,9,10,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,70,71,83,85,88,89,90,94,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,142,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[11,11,-7,-8,-9,70,11,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,-10,-16,-93,-57,-68,-69,-70,-53,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,11,-45,-56,-94,-104,-105,-129,-40,11,-55,-117,-106,-107,-109,-122,-124,-41,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,11,-96,-97,-116,-120,-11,-98,-99,]),'DEF':([0,3,4,5,6,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,52,70,71,83,85,88,89,90,94,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,199,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[12,12,-130,-13,-14,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,12,12,-10,-16,-93,-57,-68,-69,-70,-53,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-130,-55,-117,-106,-107,-109,-122,-124,-41,12,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'ID':([0,3,4,5,6,7,8,9,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,83,85,88,89,90,94,95,97,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,125,126,127,128,129,130,131,132,133,138,139,140,141,143,144,146,147,148,150,151,153,154,155,156,157,158,159,165,166,169,171,172,176,178,180,181,182,183,185,191,192,194,197,199,200,201,202,203,204,205,207,209,210,211,212,213,214,215,216,218,219,225,226,227,229,230,232,233,234,235,236,237,238,239,243,245,246,],[13,13,-130,-13,-14,-7,-8,-9,-15,72,-57,85,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,85,85,85,85,85,93,-51,-52,85,85,-100,-101,-102,-103,13,13,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,85,-10,-16,85,85,85,85,85,85,85,85,85,-93,-57,-68,-69,-70,-53,85,-95,85,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,85,85,-26,-27,-28,-29,-30,-31,-32,-33,-86,85,-92,-39,-45,85,-56,-94,177,-104,85,85,-105,85,85,85,85,85,-129,85,-40,85,-130,-55,-117,85,-106,85,-107,-109,-122,-124,85,-41,13,-46,-47,85,85,85,-108,-110,-111,-112,-118,-119,85,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,85,-96,85,-97,85,-116,-120,-11,85,-98,-99,]),'TRUE':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,83,85,88,89,90,94,95,97,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,125,126,127,128,129,130,131,132,133,138,139,140,141,143,144,146,147,150,151,153,154,155,156,157,158,159,165,166,169,171,172,176,178,180,181,182,183,185,191,192,194,197,199,200,201,202,203,204,205,207,209,210,211,212,213,214,215,216,218,219,225,226,227,229,230,232,233,234,235,236,237,238,239,243,245,246,],[24,24,-130,-13,-14,-7,-8,-9,-15,-57,24,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,24,24,24,24,24,-51,-52,24,24,-100,-101,-102,-103,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,-10,-16,24,24,24,24,24,24,24,24,24,-93,-57,-68,-69,-70,-53,24,-95,24,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,24,24,-26,-27,-28,-29,-30,-31,-32,-33,-86,24,-92,-39,-45,24,-56,-94,-104,24,24,-105,24,24,24,24,24,-129,24,-40,24,-130,-55,-117,24,-106,24,-107,-109,-122,-124,24,-41,24,-46,-47,24,24,24,-108,-110,-111,-112,-118,-119,24,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,24,-96,24,-97,24,-116,-120,-11,24,-98,-99,]),'FALSE':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,83,85,88,89,90,94,95,97,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,125,126,127,128,129,130,131,132,133,138,139,140,141,143,144,146,147,150,151,153,154,155,156,157,158,159,165,166,169,171,172,176,178,180,181,182,183,185,191,192,194,197,199,200,201,202,203,204,205,207,209,210,211,212,213,214,215,216,218,219,225,226,227,229,230,232,233,234,235,236,237,238,239,243,245,246,],[25,25,-130,-13,-14,-7,-8,-9,-15,-57,25,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,25,25,25,25,25,-51,-52,25,25,-100,-101,-102,-103,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,-10,-16,25,25,25,25,25,25,25,25,25,-93,-57,-68,-69,-70,-53,25,-95,25,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,25,25,-26,-27,-28,-29,-30,-31,-32,-33,-86,25,-92,-39,-45,25,-56,-94,-104,25,25,-105,25,25,25,25,25,-129,25,-40,25,-130,-55,-117,25,-106,25,-107,-109,-122,-124,25,-41,25,-46,-47,25,25,25,-108,-110,-111,-112,-118,-119,25,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,25,-96,25,-97,25,-116,-120,-11,25,-98,-99,]),'INT':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,83,85,88,89,90,94,95,97,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,125,126,127,128,129,130,131,132,133,138,139,140,141,143,144,146,147,150,151,153,154,155,156,157,158,159,165,166,169,171,172,176,178,180,181,182,183,185,191,192,194,197,199,200,201,202,203,204,205,207,209,210,211,212,213,214,215,216,218,219,225,226,227,229,230,232,233,234,235,236,237,238,239,243,245,246,],[26,26,-130,-13,-14,-7,-8,-9,-15,-57,26,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,26,26,26,26,26,-51,-52,26,26,-100,-101,-102,-103,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,-10,-16,26,26,26,26,26,26,26,26,26,-93,-57,-68,-69,-70,-53,26,-95,26,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,26,26,-26,-27,-28,-29,-30,-31,-32,-33,-86,26,-92,-39,-45,26,-56,-94,-104,26,26,-105,26,26,26,26,26,-129,26,-40,26,-130,-55,-117,26,-106,26,-107,-109,-122,-124,26,-41,26,-46,-47,26,26,26,-108,-110,-111,-112,-118,-119,26,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,26,-96,26,-97,26,-116,-120,-11,26,-98,-99,]),'FLOAT':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,83,85,88,89,90,94,95,97,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,125,126,127,128,129,130,131,132,133,138,139,140,141,143,144,146,147,150,151,153,154,155,156,157,158,159,165,166,169,171,172,176,178,180,181,182,183,185,191,192,194,197,199,200,201,202,203,204,205,207,209,210,211,212,213,214,215,216,218,219,225,226,227,229,230,232,233,234,235,236,237,238,239,243,245,246,],[27,27,-130,-13,-14,-7,-8,-9,-15,-57,27,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,27,27,27,27,27,-51,-52,27,27,-100,-101,-102,-103,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,-10,-16,27,27,27,27,27,27,27,27,27,-93,-57,-68,-69,-70,-53,27,-95,27,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,27,27,-26,-27,-28,-29,-30,-31,-32,-33,-86,27,-92,-39,-45,27,-56,-94,-104,27,27,-105,27,27,27,27,27,-129,27,-40,27,-130,-55,-117,27,-106,27,-107,-109,-122,-124,27,-41,27,-46,-47,27,27,27,-108,-110,-111,-112,-118,-119,27,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,27,-96,27,-97,27,-116,-120,-11,27,-98,-99,]),'STR':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,83,85,88,89,90,94,95,97,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,125,126,127,128,129,130,131,132,133,138,139,140,141,143,144,146,147,150,151,153,154,155,156,157,158,159,165,166,169,171,172,176,178,180,181,182,183,185,191,192,194,197,199,200,201,202,203,204,205,207,209,210,211,212,213,214,215,216,218,219,225,226,227,229,230,232,233,234,235,236,237,238,239,243,245,246,],[28,28,-130,-13,-14,-7,-8,-9,-15,-57,28,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,28,28,28,28,28,-51,-52,28,28,-100,-101,-102,-103,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,-10,-16,28,28,28,28,28,28,28,28,28,-93,-57,-68,-69,-70,-53,28,-95,28,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,28,28,-26,-27,-28,-29,-30,-31,-32,-33,-86,28,-92,-39,-45,28,-56,-94,-104,28,28,-105,28,28,28,28,28,-129,28,-40,28,-130,-55,-117,28,-106,28,-107,-109,-122,-124,28,-41,28,-46,-47,28,28,28,-108,-110,-111,-112,-118,-119,28,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,28,-96,28,-97,28,-116,-120,-11,28,-98,-99,]),'NOT':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,83,85,88,89,90,94,95,97,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,125,126,127,128,129,130,131,132,133,138,139,140,141,143,144,146,147,150,151,153,154,155,156,157,158,159,165,166,169,171,172,176,178,180,181,182,183,185,191,192,194,197,199,200,201,202,203,204,205,207,209,210,211,212,213,214,215,216,218,219,225,226,227,229,230,232,233,234,235,236,237,238,239,243,245,246,],[34,34,-130,-13,-14,-7,-8,-9,-15,-57,34,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,34,34,34,34,34,-51,-52,34,34,-100,-101,-102,-103,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,-10,-16,34,34,34,34,34,34,34,34,34,-93,-57,-68,-69,-70,-53,34,-95,34,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,34,34,-26,-27,-28,-29,-30,-31,-32,-33,-86,34,-92,-39,-45,34,-56,-94,-104,34,34,-105,34,34,34,34,34,-129,34,-40,34,-130,-55,-117,34,-106,34,-107,-109,-122,-124,34,-41,34,-46,-47,34,34,34,-108,-110,-111,-112,-118,-119,34,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,34,-96,34,-97,34,-116,-120,-11,34,-98,-99,]),'+':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,82,83,85,88,89,90,91,92,94,95,97,98,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,125,126,127,128,129,130,131,132,133,137,138,139,140,141,143,144,145,146,147,149,150,151,152,153,154,155,156,157,158,159,164,165,166,167,169,171,172,173,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,194,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,218,219,221,222,224,225,226,227,228,229,230,232,233,234,235,236,237,238,239,240,241,242,243,245,246,247,],[35,35,-130,-13,-14,-7,-8,57,-15,-57,35,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,35,35,35,35,35,-51,-52,35,35,-100,-101,-102,-103,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,-10,-16,35,35,35,35,35,35,35,35,35,57,-93,-57,57,-69,-70,57,57,57,35,-95,57,35,57,57,57,57,-75,-76,-77,-78,-79,-80,-81,57,57,57,57,57,35,35,57,57,57,57,57,57,57,57,57,-86,35,-92,-39,-45,35,57,-56,-94,57,-104,35,57,35,-105,35,35,35,35,35,57,-129,35,57,-40,35,-130,57,-55,-117,57,35,-106,35,-107,57,-109,57,57,57,57,57,-122,-124,35,-41,57,35,-46,-47,35,35,35,-108,57,-110,57,-111,-112,-118,-119,35,-121,-123,-38,-42,-43,57,57,57,-113,-114,-115,57,-44,-12,35,-96,35,-97,35,-116,-120,-11,57,57,57,35,-98,-99,57,]),'-':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,82,83,85,88,89,90,91,92,94,95,97,98,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,125,126,127,128,129,130,131,132,133,137,138,139,140,141,143,144,145,146,147,149,150,151,152,153,154,155,156,157,158,159,164,165,166,167,169,171,172,173,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,194,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,218,219,221,222,224,225,226,227,228,229,230,232,233,234,235,236,237,238,239,240,241,242,243,245,246,247,],[36,36,-130,-13,-14,-7,-8,58,-15,-57,36,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,36,36,36,36,36,-51,-52,36,36,-100,-101,-102,-103,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,-10,-16,36,36,36,36,36,36,36,36,36,58,-93,-57,58,-69,-70,58,58,58,36,-95,58,36,58,58,58,58,-75,-76,-77,-78,-79,-80,-81,58,58,58,58,58,36,36,58,58,58,58,58,58,58,58,58,-86,36,-92,-39,-45,36,58,-56,-94,58,-104,36,58,36,-105,36,36,36,36,36,58,-129,36,58,-40,36,-130,58,-55,-117,58,36,-106,36,-107,58,-109,58,58,58,58,58,-122,-124,36,-41,58,36,-46,-47,36,36,36,-108,58,-110,58,-111,-112,-118,-119,36,-121,-123,-38,-42,-43,58,58,58,-113,-114,-115,58,-44,-12,36,-96,36,-97,36,-116,-120,-11,58,58,58,36,-98,-99,58,]),'(':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,43,44,45,46,47,48,49,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,72,73,74,75,76,77,78,79,80,81,83,85,88,89,90,94,95,97,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,138,139,140,141,143,144,146,147,150,151,153,154,155,156,157,158,159,165,166,169,171,172,175,176,178,180,181,182,183,185,191,192,194,197,199,200,201,202,203,204,205,207,209,210,211,212,213,214,215,216,218,219,225,226,227,229,230,232,233,234,235,236,237,238,239,243,245,246,],[14,14,-130,-13,-14,-7,-8,-9,-15,81,14,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,14,14,14,14,14,-51,-52,14,95,14,-100,-101,-102,-103,99,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,-10,-16,125,14,14,14,14,14,14,14,14,14,-93,81,-68,-69,-70,-53,14,-95,14,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,14,155,156,157,158,159,160,14,-26,-27,-28,-29,-30,-31,-32,-33,-86,14,-92,-39,-45,14,-56,-94,-104,14,14,-105,14,14,14,14,14,-129,14,-40,14,-130,202,-55,-117,14,-106,14,-107,-109,-122,-124,14,-41,14,-46,-47,14,14,14,-108,-110,-111,-112,-118,-119,14,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,14,-96,14,-97,14,-116,-120,-11,14,-98,-99,]),'IF':([0,3,4,5,6,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,52,70,71,83,85,88,89,90,94,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,199,200,201,205,207,209,210,211,212,214,215,216,218,219,222,223,225,226,227,229,230,231,233,235,237,238,239,244,245,246,248,],[37,37,-130,-13,-14,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,37,37,-10,-16,-93,-57,-68,-69,-70,-53,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-130,-55,-117,-106,-107,-109,-122,-124,-41,37,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,234,236,-113,-114,-115,-44,-12,-48,-96,-97,-116,-120,-11,-49,-98,-99,-50,]),'WHILE':([0,3,4,5,6,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,52,70,71,83,85,88,89,90,94,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,199,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[38,38,-130,-13,-14,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,38,38,-10,-16,-93,-57,-68,-69,-70,-53,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-130,-55,-117,-106,-107,-109,-122,-124,-41,38,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'FOR':([0,3,4,5,6,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,52,70,71,83,85,88,89,90,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,199,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[39,39,-130,-13,-14,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,39,39,-10,-16,-93,-57,-68,-69,-70,-53,-95,148,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-130,-55,-117,-106,-107,-109,-122,-124,-41,39,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'BREAK':([0,3,4,5,6,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,52,70,71,83,85,88,89,90,94,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,199,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[40,40,-130,-13,-14,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,40,40,-10,-16,-93,-57,-68,-69,-70,-53,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-130,-55,-117,-106,-107,-109,-122,-124,-41,40,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'CONTINUE':([0,3,4,5,6,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,52,70,71,83,85,88,89,90,94,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,199,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[41,41,-130,-13,-14,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,41,41,-10,-16,-93,-57,-68,-69,-70,-53,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-130,-55,-117,-106,-107,-109,-122,-124,-41,41,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'RETURN':([0,3,4,5,6,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,52,70,71,83,85,88,89,90,94,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,199,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[42,42,-130,-13,-14,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,42,42,-10,-16,-93,-57,-68,-69,-70,-53,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-130,-55,-117,-106,-107,-109,-122,-124,-41,42,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'PRINT':([0,3,4,5,6,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,52,70,71,83,85,88,89,90,94,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,172,176,178,181,183,185,191,192,197,199,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[43,43,-130,-13,-14,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,43,43,-10,-16,-93,-57,-68,-69,-70,-53,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-130,-55,-117,-106,-107,-109,-122,-124,-41,43,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'[':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,82,83,85,88,89,90,91,92,94,95,97,98,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,125,126,127,128,129,130,131,132,133,137,138,139,140,141,143,144,145,146,147,149,150,151,152,153,154,155,156,157,158,159,164,165,166,167,169,171,172,173,176,178,179,180,181,182,183,184,185,186,187,188,189,190,191,192,194,197,198,199,200,201,202,203,204,205,206,207,208,209,210,211,212,213,214,215,216,218,219,221,222,224,225,226,227,228,229,230,232,233,234,235,236,237,238,239,240,241,242,243,245,246,247,],[44,44,-130,-13,-14,-7,-8,68,-15,-57,44,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,44,44,44,44,44,-51,-52,44,44,-100,-101,-102,-103,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,44,-10,-16,44,44,44,44,44,44,44,44,44,68,-93,-57,-68,-69,-70,68,68,68,44,-95,68,44,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,68,44,44,68,68,68,68,68,68,68,68,68,-86,44,-92,-39,-45,44,68,-56,-94,68,-104,44,68,44,-105,44,44,44,44,44,68,-129,44,68,-40,44,-130,68,-55,-117,68,44,-106,44,-107,68,-109,68,68,68,68,68,-122,-124,44,-41,68,44,-46,-47,44,44,44,-108,68,-110,68,-111,-112,-118,-119,44,-121,-123,-38,-42,-43,68,68,68,-113,-114,-115,68,-44,-12,44,-96,44,-97,44,-116,-120,-11,68,68,68,44,-98,-99,68,]),'LEN':([0,3,4,5,6,7,8,9,11,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,40,41,42,44,45,46,47,48,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,70,71,73,74,75,76,77,78,79,80,81,83,85,88,89,90,94,95,97,99,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,118,125,126,127,128,129,130,131,132,133,138,139,140,141,143,144,146,147,150,151,153,154,155,156,157,158,159,165,166,169,171,172,176,178,180,181,182,183,185,191,192,194,197,199,200,201,202,203,204,205,207,209,210,211,212,213,214,215,216,218,219,225,226,227,229,230,232,233,234,235,236,237,238,239,243,245,246,],[49,49,-130,-13,-14,-7,-8,-9,-15,-57,49,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,49,49,49,49,49,-51,-52,49,49,-100,-101,-102,-103,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,-10,-16,49,49,49,49,49,49,49,49,49,-93,-57,-68,-69,-70,-53,49,-95,49,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,49,49,-26,-27,-28,-29,-30,-31,-32,-33,-86,49,-92,-39,-45,49,-56,-94,-104,49,49,-105,49,49,49,49,49,-129,49,-40,49,-130,-55,-117,49,-106,49,-107,-109,-122,-124,49,-41,49,-46,-47,49,49,49,-108,-110,-111,-112,-118,-119,49,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,49,-96,49,-97,49,-116,-120,-11,49,-98,-99,]),'$end':([1,2,4,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,50,51,70,71,83,85,88,89,90,94,97,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,176,178,181,183,185,191,192,197,200,201,205,207,209,210,211,212,214,215,216,218,219,225,226,227,229,230,233,235,237,238,239,245,246,],[0,-1,-3,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,-2,-4,-10,-16,-93,-57,-68,-69,-70,-53,-95,-5,-6,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-55,-117,-106,-107,-109,-122,-124,-41,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'#':([4,7,8,9,11,13,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,40,41,42,45,46,47,48,51,70,71,83,85,88,89,90,94,97,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,126,127,128,129,130,131,132,133,138,140,141,143,146,147,150,154,165,169,176,178,181,183,185,191,192,197,200,201,205,207,209,210,211,212,214,215,216,218,219,220,225,226,227,229,230,233,235,237,238,239,245,246,],[-3,-7,-8,-9,-15,-57,-17,-18,-19,-20,-21,-22,-23,-24,-25,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-51,-52,-54,-100,-101,-102,-103,-4,-10,-16,-93,-57,-68,-69,-70,-53,-95,-5,-6,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-26,-27,-28,-29,-30,-31,-32,-33,-86,-92,-39,-45,-56,-94,-104,-105,-129,-40,-55,-117,-106,-107,-109,-122,-124,-41,-46,-47,-108,-110,-111,-112,-118,-119,-121,-123,-38,-42,-43,230,-113,-114,-115,-44,-12,-96,-97,-116,-120,-11,-98,-99,]),'AND':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[53,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,53,-93,-57,-68,-69,-70,53,53,53,-95,53,-71,53,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,53,53,53,53,53,53,53,53,53,53,-86,-92,53,-94,53,-104,53,-105,53,-129,53,53,-117,53,-106,-107,53,-109,53,53,53,53,53,-122,-124,53,-108,53,-110,53,-111,-112,-118,-119,-121,-123,53,53,53,-113,-114,-115,53,-96,-97,-116,-120,53,53,53,-98,-99,53,]),'OR':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[54,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,54,-93,-57,-68,-69,-70,54,54,54,-95,54,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,54,54,54,54,54,54,54,54,54,54,-86,-92,54,-94,54,-104,54,-105,54,-129,54,54,-117,54,-106,-107,54,-109,54,54,54,54,54,-122,-124,54,-108,54,-110,54,-111,-112,-118,-119,-121,-123,54,54,54,-113,-114,-115,54,-96,-97,-116,-120,54,54,54,-98,-99,54,]),'EQUAL_EQUAL':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[55,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,55,-93,-57,55,-69,-70,55,55,55,-95,55,55,55,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,55,55,55,55,55,55,55,55,55,55,-86,-92,55,-94,55,-104,55,-105,55,-129,55,55,-117,55,-106,-107,55,-109,55,55,55,55,55,-122,-124,55,-108,55,-110,55,-111,-112,-118,-119,-121,-123,55,55,55,-113,-114,-115,55,-96,-97,-116,-120,55,55,55,-98,-99,55,]),'NOT_EQUAL':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[56,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,56,-93,-57,56,-69,-70,56,56,56,-95,56,56,56,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,56,56,56,56,56,56,56,56,56,56,-86,-92,56,-94,56,-104,56,-105,56,-129,56,56,-117,56,-106,-107,56,-109,56,56,56,56,56,-122,-124,56,-108,56,-110,56,-111,-112,-118,-119,-121,-123,56,56,56,-113,-114,-115,56,-96,-97,-116,-120,56,56,56,-98,-99,56,]),'*':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[59,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,59,-93,-57,59,-69,-70,59,59,59,-95,59,59,59,59,59,59,59,-77,-78,-79,-80,-81,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-86,-92,59,-94,59,-104,59,-105,59,-129,59,59,-117,59,-106,-107,59,-109,59,59,59,59,59,-122,-124,59,-108,59,-110,59,-111,-112,-118,-119,-121,-123,59,59,59,-113,-114,-115,59,-96,-97,-116,-120,59,59,59,-98,-99,59,]),'/':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[60,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,60,-93,-57,60,-69,-70,60,60,60,-95,60,60,60,60,60,60,60,-77,-78,-79,-80,-81,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-86,-92,60,-94,60,-104,60,-105,60,-129,60,60,-117,60,-106,-107,60,-109,60,60,60,60,60,-122,-124,60,-108,60,-110,60,-111,-112,-118,-119,-121,-123,60,60,60,-113,-114,-115,60,-96,-97,-116,-120,60,60,60,-98,-99,60,]),'%':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[61,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,61,-93,-57,61,-69,-70,61,61,61,-95,61,61,61,61,61,61,61,-77,-78,-79,-80,-81,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-86,-92,61,-94,61,-104,61,-105,61,-129,61,61,-117,61,-106,-107,61,-109,61,61,61,61,61,-122,-124,61,-108,61,-110,61,-111,-112,-118,-119,-121,-123,61,61,61,-113,-114,-115,61,-96,-97,-116,-120,61,61,61,-98,-99,61,]),'POWER':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[62,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,62,-93,-57,62,-69,-70,62,62,62,-95,62,62,62,62,62,62,62,62,62,62,-80,62,62,62,62,62,62,62,62,62,62,62,62,62,62,62,-86,-92,62,-94,62,-104,62,-105,62,-129,62,62,-117,62,-106,-107,62,-109,62,62,62,62,62,-122,-124,62,-108,62,-110,62,-111,-112,-118,-119,-121,-123,62,62,62,-113,-114,-115,62,-96,-97,-116,-120,62,62,62,-98,-99,62,]),'INT_DIVIDE':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[63,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,63,-93,-57,63,-69,-70,63,63,63,-95,63,63,63,63,63,63,63,-77,-78,-79,-80,-81,63,63,63,63,63,63,63,63,63,63,63,63,63,63,-86,-92,63,-94,63,-104,63,-105,63,-129,63,63,-117,63,-106,-107,63,-109,63,63,63,63,63,-122,-124,63,-108,63,-110,63,-111,-112,-118,-119,-121,-123,63,63,63,-113,-114,-115,63,-96,-97,-116,-120,63,63,63,-98,-99,63,]),'>':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[64,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,64,-93,-57,64,-69,-70,64,64,64,-95,64,64,64,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,64,64,64,64,64,64,64,64,64,64,-86,-92,64,-94,64,-104,64,-105,64,-129,64,64,-117,64,-106,-107,64,-109,64,64,64,64,64,-122,-124,64,-108,64,-110,64,-111,-112,-118,-119,-121,-123,64,64,64,-113,-114,-115,64,-96,-97,-116,-120,64,64,64,-98,-99,64,]),'<':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[65,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,65,-93,-57,65,-69,-70,65,65,65,-95,65,65,65,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,65,65,65,65,65,65,65,65,65,65,-86,-92,65,-94,65,-104,65,-105,65,-129,65,65,-117,65,-106,-107,65,-109,65,65,65,65,65,-122,-124,65,-108,65,-110,65,-111,-112,-118,-119,-121,-123,65,65,65,-113,-114,-115,65,-96,-97,-116,-120,65,65,65,-98,-99,65,]),'GREATER_EQUAL':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[66,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,66,-93,-57,66,-69,-70,66,66,66,-95,66,66,66,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,66,66,66,66,66,66,66,66,66,66,-86,-92,66,-94,66,-104,66,-105,66,-129,66,66,-117,66,-106,-107,66,-109,66,66,66,66,66,-122,-124,66,-108,66,-110,66,-111,-112,-118,-119,-121,-123,66,66,66,-113,-114,-115,66,-96,-97,-116,-120,66,66,66,-98,-99,66,]),'LESS_EQUAL':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[67,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,67,-93,-57,67,-69,-70,67,67,67,-95,67,67,67,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,67,67,67,67,67,67,67,67,67,67,-86,-92,67,-94,67,-104,67,-105,67,-129,67,67,-117,67,-106,-107,67,-109,67,67,67,67,67,-122,-124,67,-108,67,-110,67,-111,-112,-118,-119,-121,-123,67,67,67,-113,-114,-115,67,-96,-97,-116,-120,67,67,67,-98,-99,67,]),'.':([9,13,24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,91,92,94,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,138,140,145,147,149,150,152,154,164,165,167,173,178,179,181,183,184,185,186,187,188,189,190,191,192,198,205,206,207,208,209,210,211,212,214,215,221,222,224,225,226,227,228,233,235,237,238,240,241,242,245,246,247,],[69,-57,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,69,-93,-57,-68,-69,-70,69,69,69,-95,69,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,69,69,69,69,69,69,69,69,69,69,-86,-92,69,-94,69,-104,69,-105,69,-129,69,69,-117,69,-106,-107,69,-109,69,69,69,69,69,-122,-124,69,-108,69,-110,69,-111,-112,-118,-119,-121,-123,69,69,69,-113,-114,-115,69,-96,-97,-116,-120,69,69,69,-98,-99,69,]),'ELSE':([11,71,141,169,219,229,230,239,],[-15,-16,170,196,-43,-44,-12,-11,]),'ELIF':([11,71,141,219,230,239,],[-15,-16,171,171,-12,-11,]),'=':([13,],[73,]),'PLUS_EQUAL':([13,],[74,]),'MINUS_EQUAL':([13,],[75,]),'TIMES_EQUAL':([13,],[76,]),'DIVIDE_EQUAL':([13,],[77,]),'MOD_EQUAL':([13,],[78,]),'POWER_EQUAL':([13,],[79,]),'INT_DIVIDE_EQUAL':([13,],[80,]),')':([14,24,25,26,27,28,29,30,31,32,33,45,46,47,48,81,82,83,84,85,86,87,88,89,90,95,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,125,134,135,136,137,138,139,140,145,147,149,150,154,159,160,161,162,163,164,165,167,168,178,181,183,185,186,187,189,190,191,192,195,205,207,209,210,211,212,214,215,217,221,225,226,227,228,233,235,237,238,240,245,246,247,],[83,-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,-130,138,-93,140,-57,-90,-91,-68,-69,-70,146,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,-130,165,-127,-128,-125,-86,-88,-92,176,-94,178,-104,-105,191,192,193,-36,-37,-34,-129,-89,-87,-117,-106,-107,-109,211,212,214,215,-122,-124,-126,-108,-110,-111,-112,-118,-119,-121,-123,-35,231,-113,-114,-115,238,-96,-97,-116,-120,244,-98,-99,248,]),',':([24,25,26,27,28,29,30,31,32,33,45,46,47,48,82,83,85,88,89,90,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,137,138,140,147,150,154,164,165,167,178,181,183,185,188,191,192,205,207,209,210,211,212,214,215,221,225,226,227,233,235,237,238,240,245,246,],[-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,139,-93,-57,-68,-69,-70,-95,139,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,166,-86,-92,-94,-104,-105,194,-129,139,-117,-106,-107,-109,213,-122,-124,-108,-110,-111,-112,-118,-119,-121,-123,232,-113,-114,-115,-96,-97,-116,-120,243,-98,-99,]),':':([24,25,26,27,28,29,30,31,32,33,45,46,47,48,68,83,85,88,89,90,91,92,97,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,138,140,147,150,151,152,154,165,170,173,174,178,179,181,183,185,191,192,193,196,198,205,207,209,210,211,212,214,215,225,226,227,231,233,235,237,238,244,245,246,248,],[-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,-100,-101,-102,-103,118,-93,-57,-68,-69,-70,142,142,-95,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,151,153,-86,-92,-94,-104,180,182,-105,-129,142,142,142,-117,204,-106,-107,-109,-122,-124,142,142,142,-108,-110,-111,-112,-118,-119,-121,-123,-113,-114,-115,-48,-96,-97,-116,-120,-49,-98,-99,-50,]),']':([24,25,26,27,28,29,30,31,32,33,44,45,46,47,48,83,85,86,87,88,89,90,96,97,98,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,138,139,140,147,150,151,152,153,154,165,167,168,178,179,180,181,182,183,184,185,191,192,204,205,206,207,208,209,210,211,212,214,215,222,223,224,225,226,227,231,233,235,237,238,241,242,244,245,246,248,],[-58,-59,-60,-61,-62,-63,-64,-65,-66,-67,97,-100,-101,-102,-103,-93,-57,-90,-91,-68,-69,-70,147,-95,-89,-71,-72,-73,-74,-75,-76,-77,-78,-79,-80,-81,-82,-83,-84,-85,150,154,-86,-88,-92,-94,-104,181,183,185,-105,-129,-89,-87,-117,205,207,-106,209,-107,210,-109,-122,-124,225,-108,226,-110,227,-111,-112,-118,-119,-121,-123,233,235,237,-113,-114,-115,-48,-96,-97,-116,-120,245,246,-49,-98,-99,-50,]),'APPEND':([69,],[119,]),'EXTEND':([69,],[120,]),'INSERT':([69,],[121,]),'INDEX':([69,],[122,]),'POP':([69,],[123,]),'COPY':([69,],[124,]),'IN':([93,177,],[144,203,]),'RANGE':([144,203,],[175,175,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'program':([0,],[1,]),'code_lines':([0,3,40,41,161,],[2,39,79,80,178,]),'optional_new_lines':([0,4,139,],[3,41,161,]),'code_line':([0,3,40,41,161,],[4,4,4,4,4,]),'new_lines':([0,4,10,114,139,185,],[5,40,59,139,5,188,]),'empty':([0,4,13,33,62,104,139,],[6,6,68,68,108,131,6,]),'function_def':([0,3,40,41,161,],[7,7,7,7,7,]),'statement':([0,3,40,41,161,],[8,8,8,8,8,]),'expr':([0,3,13,27,28,29,30,31,32,33,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,61,62,78,97,104,111,119,121,123,124,125,126,127,134,138,142,144,156,161,162,171,],[9,9,63,69,70,71,72,73,74,77,9,9,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,105,109,117,120,132,77,141,146,148,149,150,151,152,109,160,164,166,132,9,179,183,]),'assignment_statement':([0,3,40,41,161,],[14,14,14,14,14,]),'if_statement':([0,3,40,41,161,],[15,15,15,15,15,]),'while_statement':([0,3,40,41,161,],[16,16,16,16,16,]),'return_statement':([0,3,40,41,161,],[17,17,17,17,17,]),'list':([0,3,13,27,28,29,30,31,32,33,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,61,62,78,97,104,111,119,121,123,124,125,126,127,134,138,142,144,156,161,162,171,],[23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,23,]),'tuple':([0,3,13,27,28,29,30,31,32,33,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,61,62,78,97,104,111,119,121,123,124,125,126,127,134,138,142,144,156,161,162,171,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'sequence_call':([0,3,13,27,28,29,30,31,32,33,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,61,62,78,97,104,111,119,121,123,124,125,126,127,134,138,142,144,156,161,162,171,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'function_call':([0,3,13,27,28,29,30,31,32,33,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,61,62,78,97,104,111,119,121,123,124,125,126,127,134,138,142,144,156,161,162,171,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'sequence_index':([0,3,13,27,28,29,30,31,32,33,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,61,62,78,97,104,111,119,121,123,124,125,126,127,134,138,142,144,156,161,162,171,],[34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,34,]),'sequence_slice':([0,3,13,27,28,29,30,31,32,33,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,61,62,78,97,104,111,119,121,123,124,125,126,127,134,138,142,144,156,161,162,171,],[35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,35,]),'sequence_function_call':([0,3,13,27,28,29,30,31,32,33,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,61,62,78,97,104,111,119,121,123,124,125,126,127,134,138,142,144,156,161,162,171,],[36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,36,]),'sequence_method':([0,3,13,27,28,29,30,31,32,33,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,61,62,78,97,104,111,119,121,123,124,125,126,127,134,138,142,144,156,161,162,171,],[37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,37,]),'elements_or_empty':([13,33,],[65,75,]),'elements':([13,33,111,],[67,67,135,]),'args_or_empty':([62,],[106,]),'args':([62,134,],[107,157,]),'block':([72,73,137,155,158,160,],[113,115,159,174,176,177,]),'params_or_empty':([104,],[129,]),'params':([104,156,],[130,175,]),'elif_statements':([113,177,],[136,184,]),}
+_lr_goto_items = {'program':([0,],[1,]),'code_lines':([0,3,51,52,199,],[2,50,100,101,220,]),'optional_new_lines':([0,4,172,],[3,52,199,]),'code_line':([0,3,51,52,199,],[4,4,4,4,4,]),'new_lines':([0,4,11,142,172,230,],[5,51,71,172,5,239,]),'empty':([0,4,14,44,81,125,172,],[6,6,87,87,136,163,6,]),'function_def':([0,3,51,52,199,],[7,7,7,7,7,]),'statement':([0,3,51,52,199,],[8,8,8,8,8,]),'expr':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[9,9,82,88,89,90,91,92,94,98,9,9,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,126,127,128,129,130,131,132,133,137,145,149,152,164,167,173,179,184,186,187,188,189,190,137,198,206,208,164,9,221,222,224,228,240,241,242,247,]),'assignment_statement':([0,3,51,52,199,],[15,15,15,15,15,]),'augmented_assignment_statement':([0,3,51,52,199,],[16,16,16,16,16,]),'if_statement':([0,3,51,52,199,],[17,17,17,17,17,]),'while_statement':([0,3,51,52,199,],[18,18,18,18,18,]),'for_statement':([0,3,51,52,199,],[19,19,19,19,19,]),'break_statement':([0,3,51,52,199,],[20,20,20,20,20,]),'continue_statement':([0,3,51,52,199,],[21,21,21,21,21,]),'return_statement':([0,3,51,52,199,],[22,22,22,22,22,]),'print_statement':([0,3,51,52,199,],[23,23,23,23,23,]),'list':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'list_comprehension':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,30,]),'tuple':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,31,]),'sequence_call':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,32,]),'function_call':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,33,]),'sequence_index':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,45,]),'sequence_slice':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,46,]),'sequence_function_call':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,47,]),'sequence_method':([0,3,14,34,35,36,37,38,42,44,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,73,74,75,76,77,78,79,80,81,95,99,118,125,139,144,151,153,155,156,157,158,159,166,171,180,182,194,199,202,203,204,213,232,234,236,243,],[48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,48,]),'elements_or_empty':([14,44,],[84,96,]),'elements':([14,44,139,],[86,86,168,]),'args_or_empty':([81,],[134,]),'args':([81,166,],[135,195,]),'block':([91,92,170,173,174,193,196,198,],[141,143,197,200,201,216,218,219,]),'params_or_empty':([125,],[161,]),'params':([125,194,],[162,217,]),'elif_statements':([141,219,],[169,229,]),'range':([144,203,],[174,223,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,107 +27,134 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> program","S'",1,None,None,None),
-  ('program -> code_lines','program',1,'p_program','miniPythonParser.py',28),
-  ('program -> optional_new_lines code_lines','program',2,'p_program','miniPythonParser.py',29),
-  ('code_lines -> code_line','code_lines',1,'p_code_lines','miniPythonParser.py',39),
-  ('code_lines -> code_line new_lines','code_lines',2,'p_code_lines','miniPythonParser.py',40),
-  ('code_lines -> code_line new_lines code_lines','code_lines',3,'p_code_lines','miniPythonParser.py',41),
-  ('code_lines -> code_line optional_new_lines code_lines','code_lines',3,'p_code_lines','miniPythonParser.py',42),
-  ('code_line -> function_def','code_line',1,'p_code_line','miniPythonParser.py',51),
-  ('code_line -> statement','code_line',1,'p_code_line','miniPythonParser.py',52),
-  ('code_line -> expr','code_line',1,'p_code_line','miniPythonParser.py',53),
-  ('block -> : new_lines optional_new_lines code_lines # new_lines','block',6,'p_block','miniPythonParser.py',60),
-  ('block -> : new_lines optional_new_lines code_lines #','block',5,'p_block','miniPythonParser.py',61),
-  ('optional_new_lines -> new_lines','optional_new_lines',1,'p_optional_new_lines','miniPythonParser.py',68),
-  ('optional_new_lines -> empty','optional_new_lines',1,'p_optional_new_lines','miniPythonParser.py',69),
-  ('new_lines -> NEW_LINE','new_lines',1,'p_new_lines','miniPythonParser.py',76),
-  ('new_lines -> NEW_LINE new_lines','new_lines',2,'p_new_lines','miniPythonParser.py',77),
-  ('statement -> assignment_statement','statement',1,'p_statement','miniPythonParser.py',84),
-  ('statement -> if_statement','statement',1,'p_statement','miniPythonParser.py',85),
-  ('statement -> while_statement','statement',1,'p_statement','miniPythonParser.py',86),
-  ('statement -> return_statement','statement',1,'p_statement','miniPythonParser.py',87),
-  ('assignment_statement -> ID = expr','assignment_statement',3,'p_assignment_statement','miniPythonParser.py',94),
-  ('params -> expr','params',1,'p_params','miniPythonParser.py',101),
-  ('params -> expr , params','params',3,'p_params','miniPythonParser.py',102),
-  ('params_or_empty -> params','params_or_empty',1,'p_params_or_empty','miniPythonParser.py',111),
-  ('params_or_empty -> empty','params_or_empty',1,'p_params_or_empty','miniPythonParser.py',112),
-  ('function_def -> DEF ID ( params_or_empty ) block','function_def',6,'p_function_def','miniPythonParser.py',118),
-  ('if_statement -> IF expr block','if_statement',3,'p_if_statement','miniPythonParser.py',125),
-  ('if_statement -> IF expr block elif_statements','if_statement',4,'p_if_statement','miniPythonParser.py',126),
-  ('if_statement -> IF expr block ELSE block','if_statement',5,'p_if_statement','miniPythonParser.py',127),
-  ('if_statement -> IF expr block elif_statements ELSE block','if_statement',6,'p_if_statement','miniPythonParser.py',128),
-  ('elif_statements -> ELIF expr block','elif_statements',3,'p_elif_statements','miniPythonParser.py',142),
-  ('elif_statements -> ELIF expr block elif_statements','elif_statements',4,'p_elif_statements','miniPythonParser.py',143),
-  ('while_statement -> WHILE expr block','while_statement',3,'p_while_statement','miniPythonParser.py',153),
-  ('return_statement -> RETURN expr','return_statement',2,'p_return_statement','miniPythonParser.py',159),
-  ('return_statement -> RETURN','return_statement',1,'p_return_statement','miniPythonParser.py',160),
-  ('expr -> ID','expr',1,'p_expr_id','miniPythonParser.py',170),
-  ('expr -> TRUE','expr',1,'p_expr_literal','miniPythonParser.py',177),
-  ('expr -> FALSE','expr',1,'p_expr_literal','miniPythonParser.py',178),
-  ('expr -> INT','expr',1,'p_expr_literal','miniPythonParser.py',179),
-  ('expr -> FLOAT','expr',1,'p_expr_literal','miniPythonParser.py',180),
-  ('expr -> STR','expr',1,'p_expr_literal','miniPythonParser.py',181),
-  ('expr -> list','expr',1,'p_expr_list','miniPythonParser.py',188),
-  ('expr -> tuple','expr',1,'p_expr_tuple','miniPythonParser.py',195),
-  ('expr -> sequence_call','expr',1,'p_expr_sequence_call','miniPythonParser.py',202),
-  ('expr -> function_call','expr',1,'p_expr_function_call','miniPythonParser.py',209),
-  ('expr -> NOT expr','expr',2,'p_expr_unary_op','miniPythonParser.py',216),
-  ('expr -> + expr','expr',2,'p_expr_unary_op','miniPythonParser.py',217),
-  ('expr -> - expr','expr',2,'p_expr_unary_op','miniPythonParser.py',218),
-  ('expr -> expr AND expr','expr',3,'p_expr_binary_op','miniPythonParser.py',225),
-  ('expr -> expr OR expr','expr',3,'p_expr_binary_op','miniPythonParser.py',226),
-  ('expr -> expr EQUAL_EQUAL expr','expr',3,'p_expr_binary_op','miniPythonParser.py',227),
-  ('expr -> expr NOT_EQUAL expr','expr',3,'p_expr_binary_op','miniPythonParser.py',228),
-  ('expr -> expr + expr','expr',3,'p_expr_binary_op','miniPythonParser.py',229),
-  ('expr -> expr - expr','expr',3,'p_expr_binary_op','miniPythonParser.py',230),
-  ('expr -> expr * expr','expr',3,'p_expr_binary_op','miniPythonParser.py',231),
-  ('expr -> expr / expr','expr',3,'p_expr_binary_op','miniPythonParser.py',232),
-  ('expr -> expr % expr','expr',3,'p_expr_binary_op','miniPythonParser.py',233),
-  ('expr -> expr POWER expr','expr',3,'p_expr_binary_op','miniPythonParser.py',234),
-  ('expr -> expr INT_DIVIDE expr','expr',3,'p_expr_binary_op','miniPythonParser.py',235),
-  ('expr -> expr > expr','expr',3,'p_expr_binary_op','miniPythonParser.py',236),
-  ('expr -> expr < expr','expr',3,'p_expr_binary_op','miniPythonParser.py',237),
-  ('expr -> expr GREATER_EQUAL expr','expr',3,'p_expr_binary_op','miniPythonParser.py',238),
-  ('expr -> expr LESS_EQUAL expr','expr',3,'p_expr_binary_op','miniPythonParser.py',239),
-  ('expr -> ( expr )','expr',3,'p_expr_group','miniPythonParser.py',246),
-  ('elements -> expr , elements','elements',3,'p_elements','miniPythonParser.py',253),
-  ('elements -> expr ,','elements',2,'p_elements','miniPythonParser.py',254),
-  ('elements -> expr','elements',1,'p_elements','miniPythonParser.py',255),
-  ('elements_or_empty -> elements','elements_or_empty',1,'p_elements_or_empty','miniPythonParser.py',265),
-  ('elements_or_empty -> empty','elements_or_empty',1,'p_elements_or_empty','miniPythonParser.py',266),
-  ('tuple -> ( elements_or_empty )','tuple',3,'p_tuple','miniPythonParser.py',273),
-  ('tuple -> ( )','tuple',2,'p_tuple','miniPythonParser.py',274),
-  ('list -> [ elements_or_empty ]','list',3,'p_list','miniPythonParser.py',284),
-  ('list -> [ ]','list',2,'p_list','miniPythonParser.py',285),
-  ('sequence_call -> sequence_index','sequence_call',1,'p_sequence_call','miniPythonParser.py',295),
-  ('sequence_call -> sequence_slice','sequence_call',1,'p_sequence_call','miniPythonParser.py',296),
-  ('sequence_call -> sequence_function_call','sequence_call',1,'p_sequence_call','miniPythonParser.py',297),
-  ('sequence_call -> sequence_method','sequence_call',1,'p_sequence_call','miniPythonParser.py',298),
-  ('sequence_index -> expr [ expr ]','sequence_index',4,'p_sequence_index','miniPythonParser.py',305),
-  ('sequence_slice -> expr [ : ]','sequence_slice',4,'p_sequence_slice','miniPythonParser.py',312),
-  ('sequence_slice -> expr [ expr : ]','sequence_slice',5,'p_sequence_slice','miniPythonParser.py',313),
-  ('sequence_slice -> expr [ : expr ]','sequence_slice',5,'p_sequence_slice','miniPythonParser.py',314),
-  ('sequence_slice -> expr [ expr : expr ]','sequence_slice',6,'p_sequence_slice','miniPythonParser.py',315),
-  ('sequence_slice -> expr [ : : ]','sequence_slice',5,'p_sequence_slice','miniPythonParser.py',316),
-  ('sequence_slice -> expr [ expr : : ]','sequence_slice',6,'p_sequence_slice','miniPythonParser.py',317),
-  ('sequence_slice -> expr [ : expr : ]','sequence_slice',6,'p_sequence_slice','miniPythonParser.py',318),
-  ('sequence_slice -> expr [ : : expr ]','sequence_slice',6,'p_sequence_slice','miniPythonParser.py',319),
-  ('sequence_slice -> expr [ expr : expr : ]','sequence_slice',7,'p_sequence_slice','miniPythonParser.py',320),
-  ('sequence_slice -> expr [ expr : : expr ]','sequence_slice',7,'p_sequence_slice','miniPythonParser.py',321),
-  ('sequence_slice -> expr [ : expr : expr ]','sequence_slice',7,'p_sequence_slice','miniPythonParser.py',322),
-  ('sequence_slice -> expr [ expr : expr : expr ]','sequence_slice',8,'p_sequence_slice','miniPythonParser.py',323),
-  ('sequence_function_call -> LEN ( expr )','sequence_function_call',4,'p_sequence_function_call','miniPythonParser.py',354),
-  ('sequence_method -> expr . APPEND ( expr )','sequence_method',6,'p_sequence_method','miniPythonParser.py',361),
-  ('sequence_method -> expr . EXTEND ( expr )','sequence_method',6,'p_sequence_method','miniPythonParser.py',362),
-  ('sequence_method -> expr . INSERT ( expr , expr )','sequence_method',8,'p_sequence_method','miniPythonParser.py',363),
-  ('sequence_method -> expr . INDEX ( expr )','sequence_method',6,'p_sequence_method','miniPythonParser.py',364),
-  ('sequence_method -> expr . POP ( )','sequence_method',5,'p_sequence_method','miniPythonParser.py',365),
-  ('sequence_method -> expr . POP ( expr )','sequence_method',6,'p_sequence_method','miniPythonParser.py',366),
-  ('sequence_method -> expr . COPY ( )','sequence_method',5,'p_sequence_method','miniPythonParser.py',367),
-  ('args -> expr','args',1,'p_args','miniPythonParser.py',379),
-  ('args -> expr , args','args',3,'p_args','miniPythonParser.py',380),
-  ('args_or_empty -> args','args_or_empty',1,'p_args_or_empty','miniPythonParser.py',390),
-  ('args_or_empty -> empty','args_or_empty',1,'p_args_or_empty','miniPythonParser.py',391),
-  ('function_call -> ID ( args_or_empty )','function_call',4,'p_function_call','miniPythonParser.py',398),
-  ('empty -> <empty>','empty',0,'p_empty','miniPythonParser.py',405),
+  ('program -> code_lines','program',1,'p_program','miniPythonParser.py',29),
+  ('program -> optional_new_lines code_lines','program',2,'p_program','miniPythonParser.py',30),
+  ('code_lines -> code_line','code_lines',1,'p_code_lines','miniPythonParser.py',40),
+  ('code_lines -> code_line new_lines','code_lines',2,'p_code_lines','miniPythonParser.py',41),
+  ('code_lines -> code_line new_lines code_lines','code_lines',3,'p_code_lines','miniPythonParser.py',42),
+  ('code_lines -> code_line optional_new_lines code_lines','code_lines',3,'p_code_lines','miniPythonParser.py',43),
+  ('code_line -> function_def','code_line',1,'p_code_line','miniPythonParser.py',52),
+  ('code_line -> statement','code_line',1,'p_code_line','miniPythonParser.py',53),
+  ('code_line -> expr','code_line',1,'p_code_line','miniPythonParser.py',54),
+  ('code_line -> error NEW_LINE','code_line',2,'p_code_line_error','miniPythonParser.py',61),
+  ('block -> : new_lines optional_new_lines code_lines # new_lines','block',6,'p_block','miniPythonParser.py',69),
+  ('block -> : new_lines optional_new_lines code_lines #','block',5,'p_block','miniPythonParser.py',70),
+  ('optional_new_lines -> new_lines','optional_new_lines',1,'p_optional_new_lines','miniPythonParser.py',77),
+  ('optional_new_lines -> empty','optional_new_lines',1,'p_optional_new_lines','miniPythonParser.py',78),
+  ('new_lines -> NEW_LINE','new_lines',1,'p_new_lines','miniPythonParser.py',85),
+  ('new_lines -> NEW_LINE new_lines','new_lines',2,'p_new_lines','miniPythonParser.py',86),
+  ('statement -> assignment_statement','statement',1,'p_statement','miniPythonParser.py',93),
+  ('statement -> augmented_assignment_statement','statement',1,'p_statement','miniPythonParser.py',94),
+  ('statement -> if_statement','statement',1,'p_statement','miniPythonParser.py',95),
+  ('statement -> while_statement','statement',1,'p_statement','miniPythonParser.py',96),
+  ('statement -> for_statement','statement',1,'p_statement','miniPythonParser.py',97),
+  ('statement -> break_statement','statement',1,'p_statement','miniPythonParser.py',98),
+  ('statement -> continue_statement','statement',1,'p_statement','miniPythonParser.py',99),
+  ('statement -> return_statement','statement',1,'p_statement','miniPythonParser.py',100),
+  ('statement -> print_statement','statement',1,'p_statement','miniPythonParser.py',101),
+  ('assignment_statement -> ID = expr','assignment_statement',3,'p_assignment_statement','miniPythonParser.py',108),
+  ('augmented_assignment_statement -> ID PLUS_EQUAL expr','augmented_assignment_statement',3,'p_augmented_assignment_statement','miniPythonParser.py',115),
+  ('augmented_assignment_statement -> ID MINUS_EQUAL expr','augmented_assignment_statement',3,'p_augmented_assignment_statement','miniPythonParser.py',116),
+  ('augmented_assignment_statement -> ID TIMES_EQUAL expr','augmented_assignment_statement',3,'p_augmented_assignment_statement','miniPythonParser.py',117),
+  ('augmented_assignment_statement -> ID DIVIDE_EQUAL expr','augmented_assignment_statement',3,'p_augmented_assignment_statement','miniPythonParser.py',118),
+  ('augmented_assignment_statement -> ID MOD_EQUAL expr','augmented_assignment_statement',3,'p_augmented_assignment_statement','miniPythonParser.py',119),
+  ('augmented_assignment_statement -> ID POWER_EQUAL expr','augmented_assignment_statement',3,'p_augmented_assignment_statement','miniPythonParser.py',120),
+  ('augmented_assignment_statement -> ID INT_DIVIDE_EQUAL expr','augmented_assignment_statement',3,'p_augmented_assignment_statement','miniPythonParser.py',121),
+  ('params -> expr','params',1,'p_params','miniPythonParser.py',129),
+  ('params -> expr , params','params',3,'p_params','miniPythonParser.py',130),
+  ('params_or_empty -> params','params_or_empty',1,'p_params_or_empty','miniPythonParser.py',139),
+  ('params_or_empty -> empty','params_or_empty',1,'p_params_or_empty','miniPythonParser.py',140),
+  ('function_def -> DEF ID ( params_or_empty ) block','function_def',6,'p_function_def','miniPythonParser.py',146),
+  ('if_statement -> IF expr block','if_statement',3,'p_if_statement','miniPythonParser.py',153),
+  ('if_statement -> IF expr block elif_statements','if_statement',4,'p_if_statement','miniPythonParser.py',154),
+  ('if_statement -> IF expr block ELSE block','if_statement',5,'p_if_statement','miniPythonParser.py',155),
+  ('if_statement -> IF expr block elif_statements ELSE block','if_statement',6,'p_if_statement','miniPythonParser.py',156),
+  ('elif_statements -> ELIF expr block','elif_statements',3,'p_elif_statements','miniPythonParser.py',170),
+  ('elif_statements -> ELIF expr block elif_statements','elif_statements',4,'p_elif_statements','miniPythonParser.py',171),
+  ('while_statement -> WHILE expr block','while_statement',3,'p_while_statement','miniPythonParser.py',181),
+  ('for_statement -> FOR ID IN expr block','for_statement',5,'p_for_statement','miniPythonParser.py',187),
+  ('for_statement -> FOR ID IN range block','for_statement',5,'p_for_statement','miniPythonParser.py',188),
+  ('range -> RANGE ( expr )','range',4,'p_range','miniPythonParser.py',198),
+  ('range -> RANGE ( expr , expr )','range',6,'p_range','miniPythonParser.py',199),
+  ('range -> RANGE ( expr , expr , expr )','range',8,'p_range','miniPythonParser.py',200),
+  ('break_statement -> BREAK','break_statement',1,'p_break_statement','miniPythonParser.py',212),
+  ('continue_statement -> CONTINUE','continue_statement',1,'p_continue_statement','miniPythonParser.py',219),
+  ('return_statement -> RETURN expr','return_statement',2,'p_return_statement','miniPythonParser.py',226),
+  ('return_statement -> RETURN','return_statement',1,'p_return_statement','miniPythonParser.py',227),
+  ('print_statement -> PRINT ( expr )','print_statement',4,'p_print_statement','miniPythonParser.py',237),
+  ('print_statement -> PRINT ( )','print_statement',3,'p_print_statement','miniPythonParser.py',238),
+  ('expr -> ID','expr',1,'p_expr_id','miniPythonParser.py',248),
+  ('expr -> TRUE','expr',1,'p_expr_literal','miniPythonParser.py',255),
+  ('expr -> FALSE','expr',1,'p_expr_literal','miniPythonParser.py',256),
+  ('expr -> INT','expr',1,'p_expr_literal','miniPythonParser.py',257),
+  ('expr -> FLOAT','expr',1,'p_expr_literal','miniPythonParser.py',258),
+  ('expr -> STR','expr',1,'p_expr_literal','miniPythonParser.py',259),
+  ('expr -> list','expr',1,'p_expr_list','miniPythonParser.py',266),
+  ('expr -> list_comprehension','expr',1,'p_expr_list_comprehension','miniPythonParser.py',273),
+  ('expr -> tuple','expr',1,'p_expr_tuple','miniPythonParser.py',280),
+  ('expr -> sequence_call','expr',1,'p_expr_sequence_call','miniPythonParser.py',287),
+  ('expr -> function_call','expr',1,'p_expr_function_call','miniPythonParser.py',294),
+  ('expr -> NOT expr','expr',2,'p_expr_unary_op','miniPythonParser.py',301),
+  ('expr -> + expr','expr',2,'p_expr_unary_op','miniPythonParser.py',302),
+  ('expr -> - expr','expr',2,'p_expr_unary_op','miniPythonParser.py',303),
+  ('expr -> expr AND expr','expr',3,'p_expr_binary_op','miniPythonParser.py',310),
+  ('expr -> expr OR expr','expr',3,'p_expr_binary_op','miniPythonParser.py',311),
+  ('expr -> expr EQUAL_EQUAL expr','expr',3,'p_expr_binary_op','miniPythonParser.py',312),
+  ('expr -> expr NOT_EQUAL expr','expr',3,'p_expr_binary_op','miniPythonParser.py',313),
+  ('expr -> expr + expr','expr',3,'p_expr_binary_op','miniPythonParser.py',314),
+  ('expr -> expr - expr','expr',3,'p_expr_binary_op','miniPythonParser.py',315),
+  ('expr -> expr * expr','expr',3,'p_expr_binary_op','miniPythonParser.py',316),
+  ('expr -> expr / expr','expr',3,'p_expr_binary_op','miniPythonParser.py',317),
+  ('expr -> expr % expr','expr',3,'p_expr_binary_op','miniPythonParser.py',318),
+  ('expr -> expr POWER expr','expr',3,'p_expr_binary_op','miniPythonParser.py',319),
+  ('expr -> expr INT_DIVIDE expr','expr',3,'p_expr_binary_op','miniPythonParser.py',320),
+  ('expr -> expr > expr','expr',3,'p_expr_binary_op','miniPythonParser.py',321),
+  ('expr -> expr < expr','expr',3,'p_expr_binary_op','miniPythonParser.py',322),
+  ('expr -> expr GREATER_EQUAL expr','expr',3,'p_expr_binary_op','miniPythonParser.py',323),
+  ('expr -> expr LESS_EQUAL expr','expr',3,'p_expr_binary_op','miniPythonParser.py',324),
+  ('expr -> ( expr )','expr',3,'p_expr_group','miniPythonParser.py',331),
+  ('elements -> expr , elements','elements',3,'p_elements','miniPythonParser.py',338),
+  ('elements -> expr ,','elements',2,'p_elements','miniPythonParser.py',339),
+  ('elements -> expr','elements',1,'p_elements','miniPythonParser.py',340),
+  ('elements_or_empty -> elements','elements_or_empty',1,'p_elements_or_empty','miniPythonParser.py',350),
+  ('elements_or_empty -> empty','elements_or_empty',1,'p_elements_or_empty','miniPythonParser.py',351),
+  ('tuple -> ( elements_or_empty )','tuple',3,'p_tuple','miniPythonParser.py',358),
+  ('tuple -> ( )','tuple',2,'p_tuple','miniPythonParser.py',359),
+  ('list -> [ elements_or_empty ]','list',3,'p_list','miniPythonParser.py',369),
+  ('list -> [ ]','list',2,'p_list','miniPythonParser.py',370),
+  ('list_comprehension -> [ expr FOR ID IN expr ]','list_comprehension',7,'p_list_comprehension','miniPythonParser.py',380),
+  ('list_comprehension -> [ expr FOR ID IN range ]','list_comprehension',7,'p_list_comprehension','miniPythonParser.py',381),
+  ('list_comprehension -> [ expr FOR ID IN expr IF expr ]','list_comprehension',9,'p_list_comprehension','miniPythonParser.py',382),
+  ('list_comprehension -> [ expr FOR ID IN range IF expr ]','list_comprehension',9,'p_list_comprehension','miniPythonParser.py',383),
+  ('sequence_call -> sequence_index','sequence_call',1,'p_sequence_call','miniPythonParser.py',393),
+  ('sequence_call -> sequence_slice','sequence_call',1,'p_sequence_call','miniPythonParser.py',394),
+  ('sequence_call -> sequence_function_call','sequence_call',1,'p_sequence_call','miniPythonParser.py',395),
+  ('sequence_call -> sequence_method','sequence_call',1,'p_sequence_call','miniPythonParser.py',396),
+  ('sequence_index -> expr [ expr ]','sequence_index',4,'p_sequence_index','miniPythonParser.py',403),
+  ('sequence_slice -> expr [ : ]','sequence_slice',4,'p_sequence_slice','miniPythonParser.py',410),
+  ('sequence_slice -> expr [ expr : ]','sequence_slice',5,'p_sequence_slice','miniPythonParser.py',411),
+  ('sequence_slice -> expr [ : expr ]','sequence_slice',5,'p_sequence_slice','miniPythonParser.py',412),
+  ('sequence_slice -> expr [ expr : expr ]','sequence_slice',6,'p_sequence_slice','miniPythonParser.py',413),
+  ('sequence_slice -> expr [ : : ]','sequence_slice',5,'p_sequence_slice','miniPythonParser.py',414),
+  ('sequence_slice -> expr [ expr : : ]','sequence_slice',6,'p_sequence_slice','miniPythonParser.py',415),
+  ('sequence_slice -> expr [ : expr : ]','sequence_slice',6,'p_sequence_slice','miniPythonParser.py',416),
+  ('sequence_slice -> expr [ : : expr ]','sequence_slice',6,'p_sequence_slice','miniPythonParser.py',417),
+  ('sequence_slice -> expr [ expr : expr : ]','sequence_slice',7,'p_sequence_slice','miniPythonParser.py',418),
+  ('sequence_slice -> expr [ expr : : expr ]','sequence_slice',7,'p_sequence_slice','miniPythonParser.py',419),
+  ('sequence_slice -> expr [ : expr : expr ]','sequence_slice',7,'p_sequence_slice','miniPythonParser.py',420),
+  ('sequence_slice -> expr [ expr : expr : expr ]','sequence_slice',8,'p_sequence_slice','miniPythonParser.py',421),
+  ('sequence_function_call -> LEN ( expr )','sequence_function_call',4,'p_sequence_function_call','miniPythonParser.py',452),
+  ('sequence_method -> expr . APPEND ( expr )','sequence_method',6,'p_sequence_method','miniPythonParser.py',459),
+  ('sequence_method -> expr . EXTEND ( expr )','sequence_method',6,'p_sequence_method','miniPythonParser.py',460),
+  ('sequence_method -> expr . INSERT ( expr , expr )','sequence_method',8,'p_sequence_method','miniPythonParser.py',461),
+  ('sequence_method -> expr . INDEX ( expr )','sequence_method',6,'p_sequence_method','miniPythonParser.py',462),
+  ('sequence_method -> expr . POP ( )','sequence_method',5,'p_sequence_method','miniPythonParser.py',463),
+  ('sequence_method -> expr . POP ( expr )','sequence_method',6,'p_sequence_method','miniPythonParser.py',464),
+  ('sequence_method -> expr . COPY ( )','sequence_method',5,'p_sequence_method','miniPythonParser.py',465),
+  ('args -> expr','args',1,'p_args','miniPythonParser.py',477),
+  ('args -> expr , args','args',3,'p_args','miniPythonParser.py',478),
+  ('args_or_empty -> args','args_or_empty',1,'p_args_or_empty','miniPythonParser.py',488),
+  ('args_or_empty -> empty','args_or_empty',1,'p_args_or_empty','miniPythonParser.py',489),
+  ('function_call -> ID ( args_or_empty )','function_call',4,'p_function_call','miniPythonParser.py',496),
+  ('empty -> <empty>','empty',0,'p_empty','miniPythonParser.py',503),
 ]
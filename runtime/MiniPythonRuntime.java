@@ -0,0 +1,789 @@
+import java.io.*;
+import java.util.*;
+
+/**
+ * Operations with Python semantics used by the classes the miniPython
+ * compiler generates. Copied next to the generated classes so that they
+ * all share one compiled copy instead of each carrying its own helpers.
+ */
+public final class MiniPythonRuntime {
+    private MiniPythonRuntime() {
+    }
+
+    // SEQUENCES
+
+    /**
+     * A tuple: a list that can't be changed, holding exactly the given
+     * items. Unlike List.of it can hold null, which is what calling a
+     * function without a return value gives.
+     */
+    public static List<Object> tuple(Object... items) {
+        return Collections.unmodifiableList(Arrays.asList(items));
+    }
+
+    /**
+     * lst[index], where a negative index counts from the end
+     */
+    public static <T> T get(List<T> lst, int index) {
+        if (index < 0) {
+            index += lst.size();
+        }
+        return lst.get(index);
+    }
+
+    /**
+     * lst[start:stop:step] as a new list sized to fit exactly. Any of the
+     * bounds can be null when left out, and negative ones count from the end.
+     */
+    public static <T> ArrayList<T> slice(List<T> lst, Integer start, Integer stop, Integer step) {
+        int[] bounds = sliceBounds(lst.size(), start, stop, step);
+        int from = bounds[0];
+        int by = bounds[1];
+        int count = bounds[2];
+
+        ArrayList<T> result = new ArrayList<>(count);
+        if (by == 1) {
+            result.addAll(lst.subList(from, from + count));
+            return result;
+        }
+        for (int index = from; count > 0; index += by, count--) {
+            result.add(lst.get(index));
+        }
+        return result;
+    }
+
+    /**
+     * lst[start:stop:step] as a read-only view of lst rather than a copy, for
+     * slices that are only read while lst stays the same
+     */
+    public static <T> List<T> sliceView(List<T> lst, Integer start, Integer stop, Integer step) {
+        int[] bounds = sliceBounds(lst.size(), start, stop, step);
+        return new SliceView<>(lst, bounds[0], bounds[1], bounds[2]);
+    }
+
+    /**
+     * How many numbers range(start, stop, step) counts through, for sizing
+     * the list a list comprehension over it builds
+     */
+    public static int rangeLength(int start, int stop, int step) {
+        if (step > 0 && start < stop) {
+            return (int) (((long) stop - start + step - 1) / step);
+        }
+        else if (step < 0 && start > stop) {
+            return (int) (((long) start - stop - step - 1) / -step);
+        }
+        return 0;
+    }
+
+    private static final class SliceView<T> extends AbstractList<T> implements RandomAccess {
+        private final List<T> lst;
+        private final int from;
+        private final int by;
+        private final int count;
+
+        SliceView(List<T> lst, int from, int by, int count) {
+            this.lst = lst;
+            this.from = from;
+            this.by = by;
+            this.count = count;
+        }
+
+        @Override
+        public int size() {
+            return count;
+        }
+
+        @Override
+        public T get(int index) {
+            if (index < 0 || index >= count) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            return lst.get(from + index * by);
+        }
+    }
+
+    /**
+     * The first index, step and number of elements of a slice of a sequence
+     * of the given size
+     */
+    private static int[] sliceBounds(int size, Integer start, Integer stop, Integer step) {
+        int by = step == null ? 1 : step;
+        if (by == 0) {
+            throw new IllegalArgumentException("slice step cannot be zero");
+        }
+
+        int from;
+        int to;
+        int count;
+        if (by > 0) {
+            from = start == null ? 0 : clamp(start, size, 0, size);
+            to = stop == null ? size : clamp(stop, size, 0, size);
+            count = to > from ? (to - from + by - 1) / by : 0;
+        }
+        else {
+            from = start == null ? size - 1 : clamp(start, size, -1, size - 1);
+            to = stop == null ? -1 : clamp(stop, size, -1, size - 1);
+            count = from > to ? (from - to - by - 1) / -by : 0;
+        }
+        return new int[] {from, by, count};
+    }
+
+    private static int clamp(int index, int size, int low, int high) {
+        if (index < 0) {
+            index += size;
+        }
+        return index < low ? low : (index > high ? high : index);
+    }
+
+    /**
+     * An index into a sequence of the given size, where a negative one
+     * counts from the end
+     */
+    private static int checkIndex(int index, int size) {
+        if (index < 0) {
+            index += size;
+        }
+        if (index < 0 || index >= size) {
+            throw new IndexOutOfBoundsException("list index out of range");
+        }
+        return index;
+    }
+
+    /**
+     * Where list.insert(index, value) puts value in a list of the given size
+     */
+    private static int insertIndex(int index, int size) {
+        return clamp(index, size, 0, size);
+    }
+
+    /**
+     * The capacity to grow an array with the given capacity to so that it
+     * holds at least needed elements
+     */
+    private static int grownCapacity(int capacity, int needed) {
+        return Math.max(needed, capacity + (capacity >> 1) + 4);
+    }
+
+    // PRIMITIVE LISTS
+    //
+    // Lists whose elements all have the same primitive type are kept in
+    // arrays of that type. They are still Lists, for the code that doesn't
+    // know what they hold, but also have methods that don't box: item,
+    // append, insert, pop, indexOf, slice and copy, with Python semantics.
+
+    public static final class IntList extends AbstractList<Integer> implements RandomAccess {
+        private int[] items;
+        private int size;
+
+        public IntList(int capacity) {
+            items = new int[capacity];
+        }
+
+        /**
+         * A list holding values, which it takes over
+         */
+        public static IntList of(int... values) {
+            IntList lst = new IntList(0);
+            lst.items = values;
+            lst.size = values.length;
+            return lst;
+        }
+
+        @Override
+        public int size() {
+            return size;
+        }
+
+        @Override
+        public Integer get(int index) {
+            if (index < 0 || index >= size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            return items[index];
+        }
+
+        @Override
+        public Integer set(int index, Integer value) {
+            if (index < 0 || index >= size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            int old = items[index];
+            items[index] = value;
+            return old;
+        }
+
+        @Override
+        public boolean add(Integer value) {
+            append(value);
+            return true;
+        }
+
+        @Override
+        public void add(int index, Integer value) {
+            if (index < 0 || index > size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            insert(index, value);
+        }
+
+        @Override
+        public Integer remove(int index) {
+            if (index < 0 || index >= size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            return pop(index);
+        }
+
+        public int item(int index) {
+            return items[checkIndex(index, size)];
+        }
+
+        public void append(int value) {
+            if (size == items.length) {
+                items = Arrays.copyOf(items, grownCapacity(items.length, size + 1));
+            }
+            items[size++] = value;
+            modCount++;
+        }
+
+        public void insert(int index, int value) {
+            index = insertIndex(index, size);
+            if (size == items.length) {
+                items = Arrays.copyOf(items, grownCapacity(items.length, size + 1));
+            }
+            System.arraycopy(items, index, items, index + 1, size - index);
+            items[index] = value;
+            size++;
+            modCount++;
+        }
+
+        public int pop() {
+            return pop(-1);
+        }
+
+        public int pop(int index) {
+            index = checkIndex(index, size);
+            int value = items[index];
+            System.arraycopy(items, index + 1, items, index, size - index - 1);
+            size--;
+            modCount++;
+            return value;
+        }
+
+        public int indexOf(int value) {
+            for (int index = 0; index < size; index++) {
+                if (items[index] == value) {
+                    return index;
+                }
+            }
+            return -1;
+        }
+
+        public IntList slice(Integer start, Integer stop, Integer step) {
+            int[] bounds = sliceBounds(size, start, stop, step);
+            int from = bounds[0];
+            int by = bounds[1];
+            int count = bounds[2];
+            if (by == 1) {
+                return of(Arrays.copyOfRange(items, from, from + count));
+            }
+            int[] values = new int[count];
+            for (int index = 0; index < count; index++, from += by) {
+                values[index] = items[from];
+            }
+            return of(values);
+        }
+
+        public IntList copy() {
+            return of(Arrays.copyOf(items, size));
+        }
+    }
+
+    public static final class DoubleList extends AbstractList<Double> implements RandomAccess {
+        private double[] items;
+        private int size;
+
+        public DoubleList(int capacity) {
+            items = new double[capacity];
+        }
+
+        /**
+         * A list holding values, which it takes over
+         */
+        public static DoubleList of(double... values) {
+            DoubleList lst = new DoubleList(0);
+            lst.items = values;
+            lst.size = values.length;
+            return lst;
+        }
+
+        @Override
+        public int size() {
+            return size;
+        }
+
+        @Override
+        public Double get(int index) {
+            if (index < 0 || index >= size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            return items[index];
+        }
+
+        @Override
+        public Double set(int index, Double value) {
+            if (index < 0 || index >= size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            double old = items[index];
+            items[index] = value;
+            return old;
+        }
+
+        @Override
+        public boolean add(Double value) {
+            append(value);
+            return true;
+        }
+
+        @Override
+        public void add(int index, Double value) {
+            if (index < 0 || index > size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            insert(index, value);
+        }
+
+        @Override
+        public Double remove(int index) {
+            if (index < 0 || index >= size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            return pop(index);
+        }
+
+        public double item(int index) {
+            return items[checkIndex(index, size)];
+        }
+
+        public void append(double value) {
+            if (size == items.length) {
+                items = Arrays.copyOf(items, grownCapacity(items.length, size + 1));
+            }
+            items[size++] = value;
+            modCount++;
+        }
+
+        public void insert(int index, double value) {
+            index = insertIndex(index, size);
+            if (size == items.length) {
+                items = Arrays.copyOf(items, grownCapacity(items.length, size + 1));
+            }
+            System.arraycopy(items, index, items, index + 1, size - index);
+            items[index] = value;
+            size++;
+            modCount++;
+        }
+
+        public double pop() {
+            return pop(-1);
+        }
+
+        public double pop(int index) {
+            index = checkIndex(index, size);
+            double value = items[index];
+            System.arraycopy(items, index + 1, items, index, size - index - 1);
+            size--;
+            modCount++;
+            return value;
+        }
+
+        public int indexOf(double value) {
+            for (int index = 0; index < size; index++) {
+                if (items[index] == value) {
+                    return index;
+                }
+            }
+            return -1;
+        }
+
+        public DoubleList slice(Integer start, Integer stop, Integer step) {
+            int[] bounds = sliceBounds(size, start, stop, step);
+            int from = bounds[0];
+            int by = bounds[1];
+            int count = bounds[2];
+            if (by == 1) {
+                return of(Arrays.copyOfRange(items, from, from + count));
+            }
+            double[] values = new double[count];
+            for (int index = 0; index < count; index++, from += by) {
+                values[index] = items[from];
+            }
+            return of(values);
+        }
+
+        public DoubleList copy() {
+            return of(Arrays.copyOf(items, size));
+        }
+    }
+
+    public static final class BoolList extends AbstractList<Boolean> implements RandomAccess {
+        private boolean[] items;
+        private int size;
+
+        public BoolList(int capacity) {
+            items = new boolean[capacity];
+        }
+
+        /**
+         * A list holding values, which it takes over
+         */
+        public static BoolList of(boolean... values) {
+            BoolList lst = new BoolList(0);
+            lst.items = values;
+            lst.size = values.length;
+            return lst;
+        }
+
+        @Override
+        public int size() {
+            return size;
+        }
+
+        @Override
+        public Boolean get(int index) {
+            if (index < 0 || index >= size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            return items[index];
+        }
+
+        @Override
+        public Boolean set(int index, Boolean value) {
+            if (index < 0 || index >= size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            boolean old = items[index];
+            items[index] = value;
+            return old;
+        }
+
+        @Override
+        public boolean add(Boolean value) {
+            append(value);
+            return true;
+        }
+
+        @Override
+        public void add(int index, Boolean value) {
+            if (index < 0 || index > size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            insert(index, value);
+        }
+
+        @Override
+        public Boolean remove(int index) {
+            if (index < 0 || index >= size) {
+                throw new IndexOutOfBoundsException("list index out of range");
+            }
+            return pop(index);
+        }
+
+        public boolean item(int index) {
+            return items[checkIndex(index, size)];
+        }
+
+        public void append(boolean value) {
+            if (size == items.length) {
+                items = Arrays.copyOf(items, grownCapacity(items.length, size + 1));
+            }
+            items[size++] = value;
+            modCount++;
+        }
+
+        public void insert(int index, boolean value) {
+            index = insertIndex(index, size);
+            if (size == items.length) {
+                items = Arrays.copyOf(items, grownCapacity(items.length, size + 1));
+            }
+            System.arraycopy(items, index, items, index + 1, size - index);
+            items[index] = value;
+            size++;
+            modCount++;
+        }
+
+        public boolean pop() {
+            return pop(-1);
+        }
+
+        public boolean pop(int index) {
+            index = checkIndex(index, size);
+            boolean value = items[index];
+            System.arraycopy(items, index + 1, items, index, size - index - 1);
+            size--;
+            modCount++;
+            return value;
+        }
+
+        public int indexOf(boolean value) {
+            for (int index = 0; index < size; index++) {
+                if (items[index] == value) {
+                    return index;
+                }
+            }
+            return -1;
+        }
+
+        public BoolList slice(Integer start, Integer stop, Integer step) {
+            int[] bounds = sliceBounds(size, start, stop, step);
+            int from = bounds[0];
+            int by = bounds[1];
+            int count = bounds[2];
+            if (by == 1) {
+                return of(Arrays.copyOfRange(items, from, from + count));
+            }
+            boolean[] values = new boolean[count];
+            for (int index = 0; index < count; index++, from += by) {
+                values[index] = items[from];
+            }
+            return of(values);
+        }
+
+        public BoolList copy() {
+            return of(Arrays.copyOf(items, size));
+        }
+    }
+
+    // ARITHMETIC
+
+    public static int floorDiv(int left, int right) {
+        return Math.floorDiv(left, right);
+    }
+
+    public static double floorDiv(double left, double right) {
+        return Math.floor(left / right);
+    }
+
+    public static Object floorDiv(Object left, Object right) {
+        if (isInteger(left) && isInteger(right)) {
+            return floorDiv(toInt(left), toInt(right));
+        }
+        return floorDiv(toDouble(left), toDouble(right));
+    }
+
+    /**
+     * left % right, which takes the sign of right as in Python
+     */
+    public static int mod(int left, int right) {
+        return Math.floorMod(left, right);
+    }
+
+    public static double mod(double left, double right) {
+        return left - Math.floor(left / right) * right;
+    }
+
+    public static Object mod(Object left, Object right) {
+        if (isInteger(left) && isInteger(right)) {
+            return mod(toInt(left), toInt(right));
+        }
+        return mod(toDouble(left), toDouble(right));
+    }
+
+    /**
+     * left ** right. On ints it gives an int, which wraps around on overflow
+     * like int arithmetic does and rounds towards zero for a negative
+     * exponent.
+     */
+    public static int pow(int left, int right) {
+        if (right < 0) {
+            if (left == 0) {
+                throw new ArithmeticException("0 cannot be raised to a negative power");
+            } else if (left == 1 || (left == -1 && right % 2 == 0)) {
+                return 1;
+            }
+            return left == -1 ? -1 : 0;
+        }
+        int result = 1;
+        while (right > 0) {
+            if ((right & 1) == 1) {
+                result *= left;
+            }
+            left *= left;
+            right >>= 1;
+        }
+        return result;
+    }
+
+    public static double pow(double left, double right) {
+        return Math.pow(left, right);
+    }
+
+    public static Object pow(Object left, Object right) {
+        if (isInteger(left) && isInteger(right)) {
+            return pow(toInt(left), toInt(right));
+        }
+        return pow(toDouble(left), toDouble(right));
+    }
+
+    private static boolean isInteger(Object value) {
+        return value instanceof Integer || value instanceof Boolean;
+    }
+
+    private static int toInt(Object value) {
+        if (value instanceof Boolean) {
+            return (Boolean) value ? 1 : 0;
+        }
+        return ((Number) value).intValue();
+    }
+
+    private static double toDouble(Object value) {
+        if (value instanceof Boolean) {
+            return (Boolean) value ? 1 : 0;
+        }
+        return ((Number) value).doubleValue();
+    }
+
+    /**
+     * left + right on tuples, which makes a new tuple
+     */
+    public static List<Object> concat(List<?> left, List<?> right) {
+        List<Object> joined = new ArrayList<>(left);
+        joined.addAll(right);
+        return Collections.unmodifiableList(joined);
+    }
+
+    /**
+     * left += right for values whose types are only known at runtime. A
+     * list is extended in place, as in Python, so every reference to it sees
+     * the change, while a tuple, which can't change, gives a new one.
+     */
+    @SuppressWarnings("unchecked")
+    public static Object iadd(Object left, Object right) {
+        if (left instanceof List) {
+            List<Object> lst = (List<Object>) left;
+            try {
+                lst.addAll((Collection<?>) right);
+                return lst;
+            }
+            catch (UnsupportedOperationException e) {
+                return concat(lst, (List<?>) right);
+            }
+        }
+        else if (left instanceof String) {
+            return (String) left + (String) right;
+        }
+        else if (isInteger(left) && isInteger(right)) {
+            return toInt(left) + toInt(right);
+        }
+        return toDouble(left) + toDouble(right);
+    }
+
+    // TRUTHINESS
+
+    public static boolean truthy(boolean value) {
+        return value;
+    }
+
+    public static boolean truthy(int value) {
+        return value != 0;
+    }
+
+    public static boolean truthy(double value) {
+        return value != 0;
+    }
+
+    /**
+     * Whether Python considers value true: anything but None, False, zero
+     * and empty strings and sequences
+     */
+    public static boolean truthy(Object value) {
+        if (value == null) {
+            return false;
+        }
+        else if (value instanceof Boolean) {
+            return (Boolean) value;
+        }
+        else if (value instanceof Number) {
+            return ((Number) value).doubleValue() != 0;
+        }
+        else if (value instanceof String) {
+            return !((String) value).isEmpty();
+        }
+        else if (value instanceof Collection) {
+            return !((Collection<?>) value).isEmpty();
+        }
+        return true;
+    }
+
+    // PRINTING
+
+    // Where print writes to when output is buffered, or null when it goes
+    // straight to System.out
+    private static PrintWriter bufferedOut = null;
+
+    /**
+     * Buffer what print writes rather than writing each line to System.out,
+     * which is synchronized and can flush every line. The buffer is flushed
+     * when the program exits, including because of an uncaught exception.
+     */
+    public static void bufferOutput() {
+        if (bufferedOut == null) {
+            bufferedOut = new PrintWriter(new BufferedWriter(new OutputStreamWriter(new FileOutputStream(FileDescriptor.out)), 1 << 16));
+            Runtime.getRuntime().addShutdownHook(new Thread(MiniPythonRuntime::flushOutput));
+        }
+    }
+
+    public static void flushOutput() {
+        if (bufferedOut != null) {
+            bufferedOut.flush();
+        }
+    }
+
+    public static void print(Object value) {
+        if (bufferedOut != null) {
+            bufferedOut.println(str(value));
+        }
+        else {
+            System.out.println(str(value));
+        }
+    }
+
+    /**
+     * The text Python's str() gives for value
+     */
+    public static String str(Object value) {
+        if (value instanceof String) {
+            return (String) value;
+        }
+        StringBuilder builder = new StringBuilder();
+        appendRepr(builder, value);
+        return builder.toString();
+    }
+
+    private static void appendRepr(StringBuilder builder, Object value) {
+        if (value == null) {
+            builder.append("None");
+        }
+        else if (value instanceof Boolean) {
+            builder.append((Boolean) value ? "True" : "False");
+        }
+        else if (value instanceof String) {
+            builder.append('\'').append((String) value).append('\'');
+        }
+        else if (value instanceof List) {
+            List<?> lst = (List<?>) value;
+            builder.append('[');
+            for (int index = 0; index < lst.size(); index++) {
+                if (index > 0) {
+                    builder.append(", ");
+                }
+                appendRepr(builder, lst.get(index));
+            }
+            builder.append(']');
+        }
+        else {
+            builder.append(value);
+        }
+    }
+}
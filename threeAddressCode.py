@@ -1,50 +1,334 @@
+from array import array
+
+# TAC operands. Names are wrapped in str subclasses so that registers,
+# variables and string literals can be told apart by their type, while
+# still printing and hashing like the plain strings they contain.
+
+class Operand(str):
+    __slots__ = ()
+
+class Reg(Operand):
+    """
+    A temporary register, named _t<number>
+    """
+    __slots__ = ()
+
+    @property
+    def number(self):
+        return int(self[2:])
+
+class Var(Operand):
+    """
+    A variable of the source program
+    """
+    __slots__ = ()
+
+class StrLit(Operand):
+    """
+    A string literal, including its double quotes
+    """
+    __slots__ = ()
+
+# Opcode tables. Every TAC operator string is mapped to a small integer so
+# that instructions can be stored compactly and dispatched by indexing into
+# these tables instead of comparing strings.
+OPERATORS = []
+OPCODES = {}
+# Functions that turn a TAC into its IR text, indexed by opcode
+PRINTERS = []
+# Names of the TargetGen methods that translate a TAC, indexed by opcode
+EMITTERS = []
+# Opcodes that open a block closed by an end-label
+BLOCK_OPCODES = set()
+
+def register_opcode(operator, printer, emitter, opens_block=False):
+    """
+    Register a new TAC operator along with how to print it and the name of
+    the TargetGen method that emits it. Returns the operator's opcode.
+    """
+    if operator in OPCODES:
+        raise Exception("Operator already registered: " + str(operator))
+    opcode = len(OPERATORS)
+    OPERATORS.append(operator)
+    OPCODES[operator] = opcode
+    PRINTERS.append(printer)
+    EMITTERS.append(emitter)
+    if opens_block:
+        BLOCK_OPCODES.add(opcode)
+    return opcode
+
+# PRINTERS
+
+def print_assign(tac):
+    return "{} <- {}".format(tac.result, tac.left_operand)
+
+def print_operation(tac):
+    if tac.right_operand is not None:
+        return "{} <- {} {} {}".format(tac.result, tac.left_operand, tac.operator, tac.right_operand)
+    else:
+        return "{} <- {} {}".format(tac.result, tac.operator, tac.left_operand)
+
+def print_generic(tac):
+    return "{} <- {} {} {}".format(tac.result, tac.operator, tac.left_operand, tac.right_operand)
+
+def print_func_def(tac):
+    return "func-def {} {}".format(tac.left_operand, tac.right_operand)
+
+def print_if(tac):
+    return "if {}".format(tac.left_operand)
+
+def print_else_if(tac):
+    return "else-if {}".format(tac.left_operand)
+
+def print_else(tac):
+    return "else"
+
+def print_while(tac):
+    return "while {}".format(tac.left_operand)
+
+def print_for_range(tac):
+    return "for {} in range({}, {}, {})".format(tac.result, *tac.right_operand)
+
+def print_for_in(tac):
+    return "for {} in {}".format(tac.result, tac.left_operand)
+
+def print_end_label(tac):
+    return "end"
+
+def print_print(tac):
+    return "print {}".format(tac.left_operand or "")
+
+def print_break(tac):
+    return "break"
+
+def print_continue(tac):
+    return "continue"
+
+def print_return(tac):
+    return "return {}".format(tac.left_operand or "")
+
+def print_func_call(tac):
+    return "{} <- func-call {} {}".format(tac.result, tac.left_operand, tac.right_operand)
+
+def print_index(tac):
+    return "{} <- index {} {}".format(tac.result, tac.left_operand, tac.right_operand)
+
+def print_slice(tac):
+    start = tac.right_operand[0]
+    end = tac.right_operand[1]
+    step = tac.right_operand[2]
+    return "{} <- slice {} [{}:{}:{}]".format(tac.result, tac.left_operand, start or "", end or "", step or "")
+
+def print_method_call(tac):
+    return "{} <- method-call {} {}".format(tac.result, tac.left_operand, tac.right_operand)
+
+def print_list_comp(tac):
+    return "{} <- list-comp".format(tac.result)
+
+def print_in_place_add(tac):
+    return "{} += {}".format(tac.result, tac.right_operand)
+
+# OPCODES
+
+OP_ASSIGN = register_opcode(None, print_assign, "gen_assign_stmnt")
+OP_AND = register_opcode("and", print_operation, "gen_operation")
+OP_OR = register_opcode("or", print_operation, "gen_operation")
+# Unary "not" has always been printed in the generic form
+OP_NOT = register_opcode("not", print_generic, "gen_operation")
+OP_EQ = register_opcode("==", print_operation, "gen_operation")
+OP_NE = register_opcode("!=", print_operation, "gen_operation")
+OP_ADD = register_opcode("+", print_operation, "gen_operation")
+OP_SUB = register_opcode("-", print_operation, "gen_operation")
+OP_MUL = register_opcode("*", print_operation, "gen_operation")
+OP_DIV = register_opcode("/", print_operation, "gen_operation")
+OP_MOD = register_opcode("%", print_operation, "gen_operation")
+OP_POW = register_opcode("**", print_operation, "gen_operation")
+OP_FLOOR_DIV = register_opcode("//", print_operation, "gen_operation")
+OP_GT = register_opcode(">", print_operation, "gen_operation")
+OP_LT = register_opcode("<", print_operation, "gen_operation")
+OP_GE = register_opcode(">=", print_operation, "gen_operation")
+OP_LE = register_opcode("<=", print_operation, "gen_operation")
+OP_FDEF = register_opcode("fdef", print_func_def, "gen_func_def", True)
+OP_IF = register_opcode("if", print_if, "gen_if_stmnt", True)
+OP_ELSE_IF = register_opcode("else-if", print_else_if, "gen_else_if_stmnt", True)
+OP_ELSE = register_opcode("else", print_else, "gen_else_stmnt", True)
+OP_WHILE = register_opcode("while", print_while, "gen_while_stmnt", True)
+# The loop variable is the result of a for loop's TAC, since the loop sets it
+OP_FOR_RANGE = register_opcode("for-range", print_for_range, "gen_for_range_stmnt", True)
+OP_FOR_IN = register_opcode("for-in", print_for_in, "gen_for_in_stmnt", True)
+OP_END_LABEL = register_opcode("end-label", print_end_label, "gen_end_label")
+OP_PRINT = register_opcode("print", print_print, "gen_print_statement")
+OP_RETURN = register_opcode("return", print_return, "gen_ret_stmnt")
+OP_BREAK = register_opcode("break", print_break, "gen_break_stmnt")
+OP_CONTINUE = register_opcode("continue", print_continue, "gen_continue_stmnt")
+OP_FCALL = register_opcode("fcall", print_func_call, "gen_func_call")
+OP_INDEX = register_opcode("index", print_index, "gen_seq_index")
+OP_SLICE = register_opcode("slice", print_slice, "gen_seq_slice")
+OP_MCALL = register_opcode("mcall", print_method_call, "gen_seq_method_call")
+# Starts a new list for the for loop right after it to append to
+OP_LIST_COMP = register_opcode("list-comp", print_list_comp, "gen_list_comp")
+# += on a variable whose type is only known at runtime, which extends a list
+# in place and adds to anything else
+OP_IADD = register_opcode("+=", print_in_place_add, "gen_in_place_add")
+
+# Operators whose TAC is an arithmetic, comparison or boolean expression
+EXPR_OPCODES = frozenset(range(OP_AND, OP_LE + 1))
+
 class TAC(object):
     """
     An object that represents a single TAC instruction.
     """
+    __slots__ = ('result', 'operator', 'opcode', 'left_operand', 'right_operand')
+
     def __init__(self, result, operator=None, left_operand=None, right_operand=None):
         self.result = result
         self.operator = operator
+        self.opcode = OPCODES.get(operator)
         self.left_operand = left_operand
         self.right_operand = right_operand
-    
+
     def print_indented(self, string):
         print("    {}".format(string))
 
     def __str__(self):
-        if self.operator is None:
-            return "{} <- {}".format(self.result, self.left_operand)
-        elif self.operator in ["and", "or", "==", "!=", "+", "-", "*", "/", "%", "**", "//", ">", "<", ">=", "<="]:
-            if self.right_operand is not None:
-                return "{} <- {} {} {}".format(self.result, self.left_operand, self.operator, self.right_operand)
-            else:
-                return "{} <- {} {}".format(self.result, self.operator, self.left_operand)
-        elif self.operator == "fdef":
-            return "func-def {} {}".format(self.left_operand, self.right_operand)
-        elif self.operator == "if":
-            return "if {}".format(self.left_operand)
-        elif self.operator == "else-if":
-            return "else-if {}".format(self.left_operand)
-        elif self.operator == "else":
-            return "else"
-        elif self.operator == "while":
-            return "while {}".format(self.left_operand)
-        elif self.operator == "end-label":
-            return "end"
-        elif self.operator == "print":
-            return "print {}".format(self.left_operand or "")
-        elif self.operator == "return":
-            return "return {}".format(self.left_operand or "")
-        elif self.operator == "fcall":
-            return "{} <- func-call {} {}".format(self.result, self.left_operand, self.right_operand)
-        elif self.operator == "index":
-            return "{} <- index {} {}".format(self.result, self.left_operand, self.right_operand)
-        elif self.operator == "slice":
-            start = self.right_operand[0]
-            end = self.right_operand[1]
-            step = self.right_operand[2]
-            return "{} <- slice {} [{}:{}:{}]".format(self.result, self.left_operand, start or "", end or "", step or "")
-        elif self.operator == "mcall":
-            return "{} <- method-call {} {}".format(self.result, self.left_operand, self.right_operand)
-        else:
-            return "{} <- {} {} {}".format(self.result, self.operator, self.left_operand, self.right_operand)
\ No newline at end of file
+        if self.opcode is None:
+            return print_generic(self)
+        return PRINTERS[self.opcode](self)
+
+def operand_key(value):
+    """
+    Hashable key for an operand. Element types are part of the key so that
+    e.g. [True] and [1] (which compare and hash equal) stay distinct, and
+    floats are keyed by their text so that -0.0 and 0.0 do too.
+    """
+    if type(value) is list or type(value) is tuple:
+        return (type(value), tuple(operand_key(elem) for elem in value))
+    elif type(value) is float:
+        return (float, repr(value))
+    return (type(value), value)
+
+def opcode_column(tacs):
+    """
+    The opcodes of a list of TACs or a CompactTAC, in order
+    """
+    if isinstance(tacs, CompactTAC):
+        return tacs.opcodes
+    return [tac.opcode for tac in tacs]
+
+def operand_column(tacs, field):
+    """
+    One operand field ("result", "left_operand" or "right_operand") of
+    every TAC of a list of TACs or a CompactTAC, in order. A CompactTAC's is
+    read from its column, without making a TAC for each instruction.
+    """
+    if isinstance(tacs, CompactTAC):
+        return tacs.operand_column(field)
+    return [getattr(tac, field) for tac in tacs]
+
+class CompactTAC(object):
+    """
+    A compact, array-backed list of TAC instructions.
+
+    Each instruction is stored as one opcode and three indices into an
+    interned operand table, held in parallel arrays, instead of as a TAC
+    object. Registers are not put in the table but stored inline as
+    negative numbers. Iterating or indexing yields TAC objects, so it can be
+    used wherever a list of TACs is expected, but code that goes over many
+    instructions should read opcode_column and operand_column instead.
+    """
+    __slots__ = ('opcodes', 'results', 'left_operands', 'right_operands', 'operands', 'operand_ids', 'registers')
+
+    def __init__(self, tacs=None):
+        self.opcodes = array('B')
+        self.results = array('i')
+        self.left_operands = array('i')
+        self.right_operands = array('i')
+        # Index 0 is always None. Operands are interned per type, since
+        # values like True and 1 compare and hash equal.
+        self.operands = [None]
+        self.operand_ids = {type(None): {None: 0}}
+        # The Reg for each register number read so far, so that they are only
+        # made once
+        self.registers = []
+        if tacs is not None:
+            self.extend(tacs)
+
+    @classmethod
+    def from_tacs(cls, tacs):
+        return cls(tacs)
+
+    def to_tacs(self):
+        return list(self)
+
+    def intern(self, value):
+        """
+        Return the operand table index of value, adding it if needed
+        """
+        t = type(value)
+        if t is Reg:
+            return -1 - value.number
+        key = operand_key(value) if t is list or t is tuple or t is float else value
+        ids = self.operand_ids.get(t)
+        if ids is None:
+            ids = self.operand_ids[t] = {}
+        index = ids.get(key)
+        if index is None:
+            index = len(self.operands)
+            self.operands.append(value)
+            ids[key] = index
+        return index
+
+    def add(self, result, operator=None, left_operand=None, right_operand=None):
+        opcode = OPCODES.get(operator)
+        if opcode is None:
+            raise Exception("Unrecognized operator found: " + str(operator))
+        self.opcodes.append(opcode)
+        self.results.append(self.intern(result))
+        self.left_operands.append(self.intern(left_operand))
+        self.right_operands.append(self.intern(right_operand))
+
+    def append(self, tac):
+        self.add(tac.result, tac.operator, tac.left_operand, tac.right_operand)
+
+    def extend(self, tacs):
+        for tac in tacs:
+            self.append(tac)
+
+    def opcode(self, i):
+        return self.opcodes[i]
+
+    def __len__(self):
+        return len(self.opcodes)
+
+    def operand(self, index):
+        if index < 0:
+            return self.register(-1 - index)
+        return self.operands[index]
+
+    def register(self, number):
+        registers = self.registers
+        if number < len(registers):
+            return registers[number]
+        while len(registers) <= number:
+            registers.append(Reg("_t%d" % len(registers)))
+        return registers[number]
+
+    def operand_column(self, field):
+        """
+        The operands of one field ("result", "left_operand" or
+        "right_operand") of every instruction, in order
+        """
+        column = getattr(self, field + "s")
+        operands = self.operands
+        register = self.register
+        return [operands[index] if index >= 0 else register(-1 - index) for index in column]
+
+    def __getitem__(self, i):
+        operand = self.operand
+        return TAC(operand(self.results[i]), OPERATORS[self.opcodes[i]],
+                   operand(self.left_operands[i]), operand(self.right_operands[i]))
+
+    def __iter__(self):
+        operand = self.operand
+        for opcode, result, left, right in zip(self.opcodes, self.results, self.left_operands, self.right_operands):
+            yield TAC(operand(result), OPERATORS[opcode], operand(left), operand(right))